@@ -21,7 +21,6 @@ Example:
 """
 
 import os
-import json
 import logging
 import asyncio
 from typing import Dict, List, Optional, Any
@@ -34,7 +33,7 @@ from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
-    retry_if_exception_type,
+    retry_if_exception,
     before_sleep_log
 )
 
@@ -53,6 +52,20 @@ class ReportValidationError(Exception):
     pass
 
 
+def _format_points(points: Any) -> str:
+    """Format story points without a trailing '.0'."""
+    return f"{points:g}" if isinstance(points, (int, float)) else str(points)
+
+
+def _is_transient_api_error(exc: BaseException) -> bool:
+    """Return True for API errors worth retrying (rate limits, 5xx, network)."""
+    if isinstance(exc, (anthropic.RateLimitError, anthropic.APIConnectionError)):
+        return True
+    if isinstance(exc, anthropic.APIStatusError):
+        return exc.status_code >= 500
+    return False
+
+
 # Required sections in a complete Sprint report
 REQUIRED_REPORT_SECTIONS = [
     "Sprint Overview",
@@ -135,12 +148,6 @@ class ClaudeReportGenerator:
             f"model={model}, max_tokens={max_tokens}, temp={temperature}"
         )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type(anthropic.RateLimitError),
-        before_sleep=before_sleep_log(logger, logging.WARNING)
-    )
     async def generate_sprint_report(
         self,
         sprint_guide: str,
@@ -225,18 +232,7 @@ class ClaudeReportGenerator:
             # Call Claude API
             start_time = datetime.now()
 
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                system=system_prompt,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": user_prompt
-                    }
-                ]
-            )
+            response = await self._create_message(system_prompt, user_prompt)
 
             elapsed = (datetime.now() - start_time).total_seconds()
             logger.info(f"API call completed in {elapsed:.2f} seconds")
@@ -248,7 +244,9 @@ class ClaudeReportGenerator:
             if hasattr(response, 'usage'):
                 logger.info(
                     f"Token usage - Input: {response.usage.input_tokens}, "
-                    f"Output: {response.usage.output_tokens}"
+                    f"Output: {response.usage.output_tokens}, "
+                    f"Cache read: {getattr(response.usage, 'cache_read_input_tokens', 0) or 0}, "
+                    f"Cache write: {getattr(response.usage, 'cache_creation_input_tokens', 0) or 0}"
                 )
 
             # Validate report if requested
@@ -279,6 +277,49 @@ class ClaudeReportGenerator:
             logger.error(f"Unexpected error generating report: {e}", exc_info=True)
             raise ClaudeAPIError(f"Report generation failed: {e}") from e
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=30),
+        retry=retry_if_exception(_is_transient_api_error),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def _create_message(self, system_prompt: str, user_prompt: str) -> Any:
+        """
+        Send one Messages API request, retrying transient failures.
+
+        Retries live here rather than on generate_sprint_report() because that
+        method wraps every anthropic.APIError in ClaudeAPIError, which would
+        hide rate limits and 5xx responses from the retry predicate.
+
+        Args:
+            system_prompt: System prompt built from the Sprint guide
+            user_prompt: User prompt with Sprint data
+
+        Returns:
+            Anthropic Message response
+        """
+        return await self.client.messages.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            # The system prompt (instructions + guide) is identical across
+            # sprints, so mark it for Anthropic's prompt cache
+            system=[
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"}
+                }
+            ],
+            messages=[
+                {
+                    "role": "user",
+                    "content": user_prompt
+                }
+            ]
+        )
+
     def validate_report(self, report_content: str) -> Dict[str, Any]:
         """
         Validate generated Sprint report for completeness.
@@ -538,13 +579,91 @@ Please generate the complete Sprint Report following the Sprint Report Guide str
         if not jira_data:
             return "No JIRA data available."
 
-        # Format as JSON for clarity
-        try:
-            formatted = json.dumps(jira_data, indent=2, default=str)
-            return f"```json\n{formatted}\n```"
-        except Exception as e:
-            logger.warning(f"Error formatting JIRA data as JSON: {e}")
-            return str(jira_data)
+        # Compact Markdown with only the fields the report uses; raw issue
+        # JSON (avatars, links, rendered fields) costs tokens for nothing
+        sections = []
+        for name, value in jira_data.items():
+            title = str(name).replace('_', ' ').title()
+
+            if isinstance(value, list):
+                lines = [f"## {title} ({len(value)})"]
+                lines.extend(
+                    self._format_issue_line(item) if isinstance(item, dict) else f"- {item}"
+                    for item in value
+                )
+                if not value:
+                    lines.append("- None")
+            elif isinstance(value, dict):
+                lines = [f"## {title}"]
+                lines.extend(f"- {key}: {val}" for key, val in value.items())
+            else:
+                lines = [f"## {title}", f"- {value}"]
+
+            sections.append("\n".join(lines))
+
+        return "\n\n".join(sections)
+
+    @staticmethod
+    def _project_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reduce an issue to the fields used in reports.
+
+        Accepts both raw JIRA REST issues (values under 'fields') and flat
+        dictionaries such as {"key": ..., "summary": ...}.
+
+        Args:
+            issue: Issue dictionary
+
+        Returns:
+            Dict with key, summary, status, type, assignee, priority,
+            story_points and resolved (missing values are None)
+        """
+        fields = issue.get('fields') or issue
+
+        def name_of(value: Any, attr: str = 'name') -> Any:
+            return value.get(attr) if isinstance(value, dict) else value
+
+        # First field that is set; 0 points is a value, not a missing one
+        story_points = next(
+            (fields.get(name) for name in ('story_points', 'customfield_10016', 'customfield_10026')
+             if fields.get(name) is not None),
+            None
+        )
+
+        return {
+            'key': issue.get('key'),
+            'summary': fields.get('summary'),
+            'status': name_of(fields.get('status')),
+            'type': name_of(fields.get('issuetype') or fields.get('issue_type')),
+            'assignee': name_of(fields.get('assignee'), 'displayName'),
+            'priority': name_of(fields.get('priority')),
+            'story_points': story_points,
+            'resolved': (fields.get('resolutiondate') or '')[:10] or None
+        }
+
+    def _format_issue_line(self, issue: Dict[str, Any]) -> str:
+        """
+        Format one issue as a Markdown bullet.
+
+        Args:
+            issue: Issue dictionary (raw or flat)
+
+        Returns:
+            Line like "- **BOPS-1**: Summary (Done; Story; Jane Doe; 3 pts)"
+        """
+        projected = self._project_issue(issue)
+        details = [
+            projected['status'],
+            projected['type'],
+            projected['assignee'],
+            projected['priority'] and f"{projected['priority']} priority",
+            projected['story_points'] is not None and f"{_format_points(projected['story_points'])} pts",
+            projected['resolved'] and f"resolved {projected['resolved']}"
+        ]
+        details = "; ".join(str(detail) for detail in details if detail)
+
+        line = f"- **{projected['key'] or 'N/A'}**: {projected['summary'] or 'No summary'}"
+        return f"{line} ({details})" if details else line
 
     async def generate_multiple_reports(
         self,
@@ -34,6 +34,8 @@ from datetime import datetime
 import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from utils.http_retry import mount_retries
+
 
 # Configure module logger
 logger = logging.getLogger(__name__)
@@ -98,6 +100,9 @@ class FathomClient:
             'Content-Type': 'application/json'
         })
 
+        # Retry rate limits, 5xx and dropped connections with backoff
+        mount_retries(self.session)
+
         logger.info(f"Initialized Fathom client for {self.base_url}")
 
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], List[Any]]:
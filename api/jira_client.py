@@ -24,10 +24,15 @@ Example usage:
 """
 
 import logging
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import requests
 from requests.auth import HTTPBasicAuth
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.http_retry import mount_retries
+from utils import jira_cache
 
 
 # Configure module logger
@@ -100,6 +105,9 @@ class JiraClient:
             'Content-Type': 'application/json'
         })
 
+        # Retry rate limits, 5xx and dropped connections with backoff
+        mount_retries(self.session)
+
         logger.info(f"Initialized JIRA client for {self.base_url}")
 
     def _get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -202,16 +210,23 @@ class JiraClient:
 
         return sprint_data
 
-    def get_sprint_issues(self, sprint_id: str, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    def get_sprint_issues(
+        self,
+        sprint_id: str,
+        fields: Optional[List[str]] = None,
+        max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
         """
         Fetch all issues in a sprint with pagination support.
 
-        JIRA returns a maximum of 50 issues per request. This method automatically
-        handles pagination to retrieve all issues.
+        JIRA returns a maximum of 50 issues per request. This method reads the
+        total from the first page, then fetches the remaining pages concurrently
+        (at most max_workers in flight) and returns issues in sprint order.
 
         Args:
             sprint_id: Sprint ID (numeric string)
             fields: Optional list of field names to retrieve. Defaults to common fields.
+            max_workers: Maximum concurrent page requests (default: 8)
 
         Returns:
             List of issue dictionaries, each containing:
@@ -248,35 +263,99 @@ class JiraClient:
             ]
 
         endpoint = f"/rest/agile/1.0/sprint/{sprint_id}/issue"
-        all_issues = []
-        start_at = 0
         max_results = 50
+        field_list = ','.join(fields)
 
-        logger.info(f"Fetching issues for sprint {sprint_id}")
-
-        while True:
+        def fetch_page(start_at: int) -> Dict[str, Any]:
             params = {
                 'startAt': start_at,
                 'maxResults': max_results,
-                'fields': ','.join(fields)
+                'fields': field_list
             }
+            return self._get(endpoint, params=params)
 
-            response = self._get(endpoint, params=params)
-            issues = response.get('issues', [])
-            all_issues.extend(issues)
-
-            total = response.get('total', 0)
-            logger.debug(f"Retrieved {len(all_issues)}/{total} issues")
+        logger.info(f"Fetching issues for sprint {sprint_id}")
 
-            # Check if we've retrieved all issues
-            if len(all_issues) >= total:
-                break
+        # First page tells us the total and the page size JIRA actually used
+        first = fetch_page(0)
+        all_issues = first.get('issues', [])
+        total = first.get('total', 0)
+        page_size = first.get('maxResults') or max_results
 
-            start_at += max_results
+        starts = list(range(len(all_issues), total, page_size)) if all_issues else []
+        if starts:
+            logger.debug(f"Fetching {len(starts)} more pages ({total} issues)")
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(starts))) as executor:
+                for page in executor.map(fetch_page, starts):
+                    all_issues.extend(page.get('issues', []))
 
         logger.info(f"Retrieved {len(all_issues)} total issues for sprint {sprint_id}")
         return all_issues
 
+    def get_sprint_issues_cached(
+        self,
+        sprint_id: str,
+        board_id: Optional[int] = None,
+        ttl_seconds: int = jira_cache.DEFAULT_TTL_SECONDS,
+        cache_dir: Optional[Path] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch sprint issues, reusing the on-disk copy while it is current.
+
+        A cached listing younger than ttl_seconds is confirmed with one probe
+        request (issue count and newest update in the sprint) instead of
+        re-downloading every page; any change triggers a full fetch. A cache
+        miss goes straight to the full fetch, whose issues provide the
+        fingerprint, so no probe is sent.
+
+        Args:
+            sprint_id: Sprint ID (numeric string)
+            board_id: Board ID, if known (part of the cache key)
+            ttl_seconds: Maximum age of a cached listing in seconds
+            cache_dir: Cache directory (default: jira_cache.CACHE_DIR)
+
+        Returns:
+            List of issue dictionaries, as from get_sprint_issues()
+
+        Raises:
+            ValueError: Invalid sprint_id
+            JiraNotFoundError: Sprint does not exist
+            JiraAPIError: API request failed
+        """
+        if not sprint_id or not str(sprint_id).isdigit():
+            raise ValueError("sprint_id must be a numeric string")
+
+        key = jira_cache.make_key(self.base_url, sprint_id, board_id)
+        entry = jira_cache.get_cached(key, ttl_seconds=ttl_seconds, cache_dir=cache_dir)
+        if entry is not None and entry['fingerprint'] == self._sprint_fingerprint(sprint_id):
+            logger.info(f"Using cached issues for sprint {sprint_id} ({len(entry['issues'])} issues)")
+            return entry['issues']
+
+        issues = self.get_sprint_issues(sprint_id)
+        fingerprint = [len(issues), jira_cache.latest_update(issues)]
+        jira_cache.put_cached(key, issues, fingerprint, cache_dir=cache_dir)
+        return issues
+
+    def _sprint_fingerprint(self, sprint_id: str) -> List[Any]:
+        """
+        Get [issue count, newest 'updated'] for a sprint in one request.
+
+        Uses the same agile sprint issue endpoint as get_sprint_issues(), so
+        the count matches the length of a full fetch.
+
+        Args:
+            sprint_id: Sprint ID (numeric string)
+
+        Returns:
+            Two-item list identifying the current state of the sprint's issues
+        """
+        response = self._get(f"/rest/agile/1.0/sprint/{sprint_id}/issue", params={
+            'jql': 'ORDER BY updated DESC',
+            'maxResults': 1,
+            'fields': 'updated'
+        })
+        return [response.get('total', 0), jira_cache.latest_update(response.get('issues', []))]
+
     def get_active_sprint(self, board_id: int) -> Optional[Dict[str, Any]]:
         """
         Get the currently active sprint for a board.
@@ -5,21 +5,95 @@ Provides step-by-step interactive prompts with progress tracking and
 human-in-the-loop confirmation at each stage.
 """
 from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
+from rich.prompt import Prompt, IntPrompt, Confirm
 from rich.panel import Panel
-from rich.progress import Progress, TextColumn, BarColumn
-from rich import box
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 from datetime import datetime
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 import sys
+import time
 
 from cli.jira_mcp import JiraMCPClient, Sprint, Issue
 from utils.exceptions import JiraMCPError
 from cli.transcript_filter import filter_transcripts_smart, parse_selection, FilteredTranscript
 from utils.config import Config
+from utils import fathom_cache
 
-console = Console()
+# highlight=False: skip the regex ReprHighlighter on every print. Wrapping
+# stays on (soft_wrap would crop Panels and Tables); only the raw report
+# print below opts into soft_wrap
+console = Console(highlight=False, force_terminal=sys.stdout.isatty() or None)
+
+# Worker pool for blocking network calls (Docker stdio, HTTPS) so the
+# progress bar keeps rendering while they run
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Transcript table pagination (large sprints can have hundreds of meetings)
+PAGE_SIZE = 25
+
+# Characters per console.print() when showing the full report
+REPORT_PRINT_CHUNK = 8192
+
+_CONFIDENCE_LABELS = {
+    'HIGH': "[green]HIGH[/green]",
+    'MEDIUM': "[yellow]MEDIUM[/yellow]",
+    'LOW': "[dim]LOW[/dim]",
+}
+
+
+def wait_with_progress(future: Future, description: str) -> Any:
+    """Wait for a future while ticking a progress bar.
+
+    The bar advances steadily and holds at 95% until the future resolves,
+    then jumps to 100%.
+
+    Args:
+        future: In-flight call to wait for
+        description: Progress bar label
+
+    Returns:
+        The future's result
+
+    Raises:
+        Exception: Whatever the underlying call raised
+    """
+    from rich.progress import Progress, TextColumn, BarColumn, TimeElapsedColumn
+
+    with Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TimeElapsedColumn(),
+        console=console
+    ) as progress:
+        task = progress.add_task(description, total=100)
+
+        while not future.done():
+            if progress.tasks[0].completed < 95:
+                progress.advance(task, 1)
+            time.sleep(0.1)
+
+        progress.update(task, completed=100)
+
+    return future.result()
+
+
+def run_with_progress(fn: Callable, *args, description: str, **kwargs) -> Any:
+    """Run a blocking call on a worker thread with a progress bar.
+
+    Args:
+        fn: Callable to run
+        *args: Positional arguments for fn
+        description: Progress bar label
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        fn's return value
+
+    Raises:
+        Exception: Whatever fn raised
+    """
+    return wait_with_progress(_EXECUTOR.submit(fn, *args, **kwargs), description)
 
 
 def validate_config_interactive(config: Config) -> bool:
@@ -31,6 +105,8 @@ def validate_config_interactive(config: Config) -> bool:
     Returns:
         True if validation passes, exits on failure
     """
+    from rich.progress import Progress, TextColumn
+
     console.print(Panel("[bold]Sprint Report Generator[/bold]", border_style="green"))
 
     with Progress(
@@ -79,28 +155,30 @@ def select_sprint_interactive(jira_client: JiraMCPClient, board_id: int) -> Spri
     """
     console.print("[bold cyan]Step 1: Select Sprint[/bold cyan]")
 
-    with Progress(
-
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Fetching sprints from JIRA...", total=None)
-
+    # Let a background container warm-up finish under its own progress bar;
+    # if it failed, list_sprints() below retries the start and reports it
+    if jira_client.warmup_future is not None:
         try:
-            sprints = jira_client.list_sprints(board_id, limit=15)
-            progress.update(task, completed=True)
-        except JiraMCPError as e:
-            progress.stop()
-            console.print(Panel(
-                f"[red]JIRA MCP Error:[/red] {e}\n\n"
-                "[yellow]Troubleshooting:[/yellow]\n"
-                "1. Ensure Docker Desktop is running\n"
-                "2. Check JIRA credentials in .env\n"
-                "3. Run: docker pull ghcr.io/sooperset/mcp-atlassian:latest",
-                title="Connection Error",
-                border_style="red"
-            ))
-            sys.exit(1)
+            wait_with_progress(jira_client.warmup_future, "Starting JIRA MCP container...")
+        except Exception:
+            pass
+
+    try:
+        sprints = run_with_progress(
+            jira_client.list_sprints, board_id, 15,
+            description="Fetching sprints from JIRA..."
+        )
+    except JiraMCPError as e:
+        console.print(Panel(
+            f"[red]JIRA MCP Error:[/red] {e}\n\n"
+            "[yellow]Troubleshooting:[/yellow]\n"
+            "1. Ensure Docker Desktop is running\n"
+            "2. Check JIRA credentials in .env\n"
+            "3. Run: docker pull ghcr.io/sooperset/mcp-atlassian:latest",
+            title="Connection Error",
+            border_style="red"
+        ))
+        sys.exit(1)
 
     if not sprints:
         console.print(Panel(
@@ -118,6 +196,9 @@ def select_sprint_interactive(jira_client: JiraMCPClient, board_id: int) -> Spri
         sys.exit(1)
 
     # Display sprints table
+    from rich.table import Table
+    from rich import box
+
     table = Table(title="Available Sprints", box=box.ROUNDED)
     table.add_column("#", style="cyan", width=4)
     table.add_column("Sprint Name", style="white")
@@ -137,31 +218,23 @@ def select_sprint_interactive(jira_client: JiraMCPClient, board_id: int) -> Spri
         # Format dates
         dates = "Not scheduled"
         if sprint.start_date and sprint.end_date:
-            start = sprint.start_date[:10] if 'T' in sprint.start_date else sprint.start_date
-            end = sprint.end_date[:10] if 'T' in sprint.end_date else sprint.end_date
-            dates = f"{start}  to  {end}"
+            dates = f"{sprint.start_date}  to  {sprint.end_date}"
 
         table.add_row(str(idx), sprint.name, state_display, dates)
 
     console.print(table)
 
-    # Get user selection
-    while True:
-        selection = Prompt.ask(
-            "\n[bold]Select sprint number[/bold]",
-            default="1"
-        )
+    # Get user selection (IntPrompt re-asks on anything outside choices)
+    idx = IntPrompt.ask(
+        "\n[bold]Select sprint number[/bold]",
+        choices=[str(i) for i in range(1, len(sprints) + 1)],
+        default=1,
+        show_choices=False
+    )
 
-        try:
-            idx = int(selection)
-            if 1 <= idx <= len(sprints):
-                selected = sprints[idx - 1]
-                console.print(f"\n[green]OK Selected: {selected.name}[/green]")
-                return selected
-            else:
-                console.print(f"[red]Invalid selection. Enter a number between 1 and {len(sprints)}[/red]")
-        except ValueError:
-            console.print("[red]Invalid input. Enter a number.[/red]")
+    selected = sprints[idx - 1]
+    console.print(f"\n[green]OK Selected: {selected.name}[/green]")
+    return selected
 
 
 def confirm_sprint_dates_interactive(sprint: Sprint) -> Dict[str, str]:
@@ -183,9 +256,9 @@ def confirm_sprint_dates_interactive(sprint: Sprint) -> Dict[str, str]:
 
         return {'start_date': start_date, 'end_date': end_date}
 
-    # Format dates for display
-    start = sprint.start_date[:10] if 'T' in sprint.start_date else sprint.start_date
-    end = sprint.end_date[:10] if 'T' in sprint.end_date else sprint.end_date
+    # Dates are already normalized to YYYY-MM-DD by JiraMCPClient
+    start = sprint.start_date
+    end = sprint.end_date
 
     console.print(f"Sprint dates: [bold]{start}[/bold]  to  [bold]{end}[/bold]")
 
@@ -197,10 +270,95 @@ def confirm_sprint_dates_interactive(sprint: Sprint) -> Dict[str, str]:
         return {'start_date': start_date, 'end_date': end_date}
 
 
+def _render_transcript_page(
+    all_transcripts: List[tuple],
+    page: int,
+    page_size: int = PAGE_SIZE
+) -> None:
+    """Render one page of the ranked transcript table.
+
+    Row numbers are absolute positions in all_transcripts, so selections
+    stay stable across pages.
+
+    Args:
+        all_transcripts: (FilteredTranscript, confidence) pairs in display order
+        page: Zero-based page number
+        page_size: Rows per page
+    """
+    start = page * page_size
+    rows = all_transcripts[start:start + page_size]
+    page_count = max(len(all_transcripts) - 1, 0) // page_size + 1
+
+    title = "Fathom Transcripts (Select Relevant)"
+    if page_count > 1:
+        title += f" - page {page + 1}/{page_count}"
+
+    from rich.table import Table
+    from rich import box
+
+    table = Table(title=title, box=box.ROUNDED)
+    table.add_column("#", style="cyan", width=4)
+    table.add_column("Title", style="white", no_wrap=False)
+    table.add_column("Date", style="green")
+    table.add_column("Match", style="yellow")
+
+    for idx, (t, confidence) in enumerate(rows, start + 1):
+        marker = "[OK]" if confidence == 'HIGH' else "[ ]"
+        table.add_row(
+            f"{marker} {idx}",
+            t.title,
+            t.date_display,
+            _CONFIDENCE_LABELS[confidence]
+        )
+
+    console.print(table)
+
+    remaining = len(all_transcripts) - (start + len(rows))
+    if remaining > 0:
+        console.print(f"[dim]\\[... {remaining} more, type 'more' to page ...][/dim]")
+
+
+def fetch_meetings(
+    fathom_client,
+    dates: Dict[str, str],
+    search_terms: List[str],
+    use_cache: bool = True
+) -> List[Dict[str, Any]]:
+    """Fetch Fathom meetings for a date range, going through the disk cache.
+
+    Args:
+        fathom_client: Fathom API client
+        dates: Dictionary with 'start_date' and 'end_date'
+        search_terms: Transcript search terms (part of the cache key)
+        use_cache: If False, skip the cache lookup (result is still stored)
+
+    Returns:
+        List of meeting dictionaries, reduced to fathom_cache.CACHED_FIELDS
+        on a cache miss too, so hits and misses look the same
+    """
+    key = fathom_cache.make_key(dates['start_date'], dates['end_date'], search_terms)
+
+    if use_cache:
+        cached = fathom_cache.get_cached(key)
+        if cached is not None:
+            return cached
+
+    meetings = fathom_cache.project_meetings(fathom_client.list_meetings(
+        start_date=dates['start_date'],
+        end_date=dates['end_date'],
+        recorded_by=None,
+        include_transcript=False
+    ))
+    fathom_cache.put_cached(key, meetings)
+    return meetings
+
+
 def select_transcripts_interactive(
     fathom_client,
     dates: Dict[str, str],
-    config: Config
+    config: Config,
+    meetings_future: Optional[Future] = None,
+    use_cache: bool = True
 ) -> List[FilteredTranscript]:
     """Interactive transcript selection with smart filtering.
 
@@ -208,33 +366,30 @@ def select_transcripts_interactive(
         fathom_client: Fathom API client
         dates: Dictionary with 'start_date' and 'end_date'
         config: Configuration object
+        meetings_future: Optional in-flight list_meetings() call started
+            earlier by the caller (overlaps the Fathom fetch with JIRA work)
+        use_cache: If False, bypass the on-disk meetings cache
 
     Returns:
         List of selected FilteredTranscript objects
     """
     console.print("\n[bold cyan]Step 3: Select Fathom Transcripts[/bold cyan]")
 
-    with Progress(
-
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Fetching Fathom meetings...", total=None)
-
-        try:
-            # Fetch meetings in date range
-            meetings = fathom_client.list_meetings(
-                start_date=dates['start_date'],
-                end_date=dates['end_date'],
-                recorded_by=None,
-                include_transcript=False
+    try:
+        # Fetch meetings in date range (or collect the prefetched result)
+        if meetings_future is None:
+            meetings_future = _EXECUTOR.submit(
+                fetch_meetings,
+                fathom_client,
+                dates,
+                config.fathom.search_terms,
+                use_cache
             )
-            progress.update(task, completed=True)
-        except Exception as e:
-            progress.stop()
-            console.print(f"[red]Fathom API Error: {e}[/red]")
-            console.print("[yellow]Proceeding without transcripts...[/yellow]")
-            return []
+        meetings = wait_with_progress(meetings_future, "Fetching Fathom meetings...")
+    except Exception as e:
+        console.print(f"[red]Fathom API Error: {e}[/red]")
+        console.print("[yellow]Proceeding without transcripts...[/yellow]")
+        return []
 
     if not meetings:
         console.print("[yellow]No Fathom meetings found in sprint date range[/yellow]")
@@ -245,54 +400,15 @@ def select_transcripts_interactive(
     # Filter and rank transcripts
     filtered = filter_transcripts_smart(meetings, config.fathom.search_terms)
 
-    total_count = (
-        len(filtered['high_confidence']) +
-        len(filtered['medium_confidence']) +
-        len(filtered['other'])
-    )
-
-    console.print(f"Found {total_count} meetings in date range")
-
-    # Display ranked transcripts
-    table = Table(title="Fathom Transcripts (Select Relevant)", box=box.ROUNDED)
-    table.add_column("#", style="cyan", width=4)
-    table.add_column("Title", style="white", no_wrap=False)
-    table.add_column("Date", style="green")
-    table.add_column("Match", style="yellow")
-
-    idx = 1
-
-    # High confidence (pre-selected)
-    for t in filtered['high_confidence']:
-        table.add_row(
-            f"[OK] {idx}",
-            t.title,
-            t.date[:10] if len(t.date) > 10 else t.date,
-            "[green]HIGH[/green]"
-        )
-        idx += 1
-
-    # Medium confidence
-    for t in filtered['medium_confidence']:
-        table.add_row(
-            f"[ ] {idx}",
-            t.title,
-            t.date[:10] if len(t.date) > 10 else t.date,
-            "[yellow]MEDIUM[/yellow]"
-        )
-        idx += 1
+    console.print(f"Found {len(filtered['_flat'])} meetings in date range")
 
-    # Others
-    for t in filtered['other']:
-        table.add_row(
-            f"[ ] {idx}",
-            t.title,
-            t.date[:10] if len(t.date) > 10 else t.date,
-            "[dim]LOW[/dim]"
-        )
-        idx += 1
+    # Already flat in selection order, so row numbers match parse_selection()
+    all_transcripts = [(t, t.confidence) for t in filtered['_flat']]
+    last_page = max(len(all_transcripts) - 1, 0) // PAGE_SIZE
 
-    console.print(table)
+    # Display first page of ranked transcripts
+    page = 0
+    _render_transcript_page(all_transcripts, page)
 
     # Get user selection
     console.print("\n[dim]Enter selections:[/dim]")
@@ -300,11 +416,39 @@ def select_transcripts_interactive(
     console.print("  [dim]• All high confidence: 'all high' or 'high'[/dim]")
     console.print("  [dim]• All transcripts: 'all'[/dim]")
     console.print("  [dim]• Skip transcripts: 'none'[/dim]")
+    if last_page > 0:
+        console.print("  [dim]• Next page: 'more', or jump with 'page N'[/dim]")
 
-    selection = Prompt.ask(
-        "\n[bold]Select transcripts[/bold]",
-        default="all high"
-    )
+    while True:
+        selection = Prompt.ask(
+            "\n[bold]Select transcripts[/bold]",
+            default="all high"
+        )
+        command = selection.lower().strip()
+
+        if command == 'more':
+            if page < last_page:
+                page += 1
+                _render_transcript_page(all_transcripts, page)
+            else:
+                console.print("[yellow]No more transcripts[/yellow]")
+            continue
+
+        if command.startswith('page'):
+            try:
+                requested = int(command[4:].strip()) - 1
+            except ValueError:
+                console.print("[red]Invalid page. Use 'page N'.[/red]")
+                continue
+
+            if 0 <= requested <= last_page:
+                page = requested
+                _render_transcript_page(all_transcripts, page)
+            else:
+                console.print(f"[red]Invalid page. Enter a page between 1 and {last_page + 1}[/red]")
+            continue
+
+        break
 
     selected = parse_selection(selection, filtered)
 
@@ -323,14 +467,17 @@ def review_report_interactive(report_markdown: str) -> str:
     """
     console.print("\n[bold cyan]Step 4: Review Report[/bold cyan]")
 
-    # Show preview
+    # Show preview (slice bounds Rich's layout work; Panel caps the height)
     preview_length = 1000
-    if len(report_markdown) > preview_length:
-        preview = report_markdown[:preview_length] + "\n\n[... truncated ...]"
-    else:
-        preview = report_markdown
+    truncated = len(report_markdown) > preview_length
 
-    console.print(Panel(preview, title="Report Preview", border_style="blue"))
+    console.print(Panel(
+        report_markdown[:preview_length],
+        title="Report Preview",
+        subtitle="[dim]... truncated ...[/dim]" if truncated else None,
+        height=22,
+        border_style="blue"
+    ))
 
     console.print(f"\nReport length: {len(report_markdown)} characters")
 
@@ -338,7 +485,7 @@ def review_report_interactive(report_markdown: str) -> str:
     console.print("\n[bold]Review options:[/bold]")
     console.print("  1. Accept report as-is")
     console.print("  2. View full report")
-    console.print("  3. Edit report (opens in notepad)")
+    console.print("  3. Edit report (opens in $EDITOR)")
 
     choice = Prompt.ask("Select option", choices=["1", "2", "3"], default="1")
 
@@ -347,9 +494,20 @@ def review_report_interactive(report_markdown: str) -> str:
         return report_markdown
 
     elif choice == "2":
-        console.print("\n" + "="*80)
-        console.print(report_markdown)
-        console.print("="*80 + "\n")
+        # Page the full report instead of dumping it into the scrollback.
+        # Printed in chunks, soft-wrapped by the terminal rather than measured
+        # by Rich, and without markup so brackets in the report aren't parsed
+        # as Rich tags.
+        try:
+            with console.pager(styles=True):
+                for i in range(0, len(report_markdown), REPORT_PRINT_CHUNK):
+                    console.print(
+                        report_markdown[i:i + REPORT_PRINT_CHUNK],
+                        end='', markup=False, highlight=False, soft_wrap=True
+                    )
+                console.print()
+        except KeyboardInterrupt:
+            console.print()
 
         if Confirm.ask("Accept this report?", default=True):
             return report_markdown
@@ -360,21 +518,40 @@ def review_report_interactive(report_markdown: str) -> str:
     elif choice == "3":
         import tempfile
         import subprocess
+        import shlex
+        import os
 
         # Save to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
-            f.write(report_markdown)
-            temp_path = f.name
+        with tempfile.NamedTemporaryFile(suffix='.md', delete=False) as f:
+            temp_path = Path(f.name)
+        temp_path.write_text(report_markdown, encoding='utf-8')
+        before = temp_path.stat()
+
+        # Respect $VISUAL / $EDITOR, falling back to the platform default
+        editor = (
+            os.environ.get('VISUAL')
+            or os.environ.get('EDITOR')
+            or ('notepad' if os.name == 'nt' else 'vi')
+        )
+
+        console.print(f"[yellow]Opening report in {editor}...[/yellow]")
+        console.print(f"[dim]Edit the file, save, and close the editor to continue[/dim]")
 
-        console.print(f"[yellow]Opening report in notepad...[/yellow]")
-        console.print(f"[dim]Edit the file, save, and close notepad to continue[/dim]")
+        try:
+            subprocess.run(shlex.split(editor, posix=os.name != 'nt') + [str(temp_path)], check=False)
+        except FileNotFoundError:
+            console.print(f"[red]Editor not found: {editor}[/red] (set $EDITOR)")
+            console.print(f"[dim]Report saved at {temp_path}[/dim]")
+            return report_markdown
 
-        # Open in notepad (Windows)
-        subprocess.run(['notepad', temp_path], check=True)
+        # Unchanged size and mtime means the editor was closed without saving
+        after = temp_path.stat()
+        if (after.st_size, after.st_mtime_ns) == (before.st_size, before.st_mtime_ns):
+            console.print("[yellow]No changes made[/yellow]")
+            return report_markdown
 
         # Read edited content
-        with open(temp_path, 'r') as f:
-            edited_content = f.read()
+        edited_content = temp_path.read_text(encoding='utf-8')
 
         if edited_content != report_markdown:
             console.print("[green]OK Report updated with your edits[/green]")
@@ -8,62 +8,101 @@ Uses a persistent Docker container for the entire session to eliminate
 startup overhead (60% performance improvement).
 """
 import json
+import hashlib
 import subprocess
 import logging
 import os
 import atexit
-import random
+import getpass
+import itertools
+import re
+import secrets
 import threading
 import sys
-import io
-from queue import Queue, Empty
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-
+import time
+from collections import OrderedDict
+from pathlib import Path
+from concurrent.futures import (
+    Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError,
+    as_completed, wait as wait_futures
+)
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import asdict, dataclass
+
+from utils import jira_cache
 from utils.data_validation import validate_story_points
-from utils.mcp_validation import validate_mcp_response, validate_sprint_data, validate_issue_data
+from utils.mcp_validation import (
+    validate_mcp_response, validate_sprint_data, parse_issue_data, parse_issue_list
+)
 from utils.exceptions import JiraMCPError
 
+# Lifetime of the shared container used with reuse_container=True; it
+# stops itself (and --rm removes it) after this many seconds. A client whose
+# MCP server dies with it recreates the container and retries the call
+SHARED_CONTAINER_LIFETIME_SECONDS = 1800
 
-logger = logging.getLogger(__name__)
+# Marker written by JiraMCPClient.prepare() describing the pre-created
+# (stopped) container that later sessions start instead of `docker run`
+PREWARM_MARKER = Path.home() / '.cache' / 'sprint-report' / 'mcp_prewarmed.json'
 
+# Last successful check_connection() per JIRA account, reused for
+# CONNECTION_CACHE_TTL_SECONDS across CLI runs
+CONNECTION_CACHE = Path.home() / '.cache' / 'sprint-report' / 'mcp_connection.json'
+CONNECTION_CACHE_TTL_SECONDS = 300
 
-def _read_with_timeout(stream, timeout: float = 30.0) -> Optional[str]:
-    """Read line from stream with timeout.
+# On-disk sprint issue listings (Issue fields, not REST issue dicts, so kept
+# apart from api.jira_client's entries)
+ISSUE_CACHE_DIR = jira_cache.CACHE_DIR / 'mcp'
 
-    Args:
-        stream: File-like object to read from (stdout/stderr)
-        timeout: Timeout in seconds
+# JIRA field holding an issue's sprints (Jira Cloud default)
+SPRINT_FIELD = 'customfield_10020'
 
-    Returns:
-        Line read, or None if timeout
+# Sprint ids inside legacy "com.atlassian.greenhopper...Sprint@x[id=123,...]" strings
+_LEGACY_SPRINT_ID = re.compile(r'\bid=(\d+)')
 
-    Raises:
-        TimeoutError: If read times out
-    """
-    result_queue = Queue()
+# `-e NAME` without a value makes docker copy NAME from its own environment,
+# so credentials never appear in the docker CLI's argv (/proc/<pid>/cmdline)
+_DOCKER_ENV_ARGS = (
+    '-e', 'JIRA_URL',
+    '-e', 'JIRA_USERNAME',
+    '-e', 'JIRA_API_TOKEN',
+    '-e', 'LANG=C.UTF-8',
+    '-e', 'LC_ALL=C.UTF-8',
+)
 
-    def reader_thread():
-        try:
-            line = stream.readline()
-            result_queue.put(('success', line))
-        except Exception as e:
-            result_queue.put(('error', e))
+# Bytes requested per read from the container's stdout
+_READ_CHUNK_SIZE = 65536
 
-    thread = threading.Thread(target=reader_thread, daemon=True)
-    thread.start()
+# Requested stdout pipe capacity on Linux (F_SETPIPE_SZ), so large search
+# responses are written without the server blocking on a 64KB default pipe
+_PIPE_SIZE = 1 << 20
+_F_SETPIPE_SZ = 1031
 
-    try:
-        status, data = result_queue.get(timeout=timeout)
-        if status == 'error':
-            raise data
-        return data
-    except Empty:
-        # Timeout occurred
-        raise TimeoutError(f"Container did not respond within {timeout} seconds")
+# orjson is optional: C-speed JSON-RPC encode/decode on the stdio hot path
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    _json_loads = json.loads
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+def _date_only(value: Optional[str]) -> Optional[str]:
+    """Trim an ISO timestamp to YYYY-MM-DD (empty values pass through)."""
+    return value[:10] if value else value
+
+
+# Slotted models drop the per-instance __dict__ (dataclass slots= is 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Sprint:
     """Sprint data model."""
     id: int
@@ -74,7 +113,7 @@ class Sprint:
     board_id: int
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Issue:
     """JIRA issue data model."""
     key: str
@@ -98,26 +137,123 @@ class JiraMCPClient:
         # Container automatically cleaned up
     """
 
-    def __init__(self, jira_url: str, jira_username: str, jira_api_token: str):
+    # Seconds to wait for a batch of tool call responses
+    _TOOL_CALL_TIMEOUT_SECONDS = 60.0
+
+    # Read-only tools whose results are reused within a session, with TTLs in
+    # seconds by volatility (sprint lists change rarely, issue data often)
+    _CACHE_TTL_SECONDS = {
+        'jira_get_sprints_from_board': 300.0,
+        'jira_get_sprint_issues': 60.0,
+        'jira_search': 60.0,
+    }
+
+    # get_sprint_by_id() goes through jira_search but only reads sprint
+    # metadata, which is nearly static, so it overrides the tool's TTL
+    _SPRINT_LOOKUP_TTL_SECONDS = 600.0
+    _CACHE_MAX_ENTRIES = 64
+
+    # Handshake messages are identical for every container start; the
+    # notification is serialized once at import
+    _INIT_REQUEST = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {
+                "name": "sprint-report-cli",
+                "version": "1.0.0"
+            }
+        }
+    }
+    _INITIALIZED_FRAME = _json_dumps({
+        "jsonrpc": "2.0",
+        "method": "notifications/initialized"
+    }) + b"\n"
+
+    # Per-process result of the Docker daemon pre-flight (None = not checked)
+    _docker_ok: Optional[bool] = None
+
+    # Minimal jira_search used to verify connectivity
+    _CONNECTION_CHECK_ARGUMENTS = {
+        'jql': 'project != null',
+        'max_results': 1
+    }
+
+    def __init__(
+        self,
+        jira_url: str,
+        jira_username: str,
+        jira_api_token: str,
+        reuse_container: bool = False,
+        use_disk_cache: bool = True
+    ):
         """Initialize JIRA MCP client.
 
         Args:
             jira_url: JIRA instance URL (e.g., https://company.atlassian.net)
             jira_username: JIRA username/email
             jira_api_token: JIRA API token
+            reuse_container: If True, run the MCP server via `docker exec` in
+                a per-user container that outlives this process (started on
+                first use, stops itself after SHARED_CONTAINER_LIFETIME_SECONDS),
+                so later CLI runs skip `docker run`
+            use_disk_cache: If False, always re-run connection checks instead
+                of trusting a recent success recorded on disk
         """
         self.jira_url = jira_url
         self.jira_username = jira_username
         self.jira_api_token = jira_api_token
         self.docker_image = "ghcr.io/sooperset/mcp-atlassian:latest"
+        self.reuse_container = reuse_container
+        self.use_disk_cache = use_disk_cache
+
+        # Environment for docker commands that start the MCP server; the
+        # values are picked up by the bare `-e NAME` flags in _DOCKER_ENV_ARGS
+        self._docker_env = {
+            **os.environ,
+            'JIRA_URL': jira_url or '',
+            'JIRA_USERNAME': jira_username or '',
+            'JIRA_API_TOKEN': jira_api_token or '',
+        }
+
+        # False when the container outlives this client (shared or pre-warmed)
+        self._owns_container = not reuse_container
 
-        # Persistent container management
-        self.container_name = f"mcp-jira-{os.getpid()}"
+        # Persistent container management (name is regenerated per start
+        # unless the container is shared)
+        if reuse_container:
+            self.container_name = self._shared_container_name()
+        else:
+            self.container_name = self._new_container_name()
         self._container_process = None
         self._container_stdin = None
         self._container_stdout = None
         self._initialized = False
 
+        # Set by the reader thread when the current server's stdout hits EOF
+        self._stdout_eof = False
+
+        # Background container start (see start_warmup)
+        self.warmup_future: Optional[Future] = None
+        self._start_lock = threading.Lock()
+
+        # In-flight requests (JSON-RPC id -> Future), resolved by the reader thread
+        self._pending: Dict[int, Future] = {}
+        self._pending_lock = threading.Lock()
+
+        # Serializes frames from concurrent callers on the shared stdin pipe
+        self._write_lock = threading.Lock()
+
+        # TTL LRU of read-only tool results: (tool, args) -> (timestamp, result)
+        self._rpc_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+        # Monotonic JSON-RPC ids (1 is reserved for initialize)
+        self._next_id = itertools.count(2).__next__
+
         # Container health tracking
         self._container_healthy = True
         self._consecutive_failures = 0
@@ -126,45 +262,428 @@ class JiraMCPClient:
         # Register cleanup on exit
         atexit.register(self.close)
 
+    @staticmethod
+    def _new_container_name() -> str:
+        """Build a container name unique to this process and start."""
+        return f"mcp-jira-{os.getpid()}-{secrets.token_hex(3)}"
+
+    @staticmethod
+    def _user_slug() -> str:
+        """Current user name, restricted to characters valid in container names."""
+        try:
+            user = getpass.getuser()
+        except Exception:
+            user = 'user'
+        return re.sub(r'[^a-zA-Z0-9_.-]', '-', user)
+
+    @classmethod
+    def _shared_container_name(cls) -> str:
+        """Build the per-user name of the shared container."""
+        return f"mcp-jira-shared-{cls._user_slug()}"
+
+    @staticmethod
+    def _container_running(name: str) -> Optional[bool]:
+        """Check a container's state.
+
+        Args:
+            name: Container name
+
+        Returns:
+            True if running, False if it exists but is stopped, None if absent
+        """
+        result = subprocess.run(
+            ['docker', 'inspect', '-f', '{{.State.Running}}', name],
+            capture_output=True,
+            text=True
+        )
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() == 'true'
+
+    def _ensure_shared_container(self):
+        """Start the shared idle container unless it is already running.
+
+        The container only runs `sleep`; each client starts its own MCP
+        server inside it with `docker exec`.
+
+        Raises:
+            JiraMCPError: If the container cannot be started
+        """
+        state = self._container_running(self.container_name)
+        if state:
+            return
+
+        if state is False:
+            # Stopped but not yet removed
+            subprocess.run(['docker', 'rm', '-f', self.container_name], capture_output=True)
+
+        result = subprocess.run(
+            [
+                'docker', 'run', '-d', '--rm', '--name', self.container_name,
+                '--entrypoint', 'sleep',
+                self.docker_image, str(SHARED_CONTAINER_LIFETIME_SECONDS)
+            ],
+            capture_output=True,
+            text=True
+        )
+
+        # Another CLI process may have started it first
+        if result.returncode != 0 and not self._container_running(self.container_name):
+            raise JiraMCPError(f"Could not start shared MCP container: {result.stderr.strip()}")
+
+        logger.info(f"Shared MCP container {self.container_name} ready")
+
+    def _settings_fingerprint(self) -> str:
+        """Digest of image + credentials baked into a pre-warmed container."""
+        raw = f"{self.docker_image}|{self.jira_url}|{self.jira_username}|{self.jira_api_token}"
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+    def prepare(self) -> str:
+        """Pull the MCP image and create a stopped, ready-to-start container.
+
+        Run once at install time (`python cli/main.py --prepare`). Later
+        sessions `docker start -ai` this container instead of paying the
+        full `docker run` cold start. Credentials are baked in at create
+        time, so the container is ignored if they change.
+
+        Returns:
+            Name of the created container
+
+        Raises:
+            JiraMCPError: If settings are invalid or Docker commands fail
+        """
+        self._check_settings()
+        self._check_docker_daemon()
+
+        name = f"mcp-jira-prewarmed-{self._user_slug()}"
+
+        pull = subprocess.run(['docker', 'pull', self.docker_image], capture_output=True, text=True)
+        if pull.returncode != 0:
+            raise JiraMCPError(f"docker pull failed: {pull.stderr.strip()}")
+
+        subprocess.run(['docker', 'rm', '-f', name], capture_output=True)
+        create = subprocess.run(
+            ['docker', 'create', '-i', '--name', name, *_DOCKER_ENV_ARGS, self.docker_image],
+            capture_output=True,
+            text=True,
+            env=self._docker_env
+        )
+        if create.returncode != 0:
+            raise JiraMCPError(f"docker create failed: {create.stderr.strip()}")
+
+        PREWARM_MARKER.parent.mkdir(parents=True, exist_ok=True)
+        PREWARM_MARKER.write_text(
+            json.dumps({'container': name, 'fingerprint': self._settings_fingerprint()}),
+            encoding='utf-8'
+        )
+        logger.info(f"Pre-warmed MCP container {name} created")
+        return name
+
+    def _prewarmed_container(self) -> Optional[str]:
+        """Return the pre-warmed container name if it can be started now.
+
+        Returns:
+            Container name, or None if absent, stale, or already in use
+        """
+        try:
+            marker = json.loads(PREWARM_MARKER.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+        if marker.get('fingerprint') != self._settings_fingerprint():
+            return None
+
+        # Running means another session is attached to it
+        name = marker.get('container')
+        if not name or self._container_running(name) is not False:
+            return None
+        return name
+
+    def start_warmup(self) -> Future:
+        """Start the container and MCP handshake on a background thread.
+
+        The first MCP call waits for the warm-up to finish, so a warm-up
+        failure surfaces there rather than here. The thread is a daemon
+        (executor workers are joined at interpreter exit), so an early
+        sys.exit() never waits on a container start.
+
+        Returns:
+            Future resolved once the container is ready
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        def warm_up():
+            try:
+                self._ensure_container_running()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(None)
+
+        self.warmup_future = future
+        threading.Thread(target=warm_up, daemon=True).start()
+        return future
+
     def _ensure_container_running(self):
         """Ensure Docker container is running (start if needed)."""
-        if self._container_process and self._container_process.poll() is None:
-            return  # Already running
+        # Serialized so a background warm-up and the first MCP call
+        # never start two containers
+        with self._start_lock:
+            if (self._container_process and self._container_process.poll() is None
+                    and self._initialized):
+                return  # Already running
 
-        # Clean up any existing container with same name
-        cleanup_cmd = ['docker', 'rm', '-f', self.container_name]
-        subprocess.run(cleanup_cmd, capture_output=True, text=True)
-
-        # Start persistent container
-        docker_cmd = [
-            'docker', 'run', '-i', '--name', self.container_name,
-            '-e', f'JIRA_URL={self.jira_url}',
-            '-e', f'JIRA_USERNAME={self.jira_username}',
-            '-e', f'JIRA_API_TOKEN={self.jira_api_token}',
-            '-e', 'LANG=C.UTF-8',
-            '-e', 'LC_ALL=C.UTF-8',
-            self.docker_image
-        ]
+            self._start_container()
+
+    @classmethod
+    def _check_docker_daemon(cls):
+        """Verify the Docker daemon answers (checked once per process).
+
+        Raises:
+            JiraMCPError: If Docker is not installed or the daemon is down
+        """
+        if cls._docker_ok:
+            return
+
+        try:
+            result = subprocess.run(
+                ['docker', 'version', '--format', '{{.Server.Version}}'],
+                capture_output=True,
+                text=True,
+                timeout=2
+            )
+        except FileNotFoundError:
+            raise JiraMCPError("Docker not found: install Docker Desktop")
+        except subprocess.TimeoutExpired:
+            raise JiraMCPError("Docker daemon unreachable: start Docker Desktop")
+
+        if result.returncode != 0:
+            raise JiraMCPError("Docker daemon unreachable: start Docker Desktop")
+
+        cls._docker_ok = True
 
-        # Use default buffering with explicit flush after every write
-        # This is the most reliable approach across platforms
+    def _check_settings(self):
+        """Validate JIRA settings before starting the container.
+
+        Raises:
+            JiraMCPError: With every problem found, in one message
+        """
+        errors = []
+        if not self.jira_url or not self.jira_url.startswith('https://'):
+            errors.append(f"JIRA_URL must start with https:// (got {self.jira_url!r})")
+        if not self.jira_username:
+            errors.append("JIRA_USERNAME is empty")
+        if not self.jira_api_token:
+            errors.append("JIRA_API_TOKEN is empty")
+
+        if errors:
+            raise JiraMCPError("Invalid JIRA configuration: " + "; ".join(errors))
+
+    def _start_container(self):
+        """Start a fresh container and send the MCP handshake."""
+        # Fail fast with an actionable error instead of a stdio timeout
+        self._check_settings()
+        self._check_docker_daemon()
+
+        prewarmed = None if self.reuse_container else self._prewarmed_container()
+
+        if self.reuse_container:
+            # MCP server in the shared container (credentials stay per exec)
+            self._ensure_shared_container()
+            docker_cmd = [
+                'docker', 'exec', '-i', *_DOCKER_ENV_ARGS, self.container_name, 'mcp-atlassian'
+            ]
+        elif prewarmed:
+            # Container created by prepare(): start + attach, no cold start
+            self.container_name = prewarmed
+            self._owns_container = False
+            docker_cmd = ['docker', 'start', '-ai', prewarmed]
+        else:
+            # Unique name per start: no stale container can hold it, so no
+            # pre-start `docker rm -f` round trip (--rm cleans up on exit)
+            self.container_name = self._new_container_name()
+            self._owns_container = True
+
+            # Start persistent container
+            docker_cmd = [
+                'docker', 'run', '-i', '--rm', '--name', self.container_name,
+                *_DOCKER_ENV_ARGS,
+                self.docker_image
+            ]
+
+        # Binary pipes (JSON-RPC frames are encoded/decoded as UTF-8 bytes)
+        # with default buffering and an explicit flush after every write
+        # An unread stderr pipe fills up and blocks the server mid-response,
+        # so stderr is discarded unless debug logging will drain it
+        log_stderr = logger.isEnabledFor(logging.DEBUG)
+        self._initialized = False
         self._container_process = subprocess.Popen(
             docker_cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            encoding='utf-8',
-            errors='replace'
+            stderr=subprocess.PIPE if log_stderr else subprocess.DEVNULL,
+            env=self._docker_env
             # bufsize=-1 (default) = use system default buffering
         )
         self._container_stdin = self._container_process.stdin
         self._container_stdout = self._container_process.stdout
+        self._grow_pipe(self._container_stdout)
+
+        # Background reader: stdout responses are routed to pending futures
+        self._pending = {}
+        self._stdout_eof = False
+        threading.Thread(
+            target=self._reader_loop,
+            args=(self._container_stdout, self._pending),
+            daemon=True
+        ).start()
+        if log_stderr:
+            threading.Thread(
+                target=self._drain_stderr,
+                args=(self._container_process.stderr,),
+                daemon=True
+            ).start()
+
+        # Send initialization handshake once per container process
+        self._send_initialization()
+        self._initialized = True
+
+    def _reader_loop(self, stdout, pending: Dict[int, Future]):
+        """Read container stdout and resolve the matching pending futures.
+
+        Runs on a daemon thread for the lifetime of one container process.
+        Reads whatever is available in large chunks and splits frames on
+        newlines, rather than one readline() per frame.
 
-        # Send initialization handshake once
-        if not self._initialized:
-            self._send_initialization()
-            self._initialized = True
+        Args:
+            stdout: Container stdout stream
+            pending: In-flight request map for this container process
+        """
+        buffer = bytearray()
+        while True:
+            try:
+                chunk = stdout.read1(_READ_CHUNK_SIZE)
+            except (OSError, ValueError):
+                break  # Stream closed underneath us (close() on Windows)
+            if not chunk:
+                break
+
+            buffer += chunk
+            start = 0
+            newline = buffer.find(b"\n")
+            while newline >= 0:
+                self._dispatch_line(bytes(buffer[start:newline]), pending)
+                start = newline + 1
+                newline = buffer.find(b"\n", start)
+            del buffer[:start]
+
+        # EOF - container exited, fail anything still waiting on it
+        if pending is self._pending:
+            self._stdout_eof = True
+        self._fail_pending(
+            pending,
+            JiraMCPError("No response from MCP container (container may have crashed)")
+        )
+
+    def _dispatch_line(self, line: bytes, pending: Dict[int, Future]):
+        """Resolve the pending future matching one stdout line.
+
+        Args:
+            line: One newline-delimited frame from the container
+            pending: In-flight request map for this container process
+        """
+        # JSON-RPC frames are objects; skip log lines without raising
+        if not line.lstrip().startswith(b'{'):
+            logger.debug(f"Ignoring non-JSON MCP output: {line.strip()[:100]!r}")
+            return
+
+        try:
+            message = _json_loads(line)
+        except ValueError:
+            logger.debug(f"Ignoring non-JSON MCP output: {line.strip()[:100]!r}")
+            return
+
+        response_id = message.get('id') if isinstance(message, dict) else None
+        with self._pending_lock:
+            future = pending.pop(response_id, None)
+
+        if future is None:
+            # Notifications or unsolicited responses (e.g. automatic tools/list)
+            logger.debug(f"Unsolicited MCP message: {line.strip()[:100]!r}")
+            return
+
+        future.set_result(message)
+
+    @staticmethod
+    def _grow_pipe(stream):
+        """Enlarge a pipe's kernel buffer to _PIPE_SIZE (Linux only, best effort).
+
+        Args:
+            stream: Pipe file object
+        """
+        if not sys.platform.startswith('linux'):
+            return
+        try:
+            import fcntl
+            fcntl.fcntl(stream.fileno(), _F_SETPIPE_SZ, _PIPE_SIZE)
+        except (ImportError, OSError) as e:
+            # EPERM above /proc/sys/fs/pipe-max-size for unprivileged users
+            logger.debug(f"Could not resize MCP stdout pipe: {e}")
+
+    @staticmethod
+    def _drain_stderr(stderr):
+        """Log container stderr at debug level, keeping the pipe from filling.
+
+        Args:
+            stderr: Container stderr stream
+        """
+        try:
+            for line in iter(stderr.readline, b''):
+                logger.debug(f"MCP stderr: {line.decode('utf-8', 'replace').rstrip()}")
+        except (OSError, ValueError):
+            pass  # Stream closed
+
+    def _fail_pending(self, pending: Dict[int, Future], error: Exception):
+        """Fail every in-flight request in pending with error."""
+        with self._pending_lock:
+            futures = list(pending.values())
+            pending.clear()
+
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def _send_requests(self, requests: List[Dict[str, Any]]) -> List[Future]:
+        """Register futures for requests and write them in a single flush.
+
+        Args:
+            requests: JSON-RPC request dictionaries (each with a unique id)
+
+        Returns:
+            One future per request, resolved with the raw JSON-RPC response
+        """
+        futures = [Future() for _ in requests]
+        with self._pending_lock:
+            for request, future in zip(requests, futures):
+                self._pending[request['id']] = future
+
+        try:
+            frames = b"".join(_json_dumps(request) + b"\n" for request in requests)
+            with self._write_lock:
+                self._container_stdin.write(frames)
+                self._container_stdin.flush()
+        except Exception:
+            self._forget_requests(requests)
+            raise
+
+        return futures
+
+    def _forget_requests(self, requests: List[Dict[str, Any]]):
+        """Drop pending futures for requests that will not be awaited."""
+        with self._pending_lock:
+            for request in requests:
+                self._pending.pop(request['id'], None)
 
     def _check_container_health(self) -> bool:
         """Check if container is responsive.
@@ -180,118 +699,121 @@ class JiraMCPClient:
         try:
             ping_request = {
                 "jsonrpc": "2.0",
-                "id": 99999,
+                "id": self._next_id(),
                 "method": "tools/list",
                 "params": {}
             }
 
-            self._container_stdin.write(json.dumps(ping_request) + "\n")
-            self._container_stdin.flush()
-
-            # Try to read response with short timeout
-            response_line = _read_with_timeout(self._container_stdout, timeout=5.0)
+            future, = self._send_requests([ping_request])
 
-            if response_line:
-                logger.debug("Container health check passed")
-                return True
+            # Wait for response with short timeout
+            try:
+                future.result(timeout=5.0)
+            except FutureTimeoutError:
+                self._forget_requests([ping_request])
+                logger.warning("Container health check timeout")
+                return False
 
-            logger.warning("Container health check failed - no response")
-            return False
+            logger.debug("Container health check passed")
+            return True
 
-        except TimeoutError:
-            logger.warning("Container health check timeout")
-            return False
         except Exception as e:
             logger.warning(f"Container health check error: {e}")
             return False
 
+    def _container_lost(self) -> bool:
+        """Check whether the current MCP server process has gone away.
+
+        Returns:
+            True if the server's stdout reached EOF or the process exited
+        """
+        if self._stdout_eof:
+            return True
+        process = self._container_process
+        return process is not None and process.poll() is not None
+
     def _send_initialization(self):
         """Send MCP initialization handshake."""
-        init_request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "sprint-report-cli",
-                    "version": "1.0.0"
-                }
-            }
-        }
+        init_request = self._INIT_REQUEST
 
         # Step 1: Send initialize request and flush
-        self._container_stdin.write(json.dumps(init_request) + "\n")
-        self._container_stdin.flush()
+        future, = self._send_requests([init_request])
 
-        # Step 2: Read initialize response FIRST (before sending notification)
+        # Step 2: Wait for initialize response FIRST (before sending notification)
         try:
-            response_line = _read_with_timeout(
-                self._container_stdout,
-                timeout=30.0  # 30 second timeout for initialization
-            )
-            if response_line:
-                response = json.loads(response_line)
-                if 'error' in response:
-                    raise JiraMCPError(f"Initialization error: {response['error']}")
-        except TimeoutError as e:
-            logger.error(f"MCP initialization timeout: {e}")
+            response = future.result(timeout=30.0)  # 30 second timeout for initialization
+        except FutureTimeoutError:
+            self._forget_requests([init_request])
+            logger.error("MCP initialization timeout")
             raise JiraMCPError("MCP container initialization timed out - container may be stuck")
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse initialization response: {e}")
+
+        if 'error' in response:
+            raise JiraMCPError(f"Initialization error: {response['error']}")
 
         # Step 3: NOW send initialized notification (after reading response)
-        initialized_notification = {
-            "jsonrpc": "2.0",
-            "method": "notifications/initialized"
-        }
-        self._container_stdin.write(json.dumps(initialized_notification) + "\n")
-        self._container_stdin.flush()
+        with self._write_lock:
+            self._container_stdin.write(self._INITIALIZED_FRAME)
+            self._container_stdin.flush()
 
-        # Step 4: Some MCP servers auto-send tools/list after initialization
-        # Try to consume it if it exists (with short timeout)
-        try:
-            tools_response = _read_with_timeout(self._container_stdout, timeout=2.0)
-            if tools_response:
-                logger.debug(f"Consumed automatic tools/list response: {tools_response[:100]}")
-        except TimeoutError:
-            # No automatic response, that's okay
-            logger.debug("No automatic tools/list response")
-        except Exception as e:
-            logger.warning(f"Error consuming tools/list: {e}")
+        # Some MCP servers auto-send tools/list after initialization; the
+        # reader thread discards it as unsolicited, so no need to wait here
 
     def close(self):
         """Stop persistent container and cleanup."""
-        if self._container_process:
+        self.invalidate_cache()
+
+        if not self._container_process:
+            return  # Never started (or already closed)
+
+        try:
+            # EOF on stdin makes the MCP server exit on its own almost
+            # immediately; escalate to terminate/kill only if it lingers
             try:
-                # Close wrapped streams first (Windows)
-                if self._container_stdin and sys.platform == 'win32':
-                    try:
-                        self._container_stdin.close()
-                    except Exception:
-                        pass
-                if self._container_stdout and sys.platform == 'win32':
-                    try:
-                        self._container_stdout.close()
-                    except Exception:
-                        pass
+                self._container_stdin.close()
+            except Exception:
+                pass
+            if self._container_stdout and sys.platform == 'win32':
+                try:
+                    self._container_stdout.close()
+                except Exception:
+                    pass
 
+            try:
+                self._container_process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
                 self._container_process.terminate()
-                self._container_process.wait(timeout=5)
-            except Exception:
-                # Force kill if terminate fails
-                self._container_process.kill()
-                self._container_process.wait()
-            finally:
-                self._container_stdin = None
-                self._container_stdout = None
-                self._container_process = None
-                self._initialized = False
-
-        # Clean up container
+                self._container_process.wait(timeout=1)
+        except Exception:
+            # Force kill if terminate fails
+            self._container_process.kill()
+            self._container_process.wait()
+        finally:
+            exit_code = self._container_process.returncode
+            self._container_stdin = None
+            self._container_stdout = None
+            self._container_process = None
+            self._initialized = False
+
+        # Shared and pre-warmed containers outlive this client
+        if not self._owns_container:
+            return
+
+        # docker run --rm removes the container once the CLI exits normally;
+        # only force-remove when it was killed by a signal
+        if exit_code is not None and exit_code >= 0:
+            return
+
+        # Fire-and-forget: don't hold up CLI exit (or atexit) on the daemon
         cleanup_cmd = ['docker', 'rm', '-f', self.container_name]
-        subprocess.run(cleanup_cmd, capture_output=True, text=True)
+        try:
+            subprocess.Popen(
+                cleanup_cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+        except OSError as e:
+            logger.warning(f"Could not remove container {self.container_name}: {e}")
 
     def _restart_container(self):
         """Restart MCP container after failure.
@@ -304,7 +826,6 @@ class JiraMCPClient:
         self.close()
 
         # Wait a moment for cleanup
-        import time
         time.sleep(2)
 
         # Reset state
@@ -319,20 +840,29 @@ class JiraMCPClient:
 
     def __enter__(self):
         """Context manager entry."""
-        self._ensure_container_running()
+        if self.warmup_future is None:
+            self._ensure_container_running()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
+        """Context manager exit (the process-wide shared client stays open)."""
+        if self is not _shared_client:
+            self.close()
         return False
 
-    def _call_mcp_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+    def _call_mcp_tool(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        cache_ttl: Optional[float] = None
+    ) -> Any:
         """Call an MCP tool via Docker container (using persistent container).
 
         Args:
             tool_name: Name of the MCP tool (e.g., 'jira_get_sprints')
             arguments: Dictionary of tool arguments
+            cache_ttl: Result cache TTL in seconds for this call (default:
+                the tool's entry in _CACHE_TTL_SECONDS, if any)
 
         Returns:
             Tool result data
@@ -340,72 +870,139 @@ class JiraMCPClient:
         Raises:
             JiraMCPError: If Docker fails or MCP returns an error
         """
-        # Ensure persistent container is running
-        self._ensure_container_running()
+        ttl = cache_ttl if cache_ttl is not None else self._CACHE_TTL_SECONDS.get(tool_name)
+        if ttl is None:
+            return self._call_mcp_tools_batch([(tool_name, arguments)])[0]
 
-        # Build tool request (initialization already done at container start)
-        tool_request = {
-            "jsonrpc": "2.0",
-            "id": random.randint(1, 10000),  # Unique ID for each request
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            }
-        }
+        key = (tool_name, json.dumps(arguments, sort_keys=True))
+        with self._cache_lock:
+            entry = self._rpc_cache.get(key)
+            if entry and time.monotonic() - entry[0] < ttl:
+                self._rpc_cache.move_to_end(key)
+                logger.debug(f"Using cached {tool_name} result")
+                return entry[1]
 
-        try:
-            # Send tool request to persistent container
-            self._container_stdin.write(json.dumps(tool_request) + "\n")
-            self._container_stdin.flush()
+        result = self._call_mcp_tools_batch([(tool_name, arguments)])[0]
 
-            # Read response from persistent container with timeout
-            try:
-                response_line = _read_with_timeout(
-                    self._container_stdout,
-                    timeout=60.0  # 60 second timeout for tool calls
-                )
-            except TimeoutError as e:
-                logger.error(f"MCP tool call timeout for {tool_name}: {e}")
+        with self._cache_lock:
+            self._rpc_cache[key] = (time.monotonic(), result)
+            self._rpc_cache.move_to_end(key)
+            while len(self._rpc_cache) > self._CACHE_MAX_ENTRIES:
+                self._rpc_cache.popitem(last=False)
+
+        return result
+
+    def invalidate_cache(self):
+        """Drop all cached MCP tool results."""
+        with self._cache_lock:
+            self._rpc_cache.clear()
 
-                # Track consecutive failures
+    def _call_mcp_tools_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """Call several MCP tools in one pipelined round trip.
+
+        All requests are written before any response is read, and responses
+        are matched back to requests by JSON-RPC id (the server may answer
+        out of order).
+
+        Args:
+            calls: List of (tool_name, arguments) tuples
+
+        Returns:
+            Tool results in the same order as calls
+
+        Raises:
+            JiraMCPError: If Docker fails or MCP returns an error for any call
+        """
+        tool_names = ', '.join(tool_name for tool_name, _ in calls)
+
+        # At most one restart-and-retry, so a sick container costs at most
+        # two timeouts instead of recursing
+        for attempt in range(2):
+            try:
+                results = self._try_mcp_tools_batch(calls, tool_names)
+            except Exception as e:
+                # Track failures for any exception
                 self._consecutive_failures += 1
+                if attempt:
+                    logger.error(f"Retry after restart failed: {e}")
+                    raise JiraMCPError(f"MCP container failed even after restart: {e}")
+                if not self._container_lost():
+                    if isinstance(e, JiraMCPError):
+                        raise
+                    raise JiraMCPError(f"Unexpected error calling MCP: {e}")
+
+                # Server exited mid-call (e.g. the shared container reached
+                # its lifetime): recreate it and retry once
                 self._container_healthy = False
+                logger.warning(f"MCP container exited during {tool_names}, restarting")
+            else:
+                if results is not None:
+                    return results
+
+                # Timed out: auto-restart after multiple failures
+                self._container_healthy = False
+                if attempt or self._consecutive_failures < self._max_failures_before_restart:
+                    break
+
+                logger.warning(f"Container failed {self._consecutive_failures} times, restarting")
 
-                # Auto-restart after multiple failures
-                if self._consecutive_failures >= self._max_failures_before_restart:
-                    logger.warning(f"Container failed {self._consecutive_failures} times, restarting")
-                    try:
-                        self._restart_container()
-                        # Retry the tool call once after restart
-                        logger.info(f"Retrying {tool_name} after container restart")
-                        return self._call_mcp_tool(tool_name, arguments)  # Recursive retry
-                    except Exception as retry_error:
-                        logger.error(f"Retry after restart failed: {retry_error}")
-                        raise JiraMCPError(f"MCP container failed even after restart: {retry_error}")
-
-                raise JiraMCPError(f"MCP container timeout calling {tool_name} - container may be hung")
-
-            if not response_line:
-                # Container crashed or closed
-                raise JiraMCPError("No response from MCP container (container may have crashed)")
-
-            # Parse JSON-RPC response
             try:
-                tool_response = json.loads(response_line)
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in MCP response: {response_line[:200]}")
-                raise JiraMCPError(f"Invalid JSON in MCP response: {e}")
+                self._restart_container()
+            except Exception as restart_error:
+                logger.error(f"Retry after restart failed: {restart_error}")
+                raise JiraMCPError(f"MCP container failed even after restart: {restart_error}")
+            logger.info(f"Retrying {tool_names} after container restart")
 
-            # Validate MCP response structure and extract data
-            return validate_mcp_response(tool_response)
+        raise JiraMCPError(f"MCP container timeout calling {tool_names} - container may be hung")
 
-        except Exception as e:
-            # Track failures for any exception
+    def _try_mcp_tools_batch(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]],
+        tool_names: str
+    ) -> Optional[List[Any]]:
+        """Send one pipelined batch of tool calls and wait for the results.
+
+        Args:
+            calls: List of (tool_name, arguments) tuples
+            tool_names: Comma-separated tool names for log messages
+
+        Returns:
+            Tool results in call order, or None if the batch timed out (the
+            timeout is counted as a consecutive failure)
+
+        Raises:
+            JiraMCPError: If Docker fails or MCP returns an error for any call
+        """
+        # Ensure persistent container is running
+        self._ensure_container_running()
+
+        # Build tool requests (initialization already done at container start)
+        tool_requests = [
+            {
+                "jsonrpc": "2.0",
+                "id": self._next_id(),
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name,
+                    "arguments": arguments
+                }
+            }
+            for tool_name, arguments in calls
+        ]
+
+        # Send all tool requests in a single write; the reader thread
+        # resolves each future as its response arrives
+        futures = self._send_requests(tool_requests)
+
+        _, not_done = wait_futures(futures, timeout=self._TOOL_CALL_TIMEOUT_SECONDS)
+        if not_done:
+            self._forget_requests(tool_requests)
+            logger.error(f"MCP tool call timeout for {tool_names}")
             self._consecutive_failures += 1
-            if isinstance(e, JiraMCPError):
-                raise
-            raise JiraMCPError(f"Unexpected error calling MCP: {e}")
+            return None
+
+        # Validate MCP response structure and extract data (in call order)
+        return [validate_mcp_response(future.result()) for future in futures]
 
     def list_sprints(self, board_id: int, limit: int = 10) -> List[Sprint]:
         """List recent sprints from a JIRA board.
@@ -420,30 +1017,100 @@ class JiraMCPClient:
         Raises:
             JiraMCPError: If the MCP call fails
         """
-        result = self._call_mcp_tool('jira_get_sprints_from_board', {
+        result = self._call_mcp_tool(
+            'jira_get_sprints_from_board', self._list_sprints_arguments(board_id, limit)
+        )
+        return self._parse_sprints(result, board_id)
+
+    def check_connection_and_list_sprints(self, board_id: int, limit: int = 10) -> List[Sprint]:
+        """Test the connection and list sprints in one pipelined round trip.
+
+        Equivalent to check_connection() followed by list_sprints(), but both
+        MCP requests are in flight at the same time.
+
+        Args:
+            board_id: JIRA board ID
+            limit: Maximum number of sprints to return
+
+        Returns:
+            List of Sprint objects
+
+        Raises:
+            JiraMCPError: If either MCP call fails
+        """
+        if self._connection_recently_verified():
+            return self.list_sprints(board_id, limit)
+
+        _, result = self._call_mcp_tools_batch([
+            ('jira_search', self._CONNECTION_CHECK_ARGUMENTS),
+            ('jira_get_sprints_from_board', self._list_sprints_arguments(board_id, limit)),
+        ])
+        self._record_connection_ok()
+        return self._parse_sprints(result, board_id)
+
+    def list_sprints_and_issues(
+        self,
+        board_id: int,
+        sprint_id: int,
+        limit: int = 10
+    ) -> Tuple[List[Sprint], List[Issue]]:
+        """List board sprints and fetch one sprint's issues in one round trip.
+
+        Both MCP requests are pipelined. If the batch fails (typically a
+        jira_get_sprint_issues timeout), falls back to list_sprints() plus
+        get_sprint_issues(), which retries issues via JQL.
+
+        Args:
+            board_id: JIRA board ID
+            sprint_id: Sprint whose issues to fetch
+            limit: Maximum number of sprints to return
+
+        Returns:
+            Tuple of (sprints, issues)
+
+        Raises:
+            JiraMCPError: If the fallback calls fail too
+        """
+        try:
+            sprints_result, issues_result = self._call_mcp_tools_batch([
+                ('jira_get_sprints_from_board', self._list_sprints_arguments(board_id, limit)),
+                ('jira_get_sprint_issues', {'sprint_id': str(sprint_id)}),
+            ])
+        except JiraMCPError as e:
+            logger.warning(f"Batched sprint/issue fetch failed, fetching separately: {e}")
+            return self.list_sprints(board_id, limit), self.get_sprint_issues(sprint_id)
+
+        return self._parse_sprints(sprints_result, board_id), self._parse_issues(issues_result)
+
+    @staticmethod
+    def _list_sprints_arguments(board_id: int, limit: int) -> Dict[str, Any]:
+        """Build jira_get_sprints_from_board arguments."""
+        return {
             'board_id': str(board_id),
             'limit': limit,
             'start_at': 0
-        })
+        }
 
-        # Parse and validate sprint data
-        sprints = []
-        if isinstance(result, list):
-            for sprint_data in result:
-                # Validate sprint data schema (logs warning if invalid, continues with next)
-                if not validate_sprint_data(sprint_data):
-                    continue  # Skip invalid sprint
-
-                sprints.append(Sprint(
-                    id=int(sprint_data['id']),
-                    name=sprint_data['name'],
-                    state=sprint_data['state'],
-                    start_date=sprint_data.get('start_date'),
-                    end_date=sprint_data.get('end_date'),
-                    board_id=board_id
-                ))
-
-        return sprints
+    @staticmethod
+    def _parse_sprints(result: Any, board_id: int) -> List[Sprint]:
+        """Parse and validate jira_get_sprints_from_board result."""
+        if not isinstance(result, list):
+            return []
+
+        # Invalid sprints are skipped (validate_sprint_data logs a warning);
+        # ISO timestamps are normalized to YYYY-MM-DD once, here
+        return [
+            Sprint(
+                id=int(sprint_data['id']),
+                name=sprint_data['name'],
+                state=sprint_data['state'],
+                start_date=_date_only(sprint_data.get('start_date')),
+                end_date=_date_only(sprint_data.get('end_date')),
+                board_id=board_id
+            )
+            for sprint_data in result
+            if validate_sprint_data(sprint_data)
+        ]
 
     def get_sprint_issues(self, sprint_id: int) -> List[Issue]:
         """Get all issues in a sprint.
@@ -461,39 +1128,13 @@ class JiraMCPClient:
         Raises:
             JiraMCPError: If both methods fail
         """
-        # Helper function to parse issue data (used by both methods)
-        def parse_issue(issue_data):
-            """Parse issue data into Issue object."""
-            if not validate_issue_data(issue_data):
-                return None  # Skip invalid issue
-
-            # Extract fields from flattened MCP format
-            status_obj = issue_data.get('status', {})
-            assignee_obj = issue_data.get('assignee', {})
-
-            return Issue(
-                key=issue_data.get('key', 'N/A'),
-                summary=issue_data.get('summary', ''),
-                status=status_obj.get('name', 'Unknown') if isinstance(status_obj, dict) else str(status_obj),
-                assignee=assignee_obj.get('display_name') if isinstance(assignee_obj, dict) and assignee_obj else None,
-                issue_type=issue_data.get('issue_type', {}).get('name', 'Task') if isinstance(issue_data.get('issue_type'), dict) else 'Task',
-                story_points=validate_story_points(issue_data.get('story_points'))
-            )
-
         # Try MCP tool first
         try:
             result = self._call_mcp_tool('jira_get_sprint_issues', {
                 'sprint_id': str(sprint_id)
             })
 
-            # Parse MCP response
-            issues = []
-            if isinstance(result, dict) and 'issues' in result:
-                for issue_data in result['issues']:
-                    issue = parse_issue(issue_data)
-                    if issue:
-                        issues.append(issue)
-
+            issues = self._parse_issues(result)
             logger.info(f"MCP tool succeeded: fetched {len(issues)} issues")
             return issues
 
@@ -509,14 +1150,8 @@ class JiraMCPClient:
                     'fields': 'summary,status,assignee,issuetype,customfield_10016'  # customfield_10016 is usually story points
                 })
 
-                # Parse JQL response (same structure as jira_get_sprint_issues)
-                issues = []
-                if isinstance(result, dict) and 'issues' in result:
-                    for issue_data in result['issues']:
-                        issue = parse_issue(issue_data)
-                        if issue:
-                            issues.append(issue)
-
+                # Same structure as jira_get_sprint_issues
+                issues = self._parse_issues(result)
                 logger.info(f"JQL fallback succeeded: fetched {len(issues)} issues")
                 return issues
 
@@ -524,6 +1159,249 @@ class JiraMCPClient:
                 logger.error(f"Both MCP tool and JQL fallback failed: {jql_error}")
                 raise JiraMCPError(f"Could not fetch issues for sprint {sprint_id}: {jql_error}")
 
+    def get_sprint_issues_cached(
+        self,
+        sprint_id: int,
+        board_id: Optional[int] = None,
+        ttl_seconds: int = jira_cache.DEFAULT_TTL_SECONDS,
+        cache_dir: Optional[Path] = None
+    ) -> List[Issue]:
+        """Get all issues in a sprint, reusing the on-disk copy while current.
+
+        A cached listing younger than ttl_seconds is confirmed with one small
+        jira_search probe (issue count and newest update) instead of fetching
+        the sprint again. On a cache miss the probe is pipelined with the
+        fetch, so it adds no round trip. use_disk_cache=False bypasses the
+        cache entirely.
+
+        Args:
+            sprint_id: Sprint ID
+            board_id: Board ID, if known (part of the cache key)
+            ttl_seconds: Maximum age of a cached listing in seconds
+            cache_dir: Cache directory (default: ISSUE_CACHE_DIR)
+
+        Returns:
+            List of Issue objects
+
+        Raises:
+            JiraMCPError: If the issues cannot be fetched
+        """
+        if not self.use_disk_cache:
+            return self.get_sprint_issues(sprint_id)
+
+        cache_dir = cache_dir or ISSUE_CACHE_DIR
+        key = jira_cache.make_key(self.jira_url, sprint_id, board_id)
+        entry = jira_cache.get_cached(key, ttl_seconds=ttl_seconds, cache_dir=cache_dir)
+        probe = ('jira_search', {
+            'jql': f'sprint = {sprint_id} ORDER BY updated DESC',
+            'max_results': 1,
+            'start_at': 0,
+            'fields': 'updated'
+        })
+
+        if entry is None:
+            # Probe first: a change landing between the two calls then
+            # shows up as a mismatch next run rather than going unnoticed
+            try:
+                probe_result, result = self._call_mcp_tools_batch([
+                    probe,
+                    ('jira_get_sprint_issues', {'sprint_id': str(sprint_id)})
+                ])
+            except JiraMCPError as e:
+                logger.debug(f"Cached issue fetch failed for sprint {sprint_id}: {e}")
+                return self.get_sprint_issues(sprint_id)
+            issues = self._parse_issues(result)
+            fingerprint = self._sprint_fingerprint(probe_result)
+        else:
+            try:
+                fingerprint = self._sprint_fingerprint(self._call_mcp_tool(*probe))
+            except JiraMCPError as e:
+                logger.debug(f"Issue cache probe failed for sprint {sprint_id}: {e}")
+                fingerprint = None
+
+            if fingerprint is not None and entry['fingerprint'] == fingerprint:
+                try:
+                    issues = [Issue(**issue) for issue in entry['issues']]
+                except TypeError:
+                    issues = None  # Entry written by an incompatible version
+                if issues is not None:
+                    logger.info(f"Using cached issues for sprint {sprint_id} ({len(issues)} issues)")
+                    return issues
+
+            issues = self.get_sprint_issues(sprint_id)
+
+        if fingerprint is not None:
+            jira_cache.put_cached(key, [asdict(issue) for issue in issues], fingerprint,
+                                  cache_dir=cache_dir)
+        return issues
+
+    @staticmethod
+    def _sprint_fingerprint(result: Any) -> Optional[List[Any]]:
+        """Build [issue count, newest 'updated'] from a jira_search probe.
+
+        Args:
+            result: Parsed jira_search response (max_results=1, newest first)
+
+        Returns:
+            Two-item list, or None if the response lacks a total
+        """
+        if type(result) is not dict or 'total' not in result:
+            return None
+
+        stamps = [
+            issue.get('updated')
+            for issue in result.get('issues') or []
+            if isinstance(issue, dict)
+        ]
+        return [result['total'], max(filter(None, stamps), default=None)]
+
+    def get_sprint_issues_bulk(
+        self,
+        sprint_ids: List[int],
+        max_workers: int = 5
+    ) -> Dict[int, List[Issue]]:
+        """Fetch issues for several sprints concurrently.
+
+        Each sprint goes through get_sprint_issues() (with its JQL fallback)
+        on a worker thread; requests share the persistent container and are
+        matched to responses by JSON-RPC id, so they overlap on the wire.
+
+        Args:
+            sprint_ids: Sprint IDs
+            max_workers: Maximum concurrent requests
+
+        Returns:
+            Dictionary mapping each sprint ID to its issues
+
+        Raises:
+            JiraMCPError: If any sprint's issues cannot be fetched
+        """
+        if not sprint_ids:
+            return {}
+
+        # Start the container once up front rather than racing workers to it
+        self._ensure_container_running()
+
+        issues_by_sprint: Dict[int, List[Issue]] = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(sprint_ids))) as executor:
+            futures = {
+                executor.submit(self.get_sprint_issues, sprint_id): sprint_id
+                for sprint_id in sprint_ids
+            }
+            for future in as_completed(futures):
+                issues_by_sprint[futures[future]] = future.result()
+
+        # Preserve the caller's sprint order
+        return {sprint_id: issues_by_sprint[sprint_id] for sprint_id in sprint_ids}
+
+    def get_issues_for_sprints(self, sprint_ids: List[int]) -> Dict[int, List[Issue]]:
+        """Get issues for several sprints with a single JQL search.
+
+        Replaces one get_sprint_issues() round trip per sprint with one
+        `sprint IN (...)` query; issues are bucketed client-side by their
+        sprint field. An issue carried over between requested sprints
+        appears under each of them.
+
+        Args:
+            sprint_ids: Sprint IDs
+
+        Returns:
+            Dictionary mapping each requested sprint ID to its issues
+
+        Raises:
+            JiraMCPError: If the search fails
+        """
+        buckets: Dict[int, List[Issue]] = {sprint_id: [] for sprint_id in sprint_ids}
+        if not buckets:
+            return buckets
+
+        try:
+            result = self._call_mcp_tool('jira_search', {
+                'jql': f'sprint IN ({",".join(map(str, buckets))}) ORDER BY rank ASC',
+                'max_results': 1000,
+                'start_at': 0,
+                'fields': f'summary,status,assignee,issuetype,customfield_10016,{SPRINT_FIELD}'
+            })
+        except (JiraMCPError, TimeoutError) as e:
+            raise JiraMCPError(f"Could not fetch issues for sprints {sprint_ids}: {e}")
+
+        if type(result) is not dict:
+            return buckets
+
+        raw_issues = result.get('issues') or []
+        for raw, issue in zip(raw_issues, map(self._parse_issue, raw_issues)):
+            if issue is None:
+                continue
+            for sprint_id in self._issue_sprint_ids(raw):
+                if sprint_id in buckets:
+                    buckets[sprint_id].append(issue)
+
+        logger.info(
+            f"Fetched issues for {len(buckets)} sprints in one search: "
+            f"{sum(map(len, buckets.values()))} issues"
+        )
+        return buckets
+
+    @staticmethod
+    def _issue_sprint_ids(issue_data: Dict[str, Any]) -> List[int]:
+        """Extract sprint IDs from an issue's sprint field.
+
+        Handles the field at the top level or under 'custom_fields', wrapped
+        in {'value': ...} or bare, as sprint objects or legacy strings.
+        """
+        value = issue_data.get(SPRINT_FIELD)
+        if value is None:
+            value = (issue_data.get('custom_fields') or {}).get(SPRINT_FIELD)
+        if isinstance(value, dict) and 'value' in value:
+            value = value['value']
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            value = [value]
+
+        sprint_ids = []
+        for sprint in value:
+            if isinstance(sprint, dict) and 'id' in sprint:
+                sprint_ids.append(int(sprint['id']))
+            elif isinstance(sprint, str):
+                sprint_ids.extend(int(match) for match in _LEGACY_SPRINT_ID.findall(sprint))
+        return sprint_ids
+
+    @staticmethod
+    def _parse_issue(issue_data: Dict[str, Any]) -> Optional[Issue]:
+        """Parse one issue into an Issue object (None if invalid)."""
+        data = parse_issue_data(issue_data)
+        if data is None:
+            return None
+        return Issue(data.key, data.summary, data.status, data.assignee,
+                     data.issue_type, validate_story_points(data.story_points))
+
+    @staticmethod
+    def _parse_issues(result: Any) -> List[Issue]:
+        """Parse an issues payload into Issue objects, skipping invalid ones.
+
+        The whole list is validated in one call (which also flattens
+        status/assignee/issue_type to names), then each issue is one
+        positional Issue() call.
+
+        Args:
+            result: Parsed jira_get_sprint_issues / jira_search response
+
+        Returns:
+            List of Issue objects
+        """
+        if type(result) is not dict or 'issues' not in result:
+            return []
+
+        # Locals avoid a global lookup per issue
+        make_issue = Issue
+        story_points = validate_story_points
+        return [
+            make_issue(data.key, data.summary, data.status, data.assignee,
+                       data.issue_type, story_points(data.story_points))
+            for data in parse_issue_list(result['issues'])
+        ]
+
     def get_sprint_by_id(self, sprint_id: int) -> Sprint:
         """Get sprint details by ID using JQL search fallback.
 
@@ -546,7 +1424,7 @@ class JiraMCPClient:
                 'jql': f'sprint = {sprint_id}',
                 'max_results': 1,
                 'fields': 'summary'  # Minimal fields for speed
-            })
+            }, cache_ttl=self._SPRINT_LOOKUP_TTL_SECONDS)
 
             if not result.get('issues') or len(result['issues']) == 0:
                 # Sprint has no issues - return minimal Sprint object
@@ -593,16 +1471,106 @@ class JiraMCPClient:
         Raises:
             JiraMCPError: If connection fails
         """
-        try:
-            # Try to list sprints as a connection test
-            self._call_mcp_tool('jira_search', {
-                'jql': 'project != null',
-                'max_results': 1
-            })
+        if self._connection_recently_verified():
             return True
+
+        try:
+            # Run a minimal JQL search as a connection test
+            self._call_mcp_tool('jira_search', self._CONNECTION_CHECK_ARGUMENTS)
         except Exception as e:
             raise JiraMCPError(f"Connection test failed: {e}")
 
+        self._record_connection_ok()
+        return True
+
+    def _connection_cache_key(self) -> str:
+        """Identify the JIRA account a cached connection check applies to.
+
+        Includes the API token, so a rotated or revoked token is checked
+        again; only the digest is written to disk.
+        """
+        raw = f"{self.jira_url}|{self.jira_username}|{self.jira_api_token}"
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _connection_recently_verified(self) -> bool:
+        """Check for a successful connection test within the cache TTL."""
+        if not self.use_disk_cache:
+            return False
+
+        try:
+            entry = json.loads(CONNECTION_CACHE.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return False
+
+        return (
+            entry.get('key') == self._connection_cache_key()
+            and time.time() - entry.get('checked_at', 0) < CONNECTION_CACHE_TTL_SECONDS
+        )
+
+    def _record_connection_ok(self):
+        """Record a successful connection test (failures are only logged)."""
+        try:
+            CONNECTION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            CONNECTION_CACHE.write_text(
+                json.dumps({'key': self._connection_cache_key(), 'checked_at': time.time()}),
+                encoding='utf-8'
+            )
+        except OSError as e:
+            logger.warning(f"Could not write connection cache: {e}")
+
+
+# Process-wide client returned by get_shared_client()
+_shared_client: Optional[JiraMCPClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client(jira_url: str, jira_username: str, jira_api_token: str) -> JiraMCPClient:
+    """Return a process-wide JiraMCPClient with its container already running.
+
+    For long-running processes (notebooks, daemons) that would otherwise pay
+    the Docker start and MCP initialize on every `with JiraMCPClient(...)`.
+    Leaving a `with` block does not close the shared client; it is closed
+    at interpreter exit or by close_shared_client().
+
+    Args:
+        jira_url: JIRA instance URL
+        jira_username: JIRA username/email
+        jira_api_token: JIRA API token
+
+    Returns:
+        Shared JiraMCPClient (replaced if called with different credentials)
+
+    Raises:
+        JiraMCPError: If the container fails to start
+    """
+    global _shared_client
+
+    with _shared_client_lock:
+        client = _shared_client
+        if client is not None and (
+            client.jira_url, client.jira_username, client.jira_api_token
+        ) != (jira_url, jira_username, jira_api_token):
+            _shared_client = None
+            client.close()
+            client = None
+
+        if client is None:
+            client = JiraMCPClient(jira_url, jira_username, jira_api_token)
+            client._ensure_container_running()
+            _shared_client = client
+
+        return client
+
+
+def close_shared_client():
+    """Close and forget the client returned by get_shared_client()."""
+    global _shared_client
+
+    with _shared_client_lock:
+        client, _shared_client = _shared_client, None
+    if client is not None:
+        client.close()
+
 
 if __name__ == "__main__":
     """Test JIRA MCP client."""
@@ -617,13 +1585,12 @@ if __name__ == "__main__":
         jira_api_token=os.getenv('JIRA_API_TOKEN')
     )
 
-    print("Testing JIRA MCP connection...")
+    print("Testing JIRA MCP connection and fetching recent sprints...")
     try:
-        client.check_connection()
+        sprints = client.check_connection_and_list_sprints(board_id=38, limit=5)
         print("✓ Connection successful")
 
-        print("\nFetching recent sprints...")
-        sprints = client.list_sprints(board_id=38, limit=5)
+        print("\nRecent sprints:")
         for sprint in sprints:
             print(f"  - {sprint.name} ({sprint.state})")
 
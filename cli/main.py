@@ -6,7 +6,10 @@ JIRA MCP, Fathom transcripts, and Claude AI.
 """
 import sys
 import argparse
+import importlib
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -14,37 +17,114 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from rich.console import Console
 from rich.panel import Panel
 
-from utils.config import load_config, validate_config
 from utils.encoding_utils import ensure_utf8_console
-from cli.interactive import (
-    validate_config_interactive,
-    select_sprint_interactive,
-    confirm_sprint_dates_interactive,
-    select_transcripts_interactive,
-    review_report_interactive
-)
-from cli.jira_mcp import JiraMCPClient
-from api.fathom_client import FathomClient
 
 
 console = Console()
 
-
-def main():
-    """Main CLI entry point."""
-    # Ensure UTF-8 console encoding (Windows compatibility)
-    ensure_utf8_console()
-    parser = argparse.ArgumentParser(
-        description="Generate executive-level sprint reports with human-in-the-loop workflow",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+EPILOG = """
 Examples:
   python cli/main.py              # Interactive mode (default)
   python cli/main.py --board 38   # Specify JIRA board ID
+  python cli/main.py --no-cache   # Re-fetch Fathom meetings
   python cli/main.py --help       # Show this help message
 
 For more information, see README.md
         """
+
+
+def _preload_report_modules():
+    """Import the report/PDF generators (anthropic, jinja2, markdown).
+
+    Run on a daemon thread while the user works through the prompts, so
+    steps 5-6 find the modules already in sys.modules. Import errors are
+    left for the real import at the point of use to report.
+    """
+    for module in ('services.report_generator', 'services.pdf_generator'):
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass
+
+
+def _promote_draft_pdf(draft_future, draft_path: Path, pdf_path: Path, use_draft: bool) -> bool:
+    """Move a draft PDF (and its HTML) into place, or discard it.
+
+    Args:
+        draft_future: Future of the background draft render
+        draft_path: Draft PDF path
+        pdf_path: Final PDF path
+        use_draft: False if the report was edited after the draft started
+
+    Returns:
+        True if the draft became the final PDF; False if the PDF still has
+        to be generated (report edited, or the draft render failed)
+    """
+    if not use_draft and draft_future.cancel():
+        return False  # Never started, nothing to clean up
+
+    try:
+        draft_future.result()
+    except Exception:
+        use_draft = False  # Regenerate in the foreground to report the error
+
+    drafts = [draft_path, draft_path.with_suffix('.html')]
+    try:
+        if use_draft:
+            for draft, final in zip(drafts, [pdf_path, pdf_path.with_suffix('.html')]):
+                if draft.exists():
+                    draft.replace(final)
+            return True
+
+        for draft in drafts:
+            if draft.exists():
+                draft.unlink()
+    except OSError:
+        pass
+    return False
+
+
+def _finish_pdf(
+    render_pdf,
+    draft_future,
+    draft_path: Path,
+    pdf_path: Path,
+    draft_markdown: str,
+    final_markdown: str,
+    pdf_options: dict
+) -> bool:
+    """Produce the final PDF, reusing the background draft when possible.
+
+    Args:
+        render_pdf: PDF render function (generate_pdf_from_markdown)
+        draft_future: Future of the background draft render
+        draft_path: Draft PDF path
+        pdf_path: Final PDF path
+        draft_markdown: Report content the draft was rendered from
+        final_markdown: Report content after review
+        pdf_options: Extra keyword arguments for render_pdf
+
+    Returns:
+        True if the draft was promoted, False if the PDF was re-rendered
+    """
+    unchanged = final_markdown == draft_markdown
+    if _promote_draft_pdf(draft_future, draft_path, pdf_path, unchanged):
+        return True
+
+    render_pdf(
+        markdown_content=final_markdown,
+        output_path=pdf_path,
+        **pdf_options
+    )
+    return False
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Generate executive-level sprint reports with human-in-the-loop workflow",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG
     )
 
     parser.add_argument(
@@ -72,15 +152,88 @@ For more information, see README.md
         help='JIRA sprint ID to generate report for (skips interactive selection)'
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        '--prepare',
+        action='store_true',
+        help='Pull the JIRA MCP image and create a pre-warmed container, then exit'
+    )
+
+    parser.add_argument(
+        '--reuse-container',
+        action='store_true',
+        help='Keep the JIRA MCP container running between runs (stops itself after 30 minutes)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached Fathom meetings and JIRA connection checks'
+    )
+
+    return parser
+
+
+# Built once at import; main() only parses
+_PARSER = _build_parser()
+
+
+def main():
+    """Main CLI entry point."""
+    # Ensure UTF-8 console encoding (Windows compatibility)
+    ensure_utf8_console()
+    args = _PARSER.parse_args()
+
+    # Imported after argument parsing so --help/--version don't pay for the
+    # pydantic models, MCP client and API clients
+    from utils.config import load_config
+    from cli.interactive import (
+        validate_config_interactive,
+        select_sprint_interactive,
+        confirm_sprint_dates_interactive,
+        select_transcripts_interactive,
+        fetch_meetings,
+        review_report_interactive
+    )
+    from cli.jira_mcp import JiraMCPClient
+    from api.fathom_client import FathomClient
 
     try:
         # Load configuration
         config = load_config(config_path=args.config)
 
+        # One-time setup: pre-create the MCP container for faster starts
+        if args.prepare:
+            from utils.exceptions import JiraMCPError
+
+            console.print("[dim]Pulling JIRA MCP image and creating container...[/dim]")
+            try:
+                name = JiraMCPClient(
+                    jira_url=config.jira.url,
+                    jira_username=config.jira.username,
+                    jira_api_token=config.jira.api_token
+                ).prepare()
+            except JiraMCPError as e:
+                console.print(f"[red]Prepare failed:[/red] {e}")
+                sys.exit(1)
+            console.print(f"[green]OK Pre-warmed container ready: {name}[/green]")
+            return
+
         # Validate configuration
         validate_config_interactive(config)
 
+        # Start the container + MCP handshake in the background once the
+        # credentials are validated, so it overlaps the Docker check and
+        # client setup; if Docker was not up yet the warm-up fails fast and
+        # the first JIRA call starts the container again
+        jira_client = JiraMCPClient(
+            jira_url=config.jira.url,
+            jira_username=config.jira.username,
+            jira_api_token=config.jira.api_token,
+            reuse_container=args.reuse_container,
+            use_disk_cache=not args.no_cache
+        )
+        jira_client.start_warmup()
+
         # Override board ID if specified
         board_id = args.board if args.board else config.jira.default_board_id
 
@@ -98,22 +251,30 @@ For more information, see README.md
         except Exception as e:
             console.print(f"[yellow]Docker check failed:[/yellow] {e}")
             console.print("[yellow]Continuing anyway - JIRA MCP may fail[/yellow]")
-        # Initialize clients
-        console.print("[dim]Initializing JIRA MCP client...[/dim]")
-        with JiraMCPClient(
-            jira_url=config.jira.url,
-            jira_username=config.jira.username,
-            jira_api_token=config.jira.api_token
-        ) as jira_client:
+
+        with jira_client:
+
+            # Warm the heavy report/PDF imports during the interactive steps
+            threading.Thread(target=_preload_report_modules, daemon=True).start()
 
             console.print("[dim]Initializing Fathom client...[/dim]")
             fathom_client = FathomClient(api_key=config.fathom.api_key)
 
+            # Background pool for the JIRA issue load and the Fathom fetch, so
+            # they overlap the prompts and each other (the MCP client matches
+            # concurrent responses by request id)
+            prefetch_executor = ThreadPoolExecutor(max_workers=2)
+
             # Step 1: Select Sprint
             if args.sprint:
                 # Direct sprint ID provided - skip interactive selection
                 console.print(f"\n[bold cyan]Step 1: Fetching Sprint {args.sprint}[/bold cyan]")
 
+                # Sprint ID is known up front: load issues alongside the metadata
+                issues_future = prefetch_executor.submit(
+                    jira_client.get_sprint_issues_cached, args.sprint, board_id
+                )
+
                 from rich.progress import Progress, TextColumn
                 from utils.exceptions import JiraMCPError
 
@@ -143,9 +304,24 @@ For more information, see README.md
                 # Interactive selection (existing workflow)
                 sprint = select_sprint_interactive(jira_client, board_id)
 
+                # Load issues while the user confirms dates
+                issues_future = prefetch_executor.submit(
+                    jira_client.get_sprint_issues_cached, sprint.id, board_id
+                )
+
             # Step 2: Confirm Dates
             dates = confirm_sprint_dates_interactive(sprint)
 
+            # Start the Fathom fetch now so it overlaps the JIRA issue load
+            # (both are independent network round trips)
+            meetings_future = prefetch_executor.submit(
+                fetch_meetings,
+                fathom_client,
+                dates,
+                config.fathom.search_terms,
+                not args.no_cache
+            )
+
             # Step 3: Fetch Sprint Data
             console.print("\n[bold cyan]Step 3: Fetching Sprint Data[/bold cyan]")
             from rich.progress import Progress, TextColumn
@@ -157,7 +333,7 @@ For more information, see README.md
                 task = progress.add_task("Loading sprint issues...", total=None)
 
                 try:
-                    issues = jira_client.get_sprint_issues(sprint.id)
+                    issues = issues_future.result()
                     progress.update(task, completed=True)
                     console.print(f"[green]OK Loaded {len(issues)} issues[/green]")
                 except Exception as e:
@@ -166,26 +342,72 @@ For more information, see README.md
                     sys.exit(1)
 
             # Step 4: Select Transcripts
-            transcripts = select_transcripts_interactive(fathom_client, dates, config)
+            transcripts = select_transcripts_interactive(
+                fathom_client, dates, config,
+                meetings_future=meetings_future,
+                use_cache=not args.no_cache
+            )
+            prefetch_executor.shutdown(wait=False)
 
             # Step 5: Generate Report with Claude
             console.print("\n[bold cyan]Step 5: Generating Report with Claude[/bold cyan]")
             console.print("[dim]This may take 30-60 seconds...[/dim]")
 
-            # Import here to avoid loading heavy dependencies unless needed
+            # Already imported in the background by _preload_report_modules()
             from services.report_generator import generate_sprint_report
 
-            try:
-                report_markdown = generate_sprint_report(
-                    sprint=sprint,
-                    issues=issues,
-                    transcripts=transcripts,
-                    config=config
-                )
-                console.print("[green]OK Report generated[/green]")
-            except Exception as e:
-                console.print(f"[red]Error generating report: {e}[/red]")
-                sys.exit(1)
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                console=console
+            ) as progress:
+                task = progress.add_task("Waiting for Claude...", total=None)
+                received = [0]
+
+                def on_text(text: str) -> None:
+                    received[0] += len(text)
+                    progress.update(task, description=f"Writing report... {received[0]:,} chars")
+
+                try:
+                    report_markdown = generate_sprint_report(
+                        sprint=sprint,
+                        issues=issues,
+                        transcripts=transcripts,
+                        config=config,
+                        on_text=on_text
+                    )
+                except Exception as e:
+                    progress.stop()
+                    console.print(f"[red]Error generating report: {e}[/red]")
+                    sys.exit(1)
+            console.print("[green]OK Report generated[/green]")
+
+            from services.pdf_generator import generate_pdf_from_markdown
+            from utils.filename_utils import generate_report_filename
+
+            # Generate safe filename
+            filename = generate_report_filename(sprint.name, sprint.id)
+            pdf_path = config.output.pdf_dir / filename
+            pdf_options = {
+                'template_name': config.report.template_path.name,
+                'metadata': {
+                    'sprint_name': sprint.name,
+                    'sprint_id': sprint.id,
+                    'team_name': config.report.team_name,
+                    'generated_date': dates['start_date']
+                }
+            }
+
+            # Render the unedited report to a draft PDF while the user reviews
+            # it; the draft is kept only if the report comes back unchanged
+            draft_path = pdf_path.with_suffix('.draft.pdf')
+            pdf_executor = ThreadPoolExecutor(max_workers=1)
+            draft_future = pdf_executor.submit(
+                generate_pdf_from_markdown,
+                markdown_content=report_markdown,
+                output_path=draft_path,
+                **pdf_options
+            )
+            pdf_executor.shutdown(wait=False)
 
             # Step 6: Review Report
             final_report = review_report_interactive(report_markdown)
@@ -193,25 +415,15 @@ For more information, see README.md
             # Step 7: Generate PDF
             console.print("\n[bold cyan]Step 6: Creating PDF[/bold cyan]")
 
-            from services.pdf_generator import generate_pdf_report
-            from utils.filename_utils import generate_report_filename
-
             try:
-                # Generate safe filename
-                filename = generate_report_filename(sprint.name, sprint.id)
-                pdf_path = config.output.pdf_dir / filename
-
-                # Generate PDF
-                generate_pdf_report(
-                    markdown_content=final_report,
-                    output_path=pdf_path,
-                    template_path=config.report.template_path,
-                    metadata={
-                        'sprint_name': sprint.name,
-                        'sprint_id': sprint.id,
-                        'team_name': config.report.team_name,
-                        'generated_date': dates['start_date']
-                    }
+                _finish_pdf(
+                    generate_pdf_from_markdown,
+                    draft_future,
+                    draft_path,
+                    pdf_path,
+                    report_markdown,
+                    final_report,
+                    pdf_options
                 )
 
                 console.print(f"[green]OK PDF created: {pdf_path}[/green]")
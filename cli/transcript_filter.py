@@ -4,11 +4,16 @@ Fathom Transcript Filtering - Smart search and ranking.
 Provides intelligent filtering of Fathom transcripts based on search terms,
 ranking them by confidence level (high/medium/low).
 """
+import re
+import sys
 from typing import Dict, List, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+# Slotted rows drop the per-instance __dict__ (dataclass slots= is 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class FilteredTranscript:
     """Fathom transcript with confidence ranking."""
     meeting_id: str
@@ -16,7 +21,12 @@ class FilteredTranscript:
     date: str
     confidence: str  # 'HIGH', 'MEDIUM', 'LOW'
     match_type: str  # 'title_match', 'content_match', 'none'
-    raw_data: Dict[str, Any]
+    raw_data: Dict[str, Any] = field(compare=False)  # dicts aren't hashable
+    date_display: str = field(init=False, repr=False)  # YYYY-MM-DD for tables
+
+    def __post_init__(self):
+        # Frozen: derived fields are set through object.__setattr__
+        object.__setattr__(self, 'date_display', self.date[:10])
 
 
 def filter_transcripts_smart(
@@ -34,6 +44,9 @@ def filter_transcripts_smart(
         - 'high_confidence': Transcripts with search terms in title
         - 'medium_confidence': Transcripts with terms in content
         - 'other': All other transcripts
+        - '_flat': All transcripts in display (selection number) order
+        - '_index_map': meeting id -> 1-indexed display number (None for
+          ids shared by several transcripts)
 
     Examples:
         >>> transcripts = [
@@ -51,16 +64,19 @@ def filter_transcripts_smart(
     medium_confidence = []
     other = []
 
-    # Normalize search terms to lowercase
-    search_terms_lower = [term.lower() for term in search_terms]
+    # One case-insensitive alternation scans each title once for every term
+    terms = _minimal_terms(search_terms)
+    title_pattern = re.compile(
+        '|'.join(re.escape(term) for term in terms), re.IGNORECASE
+    ) if terms else None
 
     for transcript in transcripts:
-        title = transcript.get('title', '').lower()
+        title = transcript.get('title', '')
         meeting_id = transcript.get('id', str(transcript.get('recording_id', 'unknown')))
         date = transcript.get('date', transcript.get('created_at', 'Unknown'))
 
         # High confidence: keyword in meeting title
-        if any(term in title for term in search_terms_lower):
+        if title_pattern is not None and title_pattern.search(title):
             filtered = FilteredTranscript(
                 meeting_id=meeting_id,
                 title=transcript.get('title', 'Untitled'),
@@ -87,13 +103,56 @@ def filter_transcripts_smart(
             )
             other.append(filtered)
 
+    # Precomputed once so selection parsing and index lookups don't rebuild
+    # the concatenated list on every prompt
+    flat = high_confidence + medium_confidence + other
+
+    # Keyed on the meeting id so equal transcripts built elsewhere (e.g. a
+    # re-fetch) resolve too; duplicate ids fall back to a list scan
+    index_map = {}
+    for i, t in enumerate(flat, start=1):
+        index_map[t.meeting_id] = None if t.meeting_id in index_map else i
+
     return {
         'high_confidence': high_confidence,
         'medium_confidence': medium_confidence,  # Empty for MVP
-        'other': other
+        'other': other,
+        '_flat': flat,
+        '_index_map': index_map
     }
 
 
+def _minimal_terms(search_terms: List[str]) -> List[str]:
+    """Drop duplicate terms and terms that contain a shorter term.
+
+    A title containing 'ibops' also contains 'ibop', so only the shorter
+    term needs to be searched for.
+
+    Examples:
+        >>> _minimal_terms(['ibobs', 'ibops', 'ibop', 'ibob', 'IBOP'])
+        ['ibob', 'ibop']
+    """
+    kept = []
+    for term in sorted({term.lower() for term in search_terms}, key=lambda t: (len(t), t)):
+        if not any(shorter in term for shorter in kept):
+            kept.append(term)
+    return kept
+
+
+def _flatten(
+    filtered_transcripts: Dict[str, List[FilteredTranscript]]
+) -> List[FilteredTranscript]:
+    """Return all transcripts in display order (precomputed when available)."""
+    flat = filtered_transcripts.get('_flat')
+    if flat is None:
+        flat = (
+            filtered_transcripts['high_confidence'] +
+            filtered_transcripts['medium_confidence'] +
+            filtered_transcripts['other']
+        )
+    return flat
+
+
 def parse_selection(
     selection: str,
     filtered_transcripts: Dict[str, List[FilteredTranscript]]
@@ -119,12 +178,8 @@ def parse_selection(
     """
     selection = selection.lower().strip()
 
-    # Flatten all transcripts for indexing
-    all_transcripts = (
-        filtered_transcripts['high_confidence'] +
-        filtered_transcripts['medium_confidence'] +
-        filtered_transcripts['other']
-    )
+    # All transcripts in display order for indexing
+    all_transcripts = _flatten(filtered_transcripts)
 
     # Handle special cases
     if selection == 'none' or selection == '':
@@ -171,14 +226,14 @@ def get_transcript_display_index(
     Returns:
         Display index (1-indexed), or -1 if not found
     """
-    all_transcripts = (
-        filtered_transcripts['high_confidence'] +
-        filtered_transcripts['medium_confidence'] +
-        filtered_transcripts['other']
-    )
+    index_map = filtered_transcripts.get('_index_map')
+    if index_map is not None:
+        index = index_map.get(transcript.meeting_id, -1)
+        if index is not None:
+            return index
 
     try:
-        return all_transcripts.index(transcript) + 1  # 1-indexed for display
+        return _flatten(filtered_transcripts).index(transcript) + 1  # 1-indexed for display
     except ValueError:
         return -1
 
@@ -4,25 +4,32 @@ Sprint Report Service - Services Package
 This package contains core services for generating sprint reports:
 - pdf_generator: PDF generation from Markdown/HTML
 - report_generator: High-level report generation orchestrator
-"""
 
-from .pdf_generator import (
-    generate_pdf_from_markdown,
-    generate_pdf_from_html,
-    render_report_template
-)
+Exports are imported on first access, so importing one submodule (e.g.
+services.fast_md) does not pull in the Anthropic SDK or Jinja2.
+"""
+import importlib
 
-from .report_generator import (
-    generate_report,
-    process_sprint_report_async
-)
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'generate_pdf_from_markdown': 'pdf_generator',
+    'generate_pdf_from_html': 'pdf_generator',
+    'generate_pdfs_batch': 'pdf_generator',
+    'render_report_template': 'pdf_generator',
+    'generate_sprint_report': 'report_generator',
+    'generate_sprint_reports_batch': 'report_generator',
+}
 
-__all__ = [
-    'generate_pdf_from_markdown',
-    'generate_pdf_from_html',
-    'render_report_template',
-    'generate_report',
-    'process_sprint_report_async'
-]
+__all__ = list(_EXPORTS)
 
 __version__ = '1.0.0'
+
+
+def __getattr__(name):
+    """Import the submodule defining name on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,192 @@
+"""
+Fast Markdown renderer for plain sprint-report structure.
+
+Generated sprint reports are mostly headings, flat lists, simple
+tables and short paragraphs with **bold** and `code`. This module renders
+that subset with a few compiled regexes, aiming for the same HTML as
+Python-Markdown with the default extensions ('extra', 'nl2br', 'sane_lists').
+Parity is checked by tests/test_fast_md.py on report-shaped input and known
+edge cases, not proven for all Markdown.
+
+Anything outside the subset (links, emphasis with '_' or single '*', nested
+lists, setext headings, code blocks, raw HTML, table alignment, ...) makes
+render_sprint_markdown() return None so the caller falls back to the full
+Markdown library.
+
+Usage:
+    from services.fast_md import render_sprint_markdown
+
+    html = render_sprint_markdown(text)
+    if html is None:
+        html = markdown.markdown(text, extensions=[...])
+"""
+import re
+from typing import List, Optional
+
+# Characters with Markdown meaning outside the supported subset
+_UNSUPPORTED_CHARS = re.compile(r'[<>&\\_\[\]!{}~^=\t]')
+
+# Line starts that begin a block type the subset does not handle ('-' alone
+# is a setext underline, '-- --' a rule; headings ending in '#' have closing
+# sequences Markdown strips by rules the subset does not reproduce)
+_UNSUPPORTED_START = re.compile(
+    r'\s|\*(?!\*\S)|[+>:]|\d+\)\s|-[- ]*$|---|```|#{4,}|#(?!#{0,2} )|#.*#$'
+)
+
+# List item text starting with block markup (nested list, heading, rule)
+_ITEM_BLOCK_START = re.compile(r'[-+#>|]|\*(?!\*\S)|\d+[.)]')
+
+_HEADING = re.compile(r'(#{1,3}) (.+)')
+_ORDERED_ITEM = re.compile(r'\d+\. ')
+_TABLE_SEPARATOR = re.compile(r'\|(?: *-+ *\|)+')
+_BOLD = re.compile(r'\*\*(?=\S)([^*]+?)(?<=\S)\*\*')
+_CODE = re.compile(r'`([^`]+)`')
+
+
+def _render_inline(text: str) -> Optional[str]:
+    """Render bold and code spans, or None if other inline markup remains."""
+    # '``' opens a multi-backtick code span in Markdown
+    if '``' in text or any('*' in span for span in _CODE.findall(text)):
+        return None
+    html = _BOLD.sub(r'<strong>\1</strong>', text)
+    html = _CODE.sub(lambda m: f'<code>{m.group(1).strip()}</code>', html)
+    if '*' in html.replace('<strong>', '').replace('</strong>', '') or '`' in html:
+        return None
+    return html
+
+
+def _render_item(text: str) -> Optional[str]:
+    """Render a list item's text, or None if it starts with block markup."""
+    if _ITEM_BLOCK_START.match(text):
+        return None
+    return _render_inline(text)
+
+
+def _split_row(line: str) -> List[str]:
+    """Split a '| a | b |' table row into stripped cells."""
+    return [cell.strip() for cell in line[1:-1].split('|')]
+
+
+def _render_block(lines: List[str]) -> Optional[List[str]]:
+    """Render one blank-line separated block, or None if unsupported."""
+    html: List[str] = []
+
+    # Headings are only recognized at the start of a block
+    while lines:
+        match = _HEADING.fullmatch(lines[0])
+        if not match:
+            break
+        text = _render_inline(match.group(2).strip())
+        if not text:
+            return None
+        level = len(match.group(1))
+        html.append(f'<h{level}>{text}</h{level}>')
+        lines = lines[1:]
+
+    if not lines:
+        return html
+
+    if any(line.startswith('#') for line in lines):
+        return None
+
+    if all(line.startswith('- ') for line in lines):
+        html.append('<ul>')
+        for line in lines:
+            text = _render_item(line[2:].strip())
+            if not text:
+                return None
+            html.append(f'<li>{text}</li>')
+        html.append('</ul>')
+        return html
+
+    if all(_ORDERED_ITEM.match(line) for line in lines):
+        # sane_lists ignores the numbers; only plain 1-based lists are handled
+        if not lines[0].startswith('1. '):
+            return None
+        html.append('<ol>')
+        for line in lines:
+            text = _render_item(line.split(' ', 1)[1].strip())
+            if not text:
+                return None
+            html.append(f'<li>{text}</li>')
+        html.append('</ol>')
+        return html
+
+    if all(line.startswith('|') and line.endswith('|') for line in lines):
+        if len(lines) < 3 or not _TABLE_SEPARATOR.fullmatch(lines[1]):
+            return None
+        header = _split_row(lines[0])
+        if len(_split_row(lines[1])) != len(header):
+            return None
+        html.extend(('<table>', '<thead>', '<tr>'))
+        for cell in header:
+            text = _render_inline(cell)
+            if text is None:
+                return None
+            html.append(f'<th>{text}</th>')
+        html.extend(('</tr>', '</thead>', '<tbody>'))
+        for line in lines[2:]:
+            cells = _split_row(line)
+            if len(cells) != len(header):
+                return None
+            html.append('<tr>')
+            for cell in cells:
+                text = _render_inline(cell)
+                if text is None:
+                    return None
+                html.append(f'<td>{text}</td>')
+            html.append('</tr>')
+        html.extend(('</tbody>', '</table>'))
+        return html
+
+    # Pipes in a paragraph can still form a table without leading bars
+    if any(line.startswith('- ') or '|' in line or _ORDERED_ITEM.match(line)
+           for line in lines):
+        return None
+
+    rendered = [_render_inline(line.strip()) for line in lines]
+    if not all(rendered):
+        return None
+    html.append('<p>' + '<br />\n'.join(rendered) + '</p>')
+    return html
+
+
+def render_sprint_markdown(text: str) -> Optional[str]:
+    """Render sprint-report Markdown without the Markdown library.
+
+    Args:
+        text: Markdown content
+
+    Returns:
+        HTML matching Python-Markdown's output for the supported subset,
+        or None if the text uses anything outside it
+
+    Examples:
+        >>> render_sprint_markdown('## Done\\n- **A-1** shipped')
+        '<h2>Done</h2>\\n<ul>\\n<li><strong>A-1</strong> shipped</li>\\n</ul>'
+        >>> render_sprint_markdown('See [docs](http://x)') is None
+        True
+    """
+    if _UNSUPPORTED_CHARS.search(text):
+        return None
+
+    html: List[str] = []
+    block: List[str] = []
+    for line in text.splitlines() + ['']:
+        if line:
+            # Trailing spaces are kept (or become hard breaks) by Markdown
+            if _UNSUPPORTED_START.match(line) or line[-1].isspace():
+                return None
+            block.append(line)
+        elif block:
+            # A list after a blank line joins the previous list as a loose list
+            if html and html[-1] in ('</ul>', '</ol>') and (
+                    block[0].startswith('- ') or _ORDERED_ITEM.match(block[0])):
+                return None
+            rendered = _render_block(block)
+            if rendered is None:
+                return None
+            html.extend(rendered)
+            block = []
+
+    return '\n'.join(html)
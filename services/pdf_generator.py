@@ -19,27 +19,75 @@ Dependencies:
 """
 
 import os
+import json
 import logging
+import functools
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
 # WeasyPrint is imported lazily inside functions that use it
 # This allows the module to load even if WeasyPrint/GTK3 is not available
 WEASYPRINT_AVAILABLE = None  # None = not yet checked, True = available, False = unavailable
 WEASYPRINT_ERROR = None
+_WEASYPRINT_LOCK = threading.Lock()
 
-from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound, meta
 import markdown
+from markupsafe import Markup
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+from services.fast_md import render_sprint_markdown
+
+# Module logger (handlers are configured by the application)
 logger = logging.getLogger(__name__)
 
 
+# One Jinja2 environment per template directory; its template cache then
+# serves parsed templates on repeat renders
+_ENV_CACHE: Dict[Path, Environment] = {}
+
+# Default Markdown extensions. Sprint reports rarely contain code or need a
+# table of contents, so 'codehilite' (imports Pygments) and 'toc' are opt-in
+DEFAULT_MD_EXTENSIONS = (
+    'extra',      # Tables, fenced code blocks, etc.
+    'nl2br',      # Convert newlines to <br>
+    'sane_lists', # Better list handling
+)
+
+# Markdown converters built once per extension set (extension loading
+# dominates short conversions); reset() between documents, lock because
+# they are stateful
+_MARKDOWN_CACHE: Dict[Tuple[str, ...], markdown.Markdown] = {}
+_MARKDOWN_LOCK = threading.Lock()
+
+# Template output split around report_content, keyed by (template name,
+# serialized metadata), so renders repeating a report's metadata (the draft
+# and the post-review PDF) skip Jinja2. Bounded LRU; None = not cacheable
+_STATIC_SHELL_CACHE: 'OrderedDict[Tuple[str, str], Optional[Tuple[str, str]]]' = OrderedDict()
+_STATIC_SHELL_MAX_ENTRIES = 32
+_SHELL_LOCK = threading.Lock()
+_SHELL_MARKER = '\x00report_content\x00'
+_TIME_DEPENDENT_VARS = frozenset({'generation_date', 'current_year'})
+
+# Whether each template prints generation_date or current_year
+_TIME_DEPENDENT_TEMPLATES: Dict[str, bool] = {}
+
+# Parsed stylesheet files keyed by (path, mtime). @font-face rules register
+# on the FontConfiguration passed at parse time, so each entry remembers it
+_CSS_CACHE: Dict[Tuple[str, float], Tuple[Any, Any]] = {}
+
+# Shared FontConfiguration; building one initializes Fontconfig, one of
+# WeasyPrint's slowest cold-start steps
+_FONT_CONFIG = None
+_FONT_CONFIG_LOCK = threading.Lock()
+
+# Background writer for the HTML copy so PDF layout starts immediately
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pdf-io')
+
+
 class PDFGeneratorError(Exception):
     """Base exception for PDF generation errors."""
     pass
@@ -60,24 +108,29 @@ def check_weasyprint_availability() -> None:
     Check if WeasyPrint is available and properly configured.
 
     This function attempts to import WeasyPrint on first call and caches the result.
-    Subsequent calls use the cached result for performance.
+    Once WeasyPrint is known to be available, calls return after one flag read.
 
     Raises:
         WeasyPrintNotAvailableError: If WeasyPrint cannot be imported or is misconfigured
     """
     global WEASYPRINT_AVAILABLE, WEASYPRINT_ERROR
 
-    # Try importing WeasyPrint if we haven't checked yet
-    if WEASYPRINT_AVAILABLE is None:
-        try:
-            from weasyprint import HTML, CSS
-            from weasyprint.text.fonts import FontConfiguration
-            WEASYPRINT_AVAILABLE = True
-            logger.info("WeasyPrint is available and ready")
-        except ImportError as e:
-            WEASYPRINT_AVAILABLE = False
-            WEASYPRINT_ERROR = str(e)
-            logger.warning(f"WeasyPrint import failed: {e}")
+    if WEASYPRINT_AVAILABLE:
+        return
+
+    # Try importing WeasyPrint if we haven't checked yet (once, even when
+    # a background draft render and the main thread arrive together)
+    with _WEASYPRINT_LOCK:
+        if WEASYPRINT_AVAILABLE is None:
+            try:
+                from weasyprint import HTML, CSS
+                from weasyprint.text.fonts import FontConfiguration
+                WEASYPRINT_AVAILABLE = True
+                logger.info("WeasyPrint is available and ready")
+            except ImportError as e:
+                WEASYPRINT_AVAILABLE = False
+                WEASYPRINT_ERROR = str(e)
+                logger.warning(f"WeasyPrint import failed: {e}")
 
     # Raise error if WeasyPrint is not available
     if not WEASYPRINT_AVAILABLE:
@@ -93,10 +146,13 @@ def check_weasyprint_availability() -> None:
         raise WeasyPrintNotAvailableError(error_msg)
 
 
+@functools.lru_cache(maxsize=8)
 def get_template_dir() -> Path:
     """
     Get the templates directory path.
 
+    Resolved (and created if missing) once per process.
+
     Returns:
         Path: Absolute path to templates directory
     """
@@ -113,10 +169,38 @@ def get_template_dir() -> Path:
     return template_dir
 
 
+def _get_env(template_dir: Path) -> Environment:
+    """
+    Get the cached Jinja2 environment for a template directory.
+
+    Templates are not re-checked on disk after first load (auto_reload off),
+    so edits to a template need a process restart.
+
+    Args:
+        template_dir: Directory containing the templates
+
+    Returns:
+        Environment: Jinja2 environment for template_dir
+    """
+    env = _ENV_CACHE.get(template_dir)
+    if env is None:
+        env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            autoescape=True,  # XSS protection
+            auto_reload=False,
+            cache_size=400
+        )
+        _ENV_CACHE[template_dir] = env
+    return env
+
+
+@functools.lru_cache(maxsize=8)
 def get_output_dir(output_type: str = 'pdfs') -> Path:
     """
     Get the output directory path for PDFs or HTML files.
 
+    Resolved (and created if missing) once per process and output type.
+
     Args:
         output_type: Type of output ('pdfs' or 'html')
 
@@ -133,25 +217,35 @@ def get_output_dir(output_type: str = 'pdfs') -> Path:
     return output_dir
 
 
-def markdown_to_html(markdown_content: str) -> str:
+def markdown_to_html(
+    markdown_content: str,
+    extensions: Optional[Sequence[str]] = None
+) -> str:
     """
     Convert Markdown content to HTML.
 
     Args:
         markdown_content: Markdown text to convert
+        extensions: Markdown extensions (default: DEFAULT_MD_EXTENSIONS);
+            e.g. add 'toc' or 'codehilite' when the content needs them
 
     Returns:
         str: HTML content
     """
-    md = markdown.Markdown(extensions=[
-        'extra',      # Tables, fenced code blocks, etc.
-        'nl2br',      # Convert newlines to <br>
-        'sane_lists', # Better list handling
-        'toc',        # Table of contents
-        'codehilite'  # Syntax highlighting
-    ])
-
-    html_content = md.convert(markdown_content)
+    key = tuple(extensions) if extensions is not None else DEFAULT_MD_EXTENSIONS
+
+    # Plain sprint-report structure renders without the Markdown library
+    if key == DEFAULT_MD_EXTENSIONS:
+        html_content = render_sprint_markdown(markdown_content)
+        if html_content is not None:
+            logger.debug(f"Converted {len(markdown_content)} chars of Markdown via fast path")
+            return html_content
+
+    with _MARKDOWN_LOCK:
+        md = _MARKDOWN_CACHE.get(key)
+        if md is None:
+            md = _MARKDOWN_CACHE[key] = markdown.Markdown(extensions=list(key))
+        html_content = md.reset().convert(markdown_content)
     logger.debug(f"Converted {len(markdown_content)} chars of Markdown to {len(html_content)} chars of HTML")
 
     return html_content
@@ -161,16 +255,26 @@ def render_report_template(
     template_name: str = 'report_template.html',
     report_content: str = '',
     metadata: Optional[Dict[str, Any]] = None,
-    is_markdown: bool = True
+    is_markdown: bool = True,
+    md_extensions: Optional[Sequence[str]] = None,
+    flatten_metadata: bool = False,
+    generated_at: Optional[datetime] = None
 ) -> str:
     """
     Render a report template with provided content and metadata.
 
+    Templates read metadata as {{ metadata.x }}.
+
     Args:
         template_name: Name of the Jinja2 template file
         report_content: Main report content (Markdown or HTML)
         metadata: Dictionary of metadata to inject into template
         is_markdown: If True, convert report_content from Markdown to HTML
+        md_extensions: Markdown extensions (default: DEFAULT_MD_EXTENSIONS)
+        flatten_metadata: If True, also expose each metadata key as a
+            top-level template variable (legacy {{ x }} templates)
+        generated_at: Generation timestamp shown in the report (default: now);
+            batch callers pass one value so every report agrees
 
     Returns:
         str: Rendered HTML content
@@ -182,30 +286,29 @@ def render_report_template(
     try:
         template_dir = get_template_dir()
 
-        # Set up Jinja2 environment
-        env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=True  # XSS protection
-        )
-
-        # Load template
-        template = env.get_template(template_name)
+        # Load template (parsed once per process, then served from cache)
+        template = _get_env(template_dir).get_template(template_name)
         logger.info(f"Loaded template: {template_name}")
 
         # Convert Markdown to HTML if needed
         if is_markdown and report_content:
-            report_content = markdown_to_html(report_content)
+            report_content = markdown_to_html(report_content, md_extensions)
+
+        # Content is trusted HTML; as Markup, the template's |safe filter
+        # passes it through instead of copying the whole body
+        report_content = Markup(report_content)
 
         # Prepare template variables
+        generated_at = generated_at or datetime.now()
         template_vars = {
             'report_content': report_content,
             'metadata': metadata or {},
-            'generation_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'current_year': datetime.now().year
+            'generation_date': generated_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'current_year': generated_at.year
         }
 
-        # Merge in any additional metadata
-        if metadata:
+        # Legacy templates read metadata keys at top level
+        if flatten_metadata and metadata:
             template_vars.update(metadata)
 
         # Render template
@@ -225,42 +328,146 @@ def render_report_template(
         raise TemplateRenderError(error_msg)
 
 
+def _get_static_shell(
+    template_name: str,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Optional[Tuple[str, str]]:
+    """
+    Get the rendering of a template for given metadata, split around the content.
+
+    Templates that print generation_date or current_year change between
+    renders and are never cached, nor is metadata that is not JSON-serializable.
+
+    Args:
+        template_name: Name of the Jinja2 template file
+        metadata: Metadata the template is rendered with
+
+    Returns:
+        (head, tail) HTML strings, or None if the template cannot be cached
+    """
+    try:
+        key = (template_name, json.dumps(metadata or {}, sort_keys=True))
+    except (TypeError, ValueError):
+        return None
+
+    with _SHELL_LOCK:
+        if key in _STATIC_SHELL_CACHE:
+            _STATIC_SHELL_CACHE.move_to_end(key)
+            return _STATIC_SHELL_CACHE[key]
+
+    time_dependent = _TIME_DEPENDENT_TEMPLATES.get(template_name)
+    if time_dependent is None:
+        env = _get_env(get_template_dir())
+        source = env.loader.get_source(env, template_name)[0]
+        time_dependent = bool(
+            meta.find_undeclared_variables(env.parse(source)) & _TIME_DEPENDENT_VARS
+        )
+        _TIME_DEPENDENT_TEMPLATES[template_name] = time_dependent
+    if time_dependent:
+        return None
+
+    shell = None
+    rendered = render_report_template(
+        template_name=template_name,
+        report_content=_SHELL_MARKER,
+        metadata=metadata,
+        is_markdown=False
+    )
+    if rendered.count(_SHELL_MARKER) == 1:
+        head, tail = rendered.split(_SHELL_MARKER)
+        shell = (head, tail)
+
+    with _SHELL_LOCK:
+        _STATIC_SHELL_CACHE[key] = shell
+        if len(_STATIC_SHELL_CACHE) > _STATIC_SHELL_MAX_ENTRIES:
+            _STATIC_SHELL_CACHE.popitem(last=False)
+    return shell
+
+
+def _get_font_config() -> Any:
+    """
+    Get the process-wide WeasyPrint FontConfiguration, creating it on first use.
+
+    Returns:
+        weasyprint.text.fonts.FontConfiguration
+    """
+    global _FONT_CONFIG
+
+    if _FONT_CONFIG is None:
+        with _FONT_CONFIG_LOCK:
+            if _FONT_CONFIG is None:
+                from weasyprint.text.fonts import FontConfiguration
+                _FONT_CONFIG = FontConfiguration()
+    return _FONT_CONFIG
+
+
+def _load_css(path: str, font_config: Any) -> Any:
+    """
+    Get a parsed WeasyPrint stylesheet, re-parsing only when the file changes.
+
+    Args:
+        path: CSS file path
+        font_config: FontConfiguration the stylesheet is used with
+
+    Returns:
+        weasyprint.CSS object
+    """
+    from weasyprint import CSS
+
+    key = (path, os.path.getmtime(path))
+    cached = _CSS_CACHE.get(key)
+    if cached is not None and cached[0] is font_config:
+        return cached[1]
+
+    # Drop entries for older versions of this file
+    for stale in [k for k in _CSS_CACHE if k[0] == path and k != key]:
+        del _CSS_CACHE[stale]
+
+    css = CSS(filename=path, font_config=font_config)
+    _CSS_CACHE[key] = (font_config, css)
+    return css
+
+
 def generate_pdf_from_html(
     html_content: str,
-    output_path: Union[str, Path],
+    output_path: Optional[Union[str, Path]],
     base_url: Optional[str] = None,
-    stylesheets: Optional[list] = None
-) -> Path:
+    stylesheets: Optional[list] = None,
+    return_document: bool = False
+) -> Any:
     """
     Generate a PDF file from HTML content.
 
+    Layout (render) and serialization (write_pdf) run as separate steps, so
+    callers can ask for the laid-out Document and serialize it themselves,
+    e.g. doc.write_pdf(BytesIO()) or several targets from one layout.
+
     Args:
         html_content: HTML string to convert to PDF
-        output_path: Path where PDF should be saved
+        output_path: Path where PDF should be saved (ignored, and may be None,
+            when return_document is True)
         base_url: Base URL for resolving relative URLs in HTML
         stylesheets: List of CSS files or CSS objects to apply
+        return_document: If True, return the rendered weasyprint Document
+            without writing a file
 
     Returns:
-        Path: Absolute path to generated PDF file
+        Path: Absolute path to generated PDF file, or the rendered Document
+        when return_document is True
 
     Raises:
         WeasyPrintNotAvailableError: If WeasyPrint is not available
         PDFGeneratorError: If PDF generation fails
     """
-    check_weasyprint_availability()
+    if not WEASYPRINT_AVAILABLE:
+        check_weasyprint_availability()
 
     # Import WeasyPrint classes (only when PDF generation is actually needed)
-    from weasyprint import HTML, CSS
-    from weasyprint.text.fonts import FontConfiguration
+    from weasyprint import HTML
 
     try:
-        output_path = Path(output_path)
-
-        # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Configure font handling
-        font_config = FontConfiguration()
+        # Configure font handling (shared across calls)
+        font_config = _get_font_config()
 
         # Create HTML document
         html_doc = HTML(string=html_content, base_url=base_url)
@@ -271,18 +478,32 @@ def generate_pdf_from_html(
             for stylesheet in stylesheets:
                 if isinstance(stylesheet, str):
                     # Treat as CSS file path
-                    css_list.append(CSS(filename=stylesheet, font_config=font_config))
+                    css_list.append(_load_css(stylesheet, font_config))
                 else:
                     # Assume it's a CSS object
                     css_list.append(stylesheet)
 
-        # Generate PDF
+        # Lay out pages
+        document = html_doc.render(stylesheets=css_list, font_config=font_config)
+        if return_document:
+            logger.info(f"Rendered document ({len(document.pages)} pages)")
+            return document
+
+        output_path = Path(output_path)
+
+        # Ensure output directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Serialize PDF next to the target, then swap it in atomically so a
+        # failed or interrupted run never leaves a truncated PDF behind
         logger.info(f"Generating PDF: {output_path}")
-        html_doc.write_pdf(
-            output_path,
-            stylesheets=css_list,
-            font_config=font_config
-        )
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        try:
+            document.write_pdf(target=str(tmp_path))
+            os.replace(tmp_path, output_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
 
         # Verify file was created
         if not output_path.exists():
@@ -307,7 +528,9 @@ def generate_pdf_from_markdown(
     output_path: Union[str, Path],
     template_name: str = 'csg_sprint_report_template.html',
     metadata: Optional[Dict[str, Any]] = None,
-    save_html: bool = True
+    save_html: bool = True,
+    md_extensions: Optional[Sequence[str]] = None,
+    generated_at: Optional[datetime] = None
 ) -> Dict[str, Path]:
     """
     Generate a PDF file from Markdown content using a template.
@@ -323,6 +546,8 @@ def generate_pdf_from_markdown(
         template_name: Name of Jinja2 template to use
         metadata: Dictionary of metadata for template
         save_html: If True, also save rendered HTML file
+        md_extensions: Markdown extensions (default: DEFAULT_MD_EXTENSIONS)
+        generated_at: Generation timestamp for the template (default: now)
 
     Returns:
         Dict with keys:
@@ -337,20 +562,31 @@ def generate_pdf_from_markdown(
     try:
         output_path = Path(output_path)
 
-        # Render HTML from template
-        html_content = render_report_template(
-            template_name=template_name,
-            report_content=markdown_content,
-            metadata=metadata,
-            is_markdown=True
-        )
-
-        # Save HTML file if requested
+        # The template output is fixed for given metadata apart from the
+        # content, so reuse the cached shell instead of re-rendering
+        shell = _get_static_shell(template_name, metadata)
+        if shell:
+            html_content = ''.join((
+                shell[0], markdown_to_html(markdown_content, md_extensions), shell[1]
+            ))
+        else:
+            # Render HTML from template
+            html_content = render_report_template(
+                template_name=template_name,
+                report_content=markdown_content,
+                metadata=metadata,
+                is_markdown=True,
+                md_extensions=md_extensions,
+                generated_at=generated_at
+            )
+
+        # Save HTML file if requested (in the background, alongside the PDF)
         html_path = None
+        html_write: Optional[Future] = None
         if save_html:
             html_path = output_path.with_suffix('.html')
-            html_path.write_text(html_content, encoding='utf-8')
-            logger.info(f"Saved HTML file: {html_path}")
+            html_path.parent.mkdir(parents=True, exist_ok=True)
+            html_write = _IO_POOL.submit(html_path.write_text, html_content, encoding='utf-8')
 
         # Generate PDF
         pdf_path = generate_pdf_from_html(
@@ -358,6 +594,10 @@ def generate_pdf_from_markdown(
             output_path=output_path
         )
 
+        if html_write is not None:
+            html_write.result()
+            logger.info(f"Saved HTML file: {html_path}")
+
         result = {'pdf_path': pdf_path}
         if html_path:
             result['html_path'] = html_path
@@ -374,6 +614,50 @@ def generate_pdf_from_markdown(
 
 
 # Convenience function for testing
+def _init_pdf_worker() -> None:
+    """Import WeasyPrint once per worker process (errors surface per job)."""
+    try:
+        check_weasyprint_availability()
+    except WeasyPrintNotAvailableError:
+        pass
+
+
+def generate_pdfs_batch(
+    jobs: List[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Path]]:
+    """
+    Generate several PDFs in parallel worker processes.
+
+    WeasyPrint layout is CPU-bound and does not reliably release the GIL,
+    so independent reports are rendered in separate processes. Jobs without
+    their own generated_at share one timestamp taken here.
+
+    Args:
+        jobs: Keyword arguments for generate_pdf_from_markdown(), one dict per PDF
+        max_workers: Worker processes (default: CPU count, capped at len(jobs))
+
+    Returns:
+        List of generate_pdf_from_markdown() results, in job order
+
+    Raises:
+        WeasyPrintNotAvailableError: If WeasyPrint is not available
+        TemplateRenderError: If template rendering fails for any job
+        PDFGeneratorError: If PDF generation fails for any job
+    """
+    if not jobs:
+        return []
+
+    generated_at = datetime.now()
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_pdf_worker) as executor:
+        futures = [
+            executor.submit(generate_pdf_from_markdown, **{'generated_at': generated_at, **job})
+            for job in jobs
+        ]
+        return [future.result() for future in futures]
+
+
 def generate_sample_pdf(output_filename: str = 'sample_report.pdf') -> Dict[str, Path]:
     """
     Generate a sample PDF for testing purposes.
@@ -440,6 +724,11 @@ The team demonstrated excellent collaboration and delivered beyond expectations.
 
 if __name__ == '__main__':
     """Test PDF generation when run directly."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     try:
         logger.info("Starting PDF generator test...")
         result = generate_sample_pdf()
@@ -4,28 +4,64 @@ Report Generator - Simplified version for CLI tool.
 Generates executive-level sprint reports using Claude AI, combining JIRA data
 and Fathom transcripts according to the sprint report guide.
 """
+import time
+import logging
+import functools
 from anthropic import Anthropic
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from cli.jira_mcp import Sprint, Issue
 from cli.transcript_filter import FilteredTranscript
 from utils.config import Config
 
+logger = logging.getLogger(__name__)
+
+# Task description and instructions shared by every report. Kept free of
+# per-report values so the system prompt + guide prefix stays byte-identical
+# and is served from Anthropic's prompt cache on repeat runs
+REPORT_SYSTEM_PROMPT = """You are an expert technical writer creating executive-level sprint reports.
+
+# Your Task
+
+Generate a comprehensive sprint report following the sprint report format guide provided by the user. The report should be:
+- Written for executive/business stakeholders (not developers)
+- High-level and focused on outcomes and business value
+- Clear, concise, and well-structured
+- Following the exact format specified in the guide
+
+# Instructions
+
+1. Read the sprint report format guide carefully
+2. Analyze the JIRA data to understand what was accomplished
+3. Use the Fathom meetings as additional context (but prioritize JIRA data)
+4. Write a polished, executive-level report following the guide's structure
+5. Use active voice, present tense, and business-focused language
+6. Include specific JIRA issue references where appropriate (e.g., "→ BOPS-123")
+7. Focus on business value and outcomes, not technical implementation details
+
+Output the report in Markdown format, ready for PDF generation.
+"""
+
 
 def generate_sprint_report(
     sprint: Sprint,
     issues: List[Issue],
     transcripts: List[FilteredTranscript],
-    config: Config
+    config: Config,
+    on_text: Optional[Callable[[str], None]] = None
 ) -> str:
     """Generate sprint report using Claude AI.
 
+    The response is streamed, so callers can show progress while tokens
+    arrive instead of waiting on one long blocking request.
+
     Args:
         sprint: Sprint object with metadata
         issues: List of JIRA issues in sprint
         transcripts: List of selected Fathom transcripts
         config: Configuration object
+        on_text: Optional callback invoked with each streamed text chunk
 
     Returns:
         Report content in Markdown format
@@ -33,46 +69,179 @@ def generate_sprint_report(
     Raises:
         Exception: If Claude API fails or guide file missing
     """
-    # Load sprint report guide
-    if not config.report.guide_path.exists():
-        raise FileNotFoundError(f"Sprint guide not found: {config.report.guide_path}")
+    sprint_guide = _load_sprint_guide(config)
+    params = _build_message_params(sprint, issues, transcripts, config, sprint_guide)
+
+    # Call Claude API
+    client = Anthropic(api_key=config.claude.api_key)
+
+    with client.messages.stream(**params) as stream:
+        for text in stream.text_stream:
+            if on_text:
+                on_text(text)
+        response = stream.get_final_message()
+
+    usage = response.usage
+    logger.info(
+        f"Token usage - Input: {usage.input_tokens}, Output: {usage.output_tokens}, "
+        f"Cache read: {getattr(usage, 'cache_read_input_tokens', 0) or 0}, "
+        f"Cache write: {getattr(usage, 'cache_creation_input_tokens', 0) or 0}"
+    )
+
+    # Extract markdown report from response
+    report_markdown = response.content[0].text
+
+    return report_markdown
+
+
+def generate_sprint_reports_batch(
+    jobs: List[Tuple[Sprint, List[Issue], List[FilteredTranscript]]],
+    config: Config,
+    poll_interval: float = 30.0,
+    max_poll_interval: float = 300.0
+) -> Dict[int, str]:
+    """Generate several sprint reports through the Message Batches API.
+
+    Batched requests cost half as much as regular calls but may take
+    minutes (up to 24 hours) to finish, so use this for backfills and
+    unattended multi-sprint runs, not the interactive CLI.
+
+    Args:
+        jobs: (sprint, issues, transcripts) tuple per report
+        config: Configuration object
+        poll_interval: Seconds before the first status check
+        max_poll_interval: Upper bound for the doubling poll interval
+
+    Returns:
+        Dict mapping sprint ID to report Markdown. Requests that errored,
+        expired or were canceled are logged and left out.
+
+    Raises:
+        ValueError: If the same sprint appears in more than one job
+        Exception: If Claude API fails or guide file missing
+    """
+    if not jobs:
+        return {}
+
+    sprint_ids = [sprint.id for sprint, _, _ in jobs]
+    if len(set(sprint_ids)) != len(sprint_ids):
+        raise ValueError("Each sprint can only appear once per batch")
+
+    sprint_guide = _load_sprint_guide(config)
+    requests = [
+        {
+            "custom_id": f"sprint-{sprint.id}",
+            "params": _build_message_params(sprint, issues, transcripts, config, sprint_guide)
+        }
+        for sprint, issues, transcripts in jobs
+    ]
+
+    client = Anthropic(api_key=config.claude.api_key)
+    batches = client.beta.messages.batches
+
+    batch = batches.create(requests=requests)
+    logger.info(f"Submitted message batch {batch.id} ({len(requests)} reports)")
+
+    # Poll with a doubling interval until every request has finished
+    interval = poll_interval
+    while batch.processing_status != "ended":
+        time.sleep(interval)
+        interval = min(interval * 2, max_poll_interval)
+        batch = batches.retrieve(batch.id)
+        logger.debug(f"Batch {batch.id}: {batch.processing_status} {batch.request_counts}")
+
+    reports: Dict[int, str] = {}
+    for entry in batches.results(batch.id):
+        sprint_id = int(entry.custom_id.split('-', 1)[1])
+        if entry.result.type == "succeeded":
+            reports[sprint_id] = entry.result.message.content[0].text
+        else:
+            logger.warning(f"Report for sprint {sprint_id} not generated: {entry.result.type}")
+
+    logger.info(f"Batch {batch.id} finished: {len(reports)}/{len(requests)} reports generated")
+    return reports
 
-    with open(config.report.guide_path, 'r') as f:
-        sprint_guide = f.read()
 
+def _load_sprint_guide(config: Config) -> str:
+    """Read the sprint report guide named in the configuration.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Guide content
+
+    Raises:
+        FileNotFoundError: If the guide file is missing
+    """
+    guide_path = config.report.guide_path
+    if not guide_path.exists():
+        raise FileNotFoundError(f"Sprint guide not found: {guide_path}")
+
+    # Read once per file version; editing the guide changes its mtime
+    return _read_guide(str(guide_path.resolve()), guide_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_guide(path: str, mtime_ns: int) -> str:
+    """Read a guide file, memoized by path and modification time.
+
+    Args:
+        path: Absolute guide path
+        mtime_ns: File modification time (cache key only)
+
+    Returns:
+        Guide content
+    """
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def _build_message_params(
+    sprint: Sprint,
+    issues: List[Issue],
+    transcripts: List[FilteredTranscript],
+    config: Config,
+    sprint_guide: str
+) -> Dict[str, Any]:
+    """Build Messages API parameters for one sprint report.
+
+    Args:
+        sprint: Sprint object with metadata
+        issues: List of JIRA issues in sprint
+        transcripts: List of selected Fathom transcripts
+        config: Configuration object
+        sprint_guide: Sprint report format guide
+
+    Returns:
+        Keyword arguments for messages.create() (or a batch request's params)
+    """
     # Build sprint data summary
     sprint_data = _build_sprint_data_summary(sprint, issues)
 
     # Build transcript context
     transcript_context = _build_transcript_context(transcripts)
 
-    # Build Claude prompt
-    prompt = _build_claude_prompt(
+    # Build Claude prompt (static guide block first, per-sprint data after)
+    content = _build_claude_content(
         sprint_guide=sprint_guide,
         sprint_data=sprint_data,
         transcript_context=transcript_context,
         team_name=config.report.team_name
     )
 
-    # Call Claude API
-    client = Anthropic(api_key=config.claude.api_key)
-
-    response = client.messages.create(
-        model=config.claude.model,
-        max_tokens=config.claude.max_tokens,
-        temperature=config.claude.temperature,
-        messages=[
+    return {
+        "model": config.claude.model,
+        "max_tokens": config.claude.max_tokens,
+        "temperature": config.claude.temperature,
+        "system": REPORT_SYSTEM_PROMPT,
+        "messages": [
             {
                 "role": "user",
-                "content": prompt
+                "content": content
             }
         ]
-    )
-
-    # Extract markdown report from response
-    report_markdown = response.content[0].text
-
-    return report_markdown
+    }
 
 
 def _build_sprint_data_summary(sprint: Sprint, issues: List[Issue]) -> str:
@@ -163,13 +332,16 @@ def _build_transcript_context(transcripts: List[FilteredTranscript]) -> str:
     return context
 
 
-def _build_claude_prompt(
+def _build_claude_content(
     sprint_guide: str,
     sprint_data: str,
     transcript_context: str,
     team_name: str
-) -> str:
-    """Build Claude prompt combining guide, data, and context.
+) -> List[Dict[str, Any]]:
+    """Build the user message content blocks for Claude.
+
+    The guide block ends the cached prefix (system prompt + guide); team
+    name, sprint data and transcripts follow in an uncached block.
 
     Args:
         sprint_guide: Sprint report format guide
@@ -178,21 +350,19 @@ def _build_claude_prompt(
         team_name: Team name for report
 
     Returns:
-        Complete prompt for Claude
+        Content blocks for the user message
     """
-    prompt = f"""You are an expert technical writer creating an executive-level sprint report for {team_name}.
-
-# Your Task
-
-Generate a comprehensive sprint report following the format guide below. The report should be:
-- Written for executive/business stakeholders (not developers)
-- High-level and focused on outcomes and business value
-- Clear, concise, and well-structured
-- Following the exact format specified in the guide
-
-# Sprint Report Format Guide
-
-{sprint_guide}
+    return [
+        {
+            "type": "text",
+            "text": f"# Sprint Report Format Guide\n\n{sprint_guide}",
+            "cache_control": {"type": "ephemeral"}
+        },
+        {
+            "type": "text",
+            "text": f"""# Team
+
+This report is for {team_name}.
 
 # JIRA Sprint Data
 
@@ -201,21 +371,9 @@ Generate a comprehensive sprint report following the format guide below. The rep
 # Fathom Meeting Context
 
 {transcript_context}
-
-# Instructions
-
-1. Read the sprint report format guide carefully
-2. Analyze the JIRA data to understand what was accomplished
-3. Use the Fathom meetings as additional context (but prioritize JIRA data)
-4. Write a polished, executive-level report following the guide's structure
-5. Use active voice, present tense, and business-focused language
-6. Include specific JIRA issue references where appropriate (e.g., "→ BOPS-123")
-7. Focus on business value and outcomes, not technical implementation details
-
-Output the report in Markdown format, ready for PDF generation.
 """
-
-    return prompt
+        }
+    ]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+"""
+Parity tests for services/fast_md.py against Python-Markdown
+
+Run with: pytest tests/test_fast_md.py -v
+"""
+
+import markdown
+import pytest
+
+from services.fast_md import render_sprint_markdown
+from services.pdf_generator import DEFAULT_MD_EXTENSIONS
+
+
+SAMPLE_REPORT = """# Sprint 42 Report
+
+## Executive Summary
+The team completed **18 of 21** story points.
+Velocity is up from last sprint.
+
+## Completed Work
+- **BOPS-101** Migrate billing export
+- **BOPS-102** Fix `null` handling in invoices
+- **BOPS-103** Dashboard refresh
+
+## Next Steps
+1. Finish **BOPS-110**
+2. Plan capacity for Q1
+3. Review `deploy.sh` changes
+
+## Metrics
+| Metric | Value |
+|--------|-------|
+| Points | **18** |
+| Issues | 12 |
+
+### Risks
+Two carry-over stories depend on vendor API access."""
+
+# Inputs the fast path must produce identical HTML for, or decline
+PARITY_CASES = [
+    SAMPLE_REPORT,
+    "## Done\n- **A-1** shipped",
+    "Plain paragraph\nwith a second line",
+    "### Heading\nParagraph right after",
+    # Setext headings
+    "Title\n--",
+    "Title\n-",
+    "Title\n=====",
+    "Intro\n\nTitle\n---",
+    # List items that start with block markup
+    "- - x",
+    "- -",
+    "1. ### x",
+    "- ---",
+    "1. 1. x",
+    "- # Heading",
+    "- 1. nested",
+    "1. - nested",
+    "- * star",
+    "- + plus",
+    # Rules and heading closers
+    "-- --",
+    "Intro\n\n- - -",
+    "### a#  #",
+    "## Title ##",
+    "## C#",
+    "Run `a``b` now",
+]
+
+
+def _reference(text):
+    """Render text with Python-Markdown and the report's default extensions."""
+    return markdown.Markdown(extensions=list(DEFAULT_MD_EXTENSIONS)).convert(text)
+
+
+class TestFastMarkdownParity:
+    """Test the fast renderer matches Python-Markdown or falls back."""
+
+    @pytest.mark.parametrize("text", PARITY_CASES)
+    def test_matches_markdown_or_declines(self, text):
+        """Test fast output is identical to Python-Markdown when produced."""
+        html = render_sprint_markdown(text)
+        if html is not None:
+            assert html == _reference(text)
+
+    def test_sample_report_uses_fast_path(self):
+        """Test typical report Markdown is handled without fallback."""
+        assert render_sprint_markdown(SAMPLE_REPORT) == _reference(SAMPLE_REPORT)
+
+    @pytest.mark.parametrize("text", ["Title\n--", "Title\n-", "Intro\n\nTitle\n---"])
+    def test_setext_heading_falls_back(self, text):
+        """Test an underlined line is left to Python-Markdown."""
+        assert render_sprint_markdown(text) is None
+
+    @pytest.mark.parametrize("text", ["-- --", "### a#  #", "## Title ##"])
+    def test_rules_and_heading_closers_fall_back(self, text):
+        """Test spaced rules and closing '#' sequences are left to Python-Markdown."""
+        assert render_sprint_markdown(text) is None
+
+    @pytest.mark.parametrize("text", ["- - x", "1. ### x", "- ---", "1. 1. x"])
+    def test_block_markup_in_list_item_falls_back(self, text):
+        """Test list items starting with block markup are left to Python-Markdown."""
+        assert render_sprint_markdown(text) is None
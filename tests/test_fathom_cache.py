@@ -0,0 +1,75 @@
+"""
+Unit tests for utils/fathom_cache.py
+
+Run with: pytest tests/test_fathom_cache.py -v
+"""
+
+import json
+import time
+
+from utils.fathom_cache import make_key, get_cached, put_cached, project_meetings
+
+
+SAMPLE_MEETINGS = [
+    {
+        "id": "m1",
+        "recording_id": 101,
+        "title": "IBOPS Sprint Review",
+        "date": "2024-12-10T15:00:00Z",
+        "summary": "Reviewed sprint goals",
+        "transcript": "long transcript text"
+    }
+]
+
+
+class TestFathomCache:
+    """Test Fathom meetings cache."""
+
+    def test_key_ignores_search_term_order(self):
+        """Test cache key is stable across search term order."""
+        key_a = make_key("2024-12-01", "2024-12-14", ["ibops", "ibobs"])
+        key_b = make_key("2024-12-01", "2024-12-14", ["ibobs", "ibops"])
+        assert key_a == key_b
+        assert key_a != make_key("2024-12-01", "2024-12-15", ["ibops", "ibobs"])
+
+    def test_round_trip_strips_unused_fields(self, tmp_path):
+        """Test stored meetings keep only the cached fields."""
+        put_cached("abc", SAMPLE_MEETINGS, cache_dir=tmp_path)
+
+        meetings = get_cached("abc", cache_dir=tmp_path)
+        assert meetings[0]["title"] == "IBOPS Sprint Review"
+        assert "transcript" not in meetings[0]
+
+    def test_miss_when_absent(self, tmp_path):
+        """Test missing entry returns None."""
+        assert get_cached("missing", cache_dir=tmp_path) is None
+
+    def test_miss_when_expired(self, tmp_path):
+        """Test entries older than the TTL are ignored."""
+        entry = {"cached_at": time.time() - 7200, "meetings": SAMPLE_MEETINGS}
+        (tmp_path / "old.json").write_text(json.dumps(entry))
+
+        assert get_cached("old", ttl_seconds=3600, cache_dir=tmp_path) is None
+
+    def test_miss_when_corrupt(self, tmp_path):
+        """Test unreadable entries are treated as a miss."""
+        (tmp_path / "bad.json").write_text("{not json")
+
+        assert get_cached("bad", cache_dir=tmp_path) is None
+
+    def test_miss_and_hit_return_same_fields(self, tmp_path, monkeypatch):
+        """Test fetch_meetings() projects fresh results like cached ones."""
+        from types import SimpleNamespace
+
+        from cli.interactive import fetch_meetings
+        from utils import fathom_cache
+
+        monkeypatch.setattr(fathom_cache, "CACHE_DIR", tmp_path)
+        client = SimpleNamespace(list_meetings=lambda **kwargs: [dict(m) for m in SAMPLE_MEETINGS])
+        dates = {"start_date": "2024-12-01", "end_date": "2024-12-14"}
+
+        miss = fetch_meetings(client, dates, ["ibops"])
+        hit = fetch_meetings(client, dates, ["ibops"])
+
+        assert miss == hit == project_meetings(SAMPLE_MEETINGS)
+        assert "transcript" not in miss[0]
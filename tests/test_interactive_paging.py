@@ -0,0 +1,128 @@
+"""
+Unit tests for transcript table paging in cli/interactive.py
+
+Run with: pytest tests/test_interactive_paging.py -v
+"""
+
+import io
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+
+from cli import interactive
+from cli.transcript_filter import filter_transcripts_smart
+
+
+# 60 meetings: every tenth is an IBOPS meeting and ranks first
+MEETINGS = [
+    {
+        "id": f"m{i:02d}",
+        "title": f"IBOPS Review {i:02d}" if i % 10 == 0 else f"Meeting {i:02d}",
+        "date": f"2024-12-{i % 28 + 1:02d}"
+    }
+    for i in range(60)
+]
+
+
+@pytest.fixture
+def output(monkeypatch):
+    """Capture everything the interactive module prints."""
+    buffer = io.StringIO()
+    monkeypatch.setattr(interactive, "console", Console(file=buffer, width=200, color_system=None))
+    return buffer
+
+
+def _rows():
+    """(FilteredTranscript, confidence) pairs in display order."""
+    return [(t, t.confidence) for t in filter_transcripts_smart(MEETINGS, ["ibops"])["_flat"]]
+
+
+def _select(monkeypatch, answers):
+    """Run select_transcripts_interactive with scripted prompt answers."""
+    answers = iter(answers)
+    monkeypatch.setattr(interactive.Prompt, "ask", lambda *args, **kwargs: next(answers))
+    meetings = Future()
+    meetings.set_result(MEETINGS)
+    config = SimpleNamespace(fathom=SimpleNamespace(search_terms=["ibops"]))
+    return interactive.select_transcripts_interactive(None, {}, config, meetings_future=meetings)
+
+
+class TestRenderTranscriptPage:
+    """Test rendering of a single table page."""
+
+    def test_first_page(self, output):
+        """Test the first page shows rows 1-25 and the remaining count."""
+        rows = _rows()
+        interactive._render_transcript_page(rows, 0)
+        text = output.getvalue()
+
+        assert "page 1/3" in text
+        assert rows[0][0].title in text and rows[24][0].title in text
+        assert rows[25][0].title not in text
+        assert "35 more" in text
+
+    def test_last_page(self, output):
+        """Test the short last page keeps absolute row numbers and no 'more' hint."""
+        rows = _rows()
+        interactive._render_transcript_page(rows, 2)
+        text = output.getvalue()
+
+        assert "page 3/3" in text
+        assert rows[50][0].title in text and rows[59][0].title in text
+        assert rows[49][0].title not in text
+        assert " 51 " in text and " 60 " in text
+        assert "more" not in text
+
+    def test_single_page_has_no_page_title(self, output):
+        """Test a short list is rendered without page numbers."""
+        interactive._render_transcript_page(_rows()[:5], 0)
+
+        assert "page 1/1" not in output.getvalue()
+
+
+class TestTranscriptPaging:
+    """Test the 'more' and 'page N' commands in the selection prompt."""
+
+    def test_invalid_page_commands(self, monkeypatch, output):
+        """Test out-of-range and non-numeric pages are rejected without moving."""
+        selected = _select(monkeypatch, ["page 0", "page 4", "page x", "none"])
+        text = output.getvalue()
+
+        assert selected == []
+        assert text.count("Enter a page between 1 and 3") == 2
+        assert "Use 'page N'" in text
+        assert "page 2/3" not in text
+
+    def test_more_stops_at_last_page(self, monkeypatch, output):
+        """Test 'more' walks forward and reports the end."""
+        _select(monkeypatch, ["more", "more", "more", "none"])
+        text = output.getvalue()
+
+        assert "page 2/3" in text and "page 3/3" in text
+        assert "No more transcripts" in text
+
+    def test_selection_on_later_page(self, monkeypatch, output):
+        """Test a number picked from a later page maps to that row's meeting."""
+        rows = _rows()
+
+        selected = _select(monkeypatch, ["page 3", "52,27"])
+
+        assert [t.meeting_id for t in selected] == [rows[51][0].meeting_id, rows[26][0].meeting_id]
+        assert rows[51][0].title in output.getvalue()
+
+
+class TestConsoleWrapping:
+    """Test the shared Console keeps wrapping panel content."""
+
+    def test_preview_panel_wraps(self, monkeypatch):
+        """Test a long report paragraph wraps inside the preview panel."""
+        buffer = io.StringIO()
+        console = interactive.console
+        monkeypatch.setattr(console, "file", buffer)
+        monkeypatch.setattr(console, "width", 60)
+
+        console.print(interactive.Panel("word " * 40, height=22))
+
+        assert buffer.getvalue().count("word") == 40
@@ -0,0 +1,55 @@
+"""
+Unit tests for utils/jira_cache.py
+
+Run with: pytest tests/test_jira_cache.py -v
+"""
+
+import json
+import time
+
+from utils.jira_cache import make_key, latest_update, get_cached, put_cached
+
+
+SAMPLE_ISSUES = [
+    {"key": "BOPS-1", "fields": {"summary": "First", "updated": "2024-12-10T15:00:00.000+0000"}},
+    {"key": "BOPS-2", "fields": {"summary": "Second", "updated": "2024-12-12T09:30:00.000+0000"}},
+    {"key": "BOPS-3", "fields": {"summary": "Third"}}
+]
+
+
+class TestJiraCache:
+    """Test JIRA issue listing cache."""
+
+    def test_key_depends_on_site_sprint_and_board(self):
+        """Test cache key separates JIRA sites, sprints and boards."""
+        site = "https://a.atlassian.net"
+        assert make_key(site, "123", 42) == make_key(site + "/", 123, 42)
+        assert make_key(site, "123", 42) != make_key(site, "124", 42)
+        assert make_key(site, "123", 42) != make_key(site, "123", 43)
+        assert make_key(site, "123", 42) != make_key("https://b.atlassian.net", "123", 42)
+
+    def test_latest_update_skips_missing(self):
+        """Test newest timestamp ignores issues without one."""
+        assert latest_update(SAMPLE_ISSUES) == "2024-12-12T09:30:00.000+0000"
+        assert latest_update([]) is None
+
+    def test_round_trip_keeps_fingerprint(self, tmp_path):
+        """Test stored issues come back with their fingerprint."""
+        put_cached("abc", SAMPLE_ISSUES, [3, "2024-12-12T09:30:00.000+0000"], cache_dir=tmp_path)
+
+        entry = get_cached("abc", cache_dir=tmp_path)
+        assert entry["issues"] == SAMPLE_ISSUES
+        assert entry["fingerprint"] == [3, "2024-12-12T09:30:00.000+0000"]
+
+    def test_miss_when_expired(self, tmp_path):
+        """Test entries older than the TTL are ignored."""
+        entry = {"cached_at": time.time() - 7200, "fingerprint": [0, None], "issues": []}
+        (tmp_path / "old.json").write_text(json.dumps(entry))
+
+        assert get_cached("old", ttl_seconds=3600, cache_dir=tmp_path) is None
+
+    def test_miss_when_corrupt(self, tmp_path):
+        """Test unreadable entries are treated as a miss."""
+        (tmp_path / "bad.json").write_text("{not json")
+
+        assert get_cached("bad", cache_dir=tmp_path) is None
@@ -0,0 +1,392 @@
+"""
+Unit tests for cli/jira_mcp.py JSON-RPC transport
+
+The MCP server is replaced by a small Python script speaking JSON-RPC on
+stdio, started in place of `docker run` / `docker exec`.
+
+Run with: pytest tests/test_jira_mcp.py -v
+"""
+
+import subprocess
+import sys
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from cli import jira_mcp
+from cli.jira_mcp import JiraMCPClient
+
+
+FAKE_SERVER = r'''
+import json
+import os
+import sys
+import time
+
+mode, marker = sys.argv[1], sys.argv[2]
+out = sys.stdout.buffer
+held = []
+
+
+def send(message):
+    out.write(json.dumps(message).encode("utf-8") + b"\n")
+    out.flush()
+
+
+def result(request):
+    text = json.dumps({"tool": request["params"]["name"], "id": request["id"]})
+    return {
+        "jsonrpc": "2.0",
+        "id": request["id"],
+        "result": {"content": [{"type": "text", "text": text}]}
+    }
+
+
+for line in sys.stdin:
+    request = json.loads(line)
+    if "id" not in request:
+        continue  # notifications/initialized
+    if request["method"] == "initialize":
+        send({"jsonrpc": "2.0", "id": request["id"], "result": {}})
+        continue
+
+    if mode == "exit_once" and not os.path.exists(marker):
+        # Container stopped underneath the session (first start only)
+        open(marker, "w").close()
+        sys.exit(0)
+    if mode == "exit":
+        sys.exit(0)
+    if mode == "hang":
+        continue
+
+    if mode == "reverse":
+        # Hold a batch of three, then answer it last-first
+        held.append(request)
+        if len(held) == 3:
+            for request in reversed(held):
+                send(result(request))
+            held = []
+    elif mode == "split":
+        # Log noise, then each frame in two writes with a pause between
+        out.write(b"INFO starting tool\n")
+        frame = json.dumps(result(request)).encode("utf-8") + b"\n"
+        out.write(frame[:10])
+        out.flush()
+        time.sleep(0.05)
+        out.write(frame[10:])
+        out.flush()
+    else:
+        send(result(request))
+'''
+
+
+@pytest.fixture
+def fake_server(tmp_path, monkeypatch):
+    """Route the client's docker commands to the fake MCP server.
+
+    Returns a function taking the server mode; it records every server start
+    in the returned list.
+    """
+    script = tmp_path / "fake_mcp.py"
+    script.write_text(FAKE_SERVER)
+    marker = tmp_path / "marker"
+    starts = []
+    real_popen = subprocess.Popen
+
+    def use_mode(mode):
+        def fake_popen(cmd, **kwargs):
+            if cmd[:3] in (["docker", "run", "-i"], ["docker", "exec", "-i"]):
+                starts.append(cmd)
+                cmd = [sys.executable, str(script), mode, str(marker)]
+            else:
+                cmd = [sys.executable, "-c", ""]  # e.g. `docker rm -f` cleanup
+            return real_popen(cmd, **kwargs)
+
+        monkeypatch.setattr(jira_mcp.subprocess, "Popen", fake_popen)
+        return starts
+
+    monkeypatch.setattr(JiraMCPClient, "_docker_ok", True)
+    monkeypatch.setattr(JiraMCPClient, "_prewarmed_container", lambda self: None)
+    monkeypatch.setattr(JiraMCPClient, "_ensure_shared_container", lambda self: None)
+    monkeypatch.setattr(jira_mcp.time, "sleep", lambda seconds: None)
+    return use_mode
+
+
+@pytest.fixture
+def client():
+    """JIRA MCP client with valid-looking settings and no disk cache."""
+    mcp = JiraMCPClient(
+        "https://example.atlassian.net", "user@example.com", "token",
+        use_disk_cache=False
+    )
+    yield mcp
+    mcp.close()
+
+
+class FakeStdout:
+    """Pipe stand-in whose read1() returns preset chunks, then EOF."""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def read1(self, size):
+        return self.chunks.pop(0) if self.chunks else b""
+
+
+class TestReaderThread:
+    """Test routing of stdout frames to pending futures."""
+
+    def test_frames_split_across_reads(self, client):
+        """Test frames cut at arbitrary chunk boundaries still resolve."""
+        pending = {5: Future(), 6: Future()}
+        stdout = FakeStdout([
+            b'{"jsonrpc": "2.0", "id": 5, "res',
+            b'ult": {"n": 1}}\nlog line without json\n{"jsonrpc": "2.0",',
+            b' "id": 6, "result": {"n": 2}}',
+            b'\n'
+        ])
+
+        client._reader_loop(stdout, pending)
+
+        assert pending == {}
+
+    def test_eof_fails_unanswered(self, client):
+        """Test EOF fails the futures still waiting instead of leaving them hanging."""
+        answered, unanswered = Future(), Future()
+        pending = {5: answered, 6: unanswered}
+
+        client._reader_loop(FakeStdout([b'{"jsonrpc": "2.0", "id": 5, "result": {}}\n']), pending)
+
+        assert answered.result() == {"jsonrpc": "2.0", "id": 5, "result": {}}
+        with pytest.raises(jira_mcp.JiraMCPError):
+            unanswered.result(timeout=0)
+
+
+class TestPipelinedBatch:
+    """Test pipelined tool calls against a fake MCP server."""
+
+    CALLS = [("jira_get_sprint", {"n": 1}), ("jira_search", {"n": 2}), ("jira_get_issue", {"n": 3})]
+
+    def test_out_of_order_responses(self, fake_server, client):
+        """Test results come back in call order when the server answers in reverse."""
+        fake_server("reverse")
+
+        results = client._call_mcp_tools_batch(self.CALLS)
+
+        assert [result["tool"] for result in results] == [tool for tool, _ in self.CALLS]
+        assert results[0]["id"] < results[1]["id"] < results[2]["id"]
+
+    def test_split_frames_and_log_noise(self, fake_server, client):
+        """Test partial frames across reads and non-JSON lines are handled."""
+        fake_server("split")
+
+        results = client._call_mcp_tools_batch(self.CALLS)
+
+        assert [result["tool"] for result in results] == [tool for tool, _ in self.CALLS]
+
+    def test_server_exit_fails_fast(self, fake_server, client):
+        """Test a server exiting mid-batch fails the call well before the timeout."""
+        starts = fake_server("exit")
+
+        started = time.monotonic()
+        with pytest.raises(jira_mcp.JiraMCPError, match="after restart"):
+            client._call_mcp_tools_batch(self.CALLS)
+
+        assert time.monotonic() - started < 10
+        assert len(starts) == 2  # One restart, then give up
+
+    def test_restart_loop_is_bounded(self, fake_server, client, monkeypatch):
+        """Test repeated timeouts restart the server once and then give up."""
+        starts = fake_server("hang")
+        monkeypatch.setattr(JiraMCPClient, "_TOOL_CALL_TIMEOUT_SECONDS", 0.2)
+
+        # First timeout only counts the failure
+        with pytest.raises(jira_mcp.JiraMCPError, match="timeout"):
+            client._call_mcp_tools_batch(self.CALLS[:1])
+        assert len(starts) == 1
+
+        # Second reaches the threshold: one restart and retry, no recursion
+        with pytest.raises(jira_mcp.JiraMCPError, match="timeout"):
+            client._call_mcp_tools_batch(self.CALLS[:1])
+        assert len(starts) == 2
+
+
+class TestContainerRestart:
+    """Test recovery when the MCP server process exits."""
+
+    def test_shared_container_exit_recreates_and_retries(self, fake_server):
+        """Test a server killed mid-call is restarted and the call retried once."""
+        starts = fake_server("exit_once")
+        client = JiraMCPClient(
+            "https://example.atlassian.net", "user@example.com", "token",
+            reuse_container=True, use_disk_cache=False
+        )
+        try:
+            results = client._call_mcp_tools_batch([("jira_get_sprint", {"sprint_id": 1})])
+        finally:
+            client.close()
+
+        assert results[0]["tool"] == "jira_get_sprint"
+        assert len(starts) == 2
+        assert starts[0][:2] == ["docker", "exec"]
+
+
+class TestSprintIssueCache:
+    """Test the on-disk sprint issue cache."""
+
+    PROBE = {"total": 1, "issues": [{"key": "PROJ-1", "updated": "2024-12-12T09:30:00.000+0000"}]}
+    ISSUES = {"issues": [{
+        "key": "PROJ-1", "summary": "Ship it", "status": {"name": "Done"},
+        "assignee": None, "issue_type": {"name": "Story"}, "story_points": 3
+    }]}
+
+    def _client(self, monkeypatch, probe):
+        """Client whose MCP calls are answered in memory and recorded."""
+        client = JiraMCPClient("https://example.atlassian.net", "user@example.com", "token")
+        calls = []
+
+        def batch(calls_in_batch):
+            calls.append([tool for tool, _ in calls_in_batch])
+            return [probe if tool == "jira_search" else self.ISSUES for tool, _ in calls_in_batch]
+
+        monkeypatch.setattr(client, "_call_mcp_tools_batch", batch)
+        monkeypatch.setattr(client, "_call_mcp_tool", lambda tool, args: batch([(tool, args)])[0])
+        return client, calls
+
+    def test_miss_pipelines_probe_with_fetch(self, monkeypatch, tmp_path):
+        """Test a cold cache costs one batch and then serves from disk."""
+        client, calls = self._client(monkeypatch, self.PROBE)
+
+        first = client.get_sprint_issues_cached(7, board_id=38, cache_dir=tmp_path)
+        second = client.get_sprint_issues_cached(7, board_id=38, cache_dir=tmp_path)
+
+        assert calls == [["jira_search", "jira_get_sprint_issues"], ["jira_search"]]
+        assert first == second
+        assert second[0].key == "PROJ-1" and second[0].story_points == 3
+
+    def test_changed_sprint_refetches(self, monkeypatch, tmp_path):
+        """Test a fingerprint mismatch triggers a full fetch."""
+        client, calls = self._client(monkeypatch, self.PROBE)
+        client.get_sprint_issues_cached(7, board_id=38, cache_dir=tmp_path)
+
+        changed, calls = self._client(monkeypatch, {**self.PROBE, "total": 2})
+        changed.get_sprint_issues_cached(7, board_id=38, cache_dir=tmp_path)
+
+        assert calls == [["jira_search"], ["jira_get_sprint_issues"]]
+
+    def test_other_site_does_not_share_entries(self, monkeypatch, tmp_path):
+        """Test the same sprint ID on another JIRA site misses the cache."""
+        client, calls = self._client(monkeypatch, self.PROBE)
+        client.get_sprint_issues_cached(7, board_id=38, cache_dir=tmp_path)
+
+        other, calls = self._client(monkeypatch, self.PROBE)
+        other.jira_url = "https://other.atlassian.net"
+        other.get_sprint_issues_cached(7, board_id=38, cache_dir=tmp_path)
+
+        assert calls == [["jira_search", "jira_get_sprint_issues"]]
+
+    def test_disabled_by_no_cache(self, monkeypatch, tmp_path):
+        """Test use_disk_cache=False skips the probe and the cache."""
+        client, calls = self._client(monkeypatch, self.PROBE)
+        client.use_disk_cache = False
+
+        client.get_sprint_issues_cached(7, board_id=38, cache_dir=tmp_path)
+
+        assert calls == [["jira_get_sprint_issues"]]
+        assert not list(tmp_path.iterdir())
+
+
+class TestConnectionCache:
+    """Test the on-disk record of successful connection checks."""
+
+    def test_token_never_written(self, monkeypatch, tmp_path):
+        """Test the cache file holds a digest, not the credentials."""
+        cache = tmp_path / "mcp_connection.json"
+        monkeypatch.setattr(jira_mcp, "CONNECTION_CACHE", cache)
+        client = JiraMCPClient("https://example.atlassian.net", "user@example.com", "s3cret-token")
+
+        client._record_connection_ok()
+
+        assert "s3cret-token" not in cache.read_text()
+        assert client._connection_recently_verified()
+
+    def test_new_token_is_rechecked(self, monkeypatch, tmp_path):
+        """Test a different token for the same account misses the cache."""
+        monkeypatch.setattr(jira_mcp, "CONNECTION_CACHE", tmp_path / "mcp_connection.json")
+        JiraMCPClient("https://example.atlassian.net", "user@example.com", "old")._record_connection_ok()
+
+        client = JiraMCPClient("https://example.atlassian.net", "user@example.com", "new")
+
+        assert not client._connection_recently_verified()
+
+
+class TestWarmup:
+    """Test the background container warm-up."""
+
+    def test_warmup_runs_on_daemon_thread(self, monkeypatch):
+        """Test the warm-up never holds up interpreter exit."""
+        client = JiraMCPClient("https://example.atlassian.net", "user@example.com", "token")
+        seen = []
+        monkeypatch.setattr(
+            client, "_ensure_container_running",
+            lambda: seen.append(jira_mcp.threading.current_thread().daemon)
+        )
+
+        client.start_warmup().result(timeout=5)
+
+        assert seen == [True]
+
+    def test_warmup_failure_is_reported_through_future(self, monkeypatch):
+        """Test a failed start surfaces on the returned future."""
+        client = JiraMCPClient("https://example.atlassian.net", "user@example.com", "token")
+
+        def fail():
+            raise jira_mcp.JiraMCPError("Docker daemon unreachable")
+
+        monkeypatch.setattr(client, "_ensure_container_running", fail)
+
+        with pytest.raises(jira_mcp.JiraMCPError, match="unreachable"):
+            client.start_warmup().result(timeout=5)
+
+
+class TestResultCache:
+    """Test the in-process TTL cache of MCP tool results."""
+
+    def _client(self, monkeypatch, clock):
+        """Client with a fake clock whose MCP calls are counted."""
+        client = JiraMCPClient("https://example.atlassian.net", "user@example.com", "token")
+        calls = []
+
+        def batch(calls_in_batch):
+            calls.append([tool for tool, _ in calls_in_batch])
+            return [{"issues": []} for _ in calls_in_batch]
+
+        monkeypatch.setattr(client, "_call_mcp_tools_batch", batch)
+        monkeypatch.setattr(jira_mcp.time, "monotonic", lambda: clock[0])
+        return client, calls
+
+    def test_sprint_lookup_outlives_search_ttl(self, monkeypatch):
+        """Test get_sprint_by_id() results are kept for the sprint TTL, not jira_search's."""
+        clock = [1000.0]
+        client, calls = self._client(monkeypatch, clock)
+
+        client.get_sprint_by_id(7)
+        clock[0] += 120  # Past jira_search's 60s, within the 600s sprint TTL
+        client.get_sprint_by_id(7)
+        assert len(calls) == 1
+
+        clock[0] += 600
+        client.get_sprint_by_id(7)
+        assert len(calls) == 2
+
+    def test_search_keeps_tool_ttl(self, monkeypatch):
+        """Test other jira_search calls still expire after the tool TTL."""
+        clock = [1000.0]
+        client, calls = self._client(monkeypatch, clock)
+
+        client._call_mcp_tool("jira_search", {"jql": "sprint = 7"})
+        clock[0] += 120
+        client._call_mcp_tool("jira_search", {"jql": "sprint = 7"})
+
+        assert len(calls) == 2
@@ -0,0 +1,86 @@
+"""
+Unit tests for the draft PDF handling in cli/main.py
+
+Run with: pytest tests/test_main_pdf.py -v
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from cli.main import _finish_pdf
+
+
+PDF_OPTIONS = {
+    "template_name": "csg_sprint_report_template.html",
+    "metadata": {"sprint_name": "Sprint 42"}
+}
+
+
+def _fake_render(markdown_content, output_path, **kwargs):
+    """Stand-in for generate_pdf_from_markdown that writes PDF and HTML."""
+    output_path.write_text(markdown_content)
+    output_path.with_suffix(".html").write_text(markdown_content)
+    return output_path
+
+
+class TestFinishPdf:
+    """Test promoting or re-rendering the background draft PDF."""
+
+    def _start_draft(self, render, markdown, draft_path):
+        """Render the draft on a worker thread, as main() does."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(
+            render, markdown_content=markdown, output_path=draft_path, **PDF_OPTIONS
+        )
+        executor.shutdown(wait=True)
+        return future
+
+    def test_unchanged_report_promotes_draft(self, tmp_path):
+        """Test the draft becomes the final PDF without a second render."""
+        render = Mock(side_effect=_fake_render)
+        pdf_path = tmp_path / "report.pdf"
+        draft_path = pdf_path.with_suffix(".draft.pdf")
+        future = self._start_draft(render, "# Report", draft_path)
+
+        promoted = _finish_pdf(render, future, draft_path, pdf_path,
+                               "# Report", "# Report", PDF_OPTIONS)
+
+        assert promoted is True
+        assert render.call_count == 1
+        assert render.call_args.kwargs["template_name"] == "csg_sprint_report_template.html"
+        assert pdf_path.read_text() == "# Report"
+        assert pdf_path.with_suffix(".html").exists()
+        assert not draft_path.exists()
+
+    def test_edited_report_is_rerendered(self, tmp_path):
+        """Test an edit discards the draft and renders the final content."""
+        render = Mock(side_effect=_fake_render)
+        pdf_path = tmp_path / "report.pdf"
+        draft_path = pdf_path.with_suffix(".draft.pdf")
+        future = self._start_draft(render, "# Report", draft_path)
+
+        promoted = _finish_pdf(render, future, draft_path, pdf_path,
+                               "# Report", "# Edited", PDF_OPTIONS)
+
+        assert promoted is False
+        assert render.call_count == 2
+        final_call = render.call_args.kwargs
+        assert final_call["output_path"] == pdf_path
+        assert final_call["markdown_content"] == "# Edited"
+        assert final_call["metadata"] == PDF_OPTIONS["metadata"]
+        assert pdf_path.read_text() == "# Edited"
+        assert not draft_path.exists()
+        assert not draft_path.with_suffix(".html").exists()
+
+    def test_failed_draft_is_rerendered(self, tmp_path):
+        """Test a draft render error falls back to a foreground render."""
+        render = Mock(side_effect=[RuntimeError("boom"), None])
+        pdf_path = tmp_path / "report.pdf"
+        draft_path = pdf_path.with_suffix(".draft.pdf")
+        future = self._start_draft(render, "# Report", draft_path)
+
+        promoted = _finish_pdf(render, future, draft_path, pdf_path,
+                               "# Report", "# Report", PDF_OPTIONS)
+
+        assert promoted is False
+        assert render.call_count == 2
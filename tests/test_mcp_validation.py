@@ -0,0 +1,78 @@
+"""
+Unit tests for issue parsing in utils/mcp_validation.py
+
+Run with: pytest tests/test_mcp_validation.py -v
+"""
+
+from utils.mcp_validation import parse_issue_data, parse_issue_list
+
+
+def _issue(key, **fields):
+    """Build a raw MCP issue dictionary."""
+    issue = {
+        "key": key,
+        "summary": f"Summary of {key}",
+        "status": {"name": "In Progress"},
+        "assignee": {"display_name": "Jane Doe"},
+        "issue_type": {"name": "Story"},
+        "story_points": 3
+    }
+    issue.update(fields)
+    return issue
+
+
+class TestParseIssueData:
+    """Test flattening of nested MCP issue fields."""
+
+    def test_nested_objects_flattened(self):
+        """Test status, assignee and issue type become plain names."""
+        issue = parse_issue_data(_issue("PROJ-1"))
+
+        assert (issue.status, issue.assignee, issue.issue_type) == ("In Progress", "Jane Doe", "Story")
+
+    def test_null_names_stay_none(self):
+        """Test objects with a null name are not rejected."""
+        issue = parse_issue_data(_issue(
+            "PROJ-1",
+            status={"name": None},
+            assignee={"display_name": None},
+            issue_type={"name": None}
+        ))
+
+        assert issue is not None
+        assert (issue.status, issue.assignee, issue.issue_type) == (None, None, None)
+
+    def test_defaults_for_missing_names(self):
+        """Test the fallbacks for missing or non-object fields."""
+        issue = parse_issue_data(_issue("PROJ-1", status={}, assignee={}, issue_type="Bug"))
+
+        assert (issue.status, issue.assignee, issue.issue_type) == ("Unknown", None, "Task")
+        assert parse_issue_data(_issue("PROJ-1", status="Done")).status == "Done"
+
+
+class TestParseIssueList:
+    """Test list validation with per-item fallback."""
+
+    def test_valid_list(self):
+        """Test every valid issue is returned in input order."""
+        issues = parse_issue_list([_issue("PROJ-1"), _issue("PROJ-2"), _issue("PROJ-3")])
+
+        assert [issue.key for issue in issues] == ["PROJ-1", "PROJ-2", "PROJ-3"]
+        assert issues[0].status == "In Progress"
+
+    def test_invalid_item_skipped(self):
+        """Test one invalid issue is dropped and the rest are kept."""
+        issues = parse_issue_list([
+            _issue("PROJ-1"),
+            _issue("not-a-key"),
+            _issue("PROJ-3", summary=""),
+            _issue("PROJ-4", status={"name": None})
+        ])
+
+        assert [issue.key for issue in issues] == ["PROJ-1", "PROJ-4"]
+        assert issues[1].status is None
+
+    def test_non_list_input(self):
+        """Test a non-list payload yields no issues."""
+        assert parse_issue_list({"issues": []}) == []
+        assert parse_issue_list([]) == []
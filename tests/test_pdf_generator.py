@@ -0,0 +1,81 @@
+"""
+Unit tests for the template shell cache in services/pdf_generator.py
+
+Run with: pytest tests/test_pdf_generator.py -v
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from services import pdf_generator
+from services.pdf_generator import _get_static_shell, render_report_template
+
+
+TEMPLATE = "csg_sprint_report_template.html"
+METADATA = {
+    "sprint_name": "Sprint 42",
+    "sprint_id": 42,
+    "team_name": "Platform Team",
+    "generated_date": "2026-01-05"
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_shell_cache():
+    """Start each test with an empty shell cache."""
+    pdf_generator._STATIC_SHELL_CACHE.clear()
+    yield
+    pdf_generator._STATIC_SHELL_CACHE.clear()
+
+
+class TestStaticShell:
+    """Test reusing the rendered template around the report content."""
+
+    def test_shell_matches_full_render_with_metadata(self):
+        """Test shell + content equals a normal render with the same metadata."""
+        content = "<p>Body</p>"
+        head, tail = _get_static_shell(TEMPLATE, METADATA)
+
+        expected = render_report_template(
+            template_name=TEMPLATE,
+            report_content=content,
+            metadata=METADATA,
+            is_markdown=False
+        )
+        assert head + content + tail == expected
+        assert "Sprint 42" in head
+
+    def test_repeat_metadata_skips_rendering(self):
+        """Test a second lookup with equal metadata reuses the cached shell."""
+        first = _get_static_shell(TEMPLATE, METADATA)
+
+        with patch.object(pdf_generator, "render_report_template") as render:
+            second = _get_static_shell(TEMPLATE, dict(METADATA))
+
+        render.assert_not_called()
+        assert second == first
+
+    def test_different_metadata_gets_own_shell(self):
+        """Test metadata changes produce a separately rendered shell."""
+        first = _get_static_shell(TEMPLATE, METADATA)
+        second = _get_static_shell(TEMPLATE, {**METADATA, "sprint_name": "Sprint 43"})
+
+        assert "Sprint 43" in second[0]
+        assert second != first
+
+    def test_time_dependent_template_not_cached(self):
+        """Test templates printing the generation date always re-render."""
+        assert _get_static_shell("report_template.html", METADATA) is None
+
+    def test_unserializable_metadata_not_cached(self):
+        """Test metadata that cannot be keyed falls back to a normal render."""
+        assert _get_static_shell(TEMPLATE, {"sprint_name": object()}) is None
+
+    def test_cache_is_bounded(self):
+        """Test the oldest shells are evicted past the entry limit."""
+        limit = pdf_generator._STATIC_SHELL_MAX_ENTRIES
+        for sprint_id in range(limit + 5):
+            _get_static_shell(TEMPLATE, {**METADATA, "sprint_id": sprint_id})
+
+        assert len(pdf_generator._STATIC_SHELL_CACHE) == limit
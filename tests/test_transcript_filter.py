@@ -0,0 +1,77 @@
+"""
+Unit tests for cli/transcript_filter.py
+
+Run with: pytest tests/test_transcript_filter.py -v
+"""
+
+import pytest
+
+from cli.transcript_filter import filter_transcripts_smart, get_transcript_display_index
+
+
+TITLES = [
+    "iBOPS Sprint Planning",
+    "IBOBS retro",
+    "C++ build review",
+    "c+ quick sync",
+    "Release v1.2 (hotfix)",
+    "Release v1x2 hotfix",
+    "[Q4] roadmap",
+    "Costs $ review",
+    "Team Sync",
+    "bop-it session",
+    "",
+]
+
+
+def _substring_matches(titles, search_terms):
+    """Reference matcher: the per-term lowercase substring scan."""
+    terms = [term.lower() for term in search_terms]
+    return [title for title in titles if any(term in title.lower() for term in terms)]
+
+
+class TestTitleMatching:
+    """Test the compiled title pattern against the substring scan."""
+
+    @pytest.mark.parametrize("search_terms", [
+        ["ibobs", "ibops", "ibop", "ibob"],
+        ["c++", "v1.2", "(hotfix)", "[q4]", "$"],
+        ["c+", "C++"],
+        ["bop", "ibop", "ibops", "BOP"],
+        ["sync", "team sync", "Sync"],
+        [".", "*"],
+        [],
+    ])
+    def test_matches_substring_scan(self, search_terms):
+        """Test metacharacters and overlapping terms match the same titles."""
+        transcripts = [{"id": str(i), "title": title} for i, title in enumerate(TITLES)]
+
+        filtered = filter_transcripts_smart(transcripts, search_terms)
+
+        assert [t.title for t in filtered["high_confidence"]] == _substring_matches(TITLES, search_terms)
+
+
+class TestDisplayIndex:
+    """Test display index lookups."""
+
+    def test_index_by_meeting_id(self):
+        """Test equal transcripts built separately resolve to the same index."""
+        transcripts = [
+            {"id": "m1", "title": "Team Sync"},
+            {"id": "m2", "title": "IBOPS review"},
+        ]
+        filtered = filter_transcripts_smart(transcripts)
+        refetched = filter_transcripts_smart([dict(t) for t in transcripts])
+
+        assert get_transcript_display_index(refetched["other"][0], filtered) == 2
+        assert get_transcript_display_index(filtered["high_confidence"][0], filtered) == 1
+
+    def test_duplicate_ids_use_position(self):
+        """Test transcripts sharing an id still get their own index."""
+        transcripts = [
+            {"title": "Team Sync", "date": "2024-12-01"},
+            {"title": "Daily Standup", "date": "2024-12-02"},
+        ]
+        filtered = filter_transcripts_smart(transcripts)
+
+        assert [get_transcript_display_index(t, filtered) for t in filtered["_flat"]] == [1, 2]
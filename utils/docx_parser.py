@@ -16,6 +16,7 @@ Example:
 """
 
 import logging
+import functools
 from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 from docx import Document
@@ -82,6 +83,25 @@ def parse_sprint_guide(docx_path: str) -> str:
         logger.error(error_msg)
         raise DOCXParsingError(error_msg)
 
+    # Parsed once per file version; editing the guide changes its mtime
+    return _parse_sprint_guide_cached(str(docx_file.resolve()), docx_file.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_sprint_guide_cached(docx_path: str, mtime_ns: int) -> str:
+    """
+    Parse a DOCX guide, memoized by path and modification time.
+
+    Args:
+        docx_path: Absolute path to DOCX file
+        mtime_ns: File modification time (cache key only)
+
+    Returns:
+        Plain text content with preserved structure
+
+    Raises:
+        DOCXParsingError: If file is not a valid DOCX or parsing fails
+    """
     try:
         # Load document
         doc = Document(docx_path)
@@ -0,0 +1,138 @@
+"""
+On-disk cache for Fathom meeting lists.
+
+Re-running the CLI while iterating on a report re-queries the same Fathom
+date window every time. This module stores the meeting list as JSON under
+the user cache directory so repeat runs within the TTL skip the HTTPS
+round trip entirely.
+
+Usage:
+    from utils.fathom_cache import make_key, get_cached, put_cached
+
+    key = make_key('2024-12-01', '2024-12-14', ['ibops'])
+    meetings = get_cached(key)
+    if meetings is None:
+        meetings = project_meetings(fathom_client.list_meetings(...))
+        put_cached(key, meetings)
+"""
+import json
+import time
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_DIR = Path.home() / '.cache' / 'sprint-report' / 'fathom'
+DEFAULT_TTL_SECONDS = 3600
+
+# Only the fields transcript filtering and report generation read
+CACHED_FIELDS = ('id', 'recording_id', 'title', 'date', 'created_at', 'summary')
+
+
+def make_key(start_date: str, end_date: str, search_terms: List[str]) -> str:
+    """Build a cache key for a meeting query.
+
+    Args:
+        start_date: Query start date
+        end_date: Query end date
+        search_terms: Transcript search terms (order-insensitive)
+
+    Returns:
+        Hex digest identifying the query
+
+    Examples:
+        >>> make_key('2024-12-01', '2024-12-14', ['b', 'a']) == make_key('2024-12-01', '2024-12-14', ['a', 'b'])
+        True
+    """
+    raw = f"{start_date}|{end_date}|{','.join(sorted(search_terms or []))}"
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def project_meetings(meetings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reduce meetings to CACHED_FIELDS.
+
+    Applied to fresh results as well as cached ones, so callers see the same
+    fields whether or not the cache was hit.
+
+    Args:
+        meetings: Meeting dictionaries from FathomClient.list_meetings()
+
+    Returns:
+        New meeting dictionaries holding only CACHED_FIELDS
+
+    Examples:
+        >>> project_meetings([{'id': 'm1', 'title': 'Sync', 'transcript': '...'}])
+        [{'id': 'm1', 'title': 'Sync'}]
+    """
+    return [
+        {field: meeting[field] for field in CACHED_FIELDS if field in meeting}
+        for meeting in meetings
+    ]
+
+
+def get_cached(
+    key: str,
+    ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    cache_dir: Optional[Path] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """Return cached meetings for key, or None if missing or expired.
+
+    Args:
+        key: Cache key from make_key()
+        ttl_seconds: Maximum entry age in seconds
+        cache_dir: Cache directory (default: CACHE_DIR)
+
+    Returns:
+        List of meeting dictionaries, or None on a cache miss
+    """
+    path = (cache_dir or CACHE_DIR) / f"{key}.json"
+
+    try:
+        entry = json.loads(path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable Fathom cache entry {path}: {e}")
+        return None
+
+    if time.time() - entry.get('cached_at', 0) > ttl_seconds:
+        logger.debug(f"Fathom cache entry expired: {path}")
+        return None
+
+    meetings = entry.get('meetings')
+    if not isinstance(meetings, list):
+        return None
+
+    logger.info(f"Using cached Fathom meetings ({len(meetings)} meetings)")
+    return meetings
+
+
+def put_cached(
+    key: str,
+    meetings: List[Dict[str, Any]],
+    cache_dir: Optional[Path] = None
+) -> None:
+    """Store meetings under key (failures are logged, never raised).
+
+    Only CACHED_FIELDS are kept (see project_meetings()) so entries stay
+    small.
+
+    Args:
+        key: Cache key from make_key()
+        meetings: Meeting dictionaries from FathomClient.list_meetings()
+        cache_dir: Cache directory (default: CACHE_DIR)
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    entry = {
+        'cached_at': time.time(),
+        'meetings': project_meetings(meetings)
+    }
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / f"{key}.json").write_text(json.dumps(entry), encoding='utf-8')
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write Fathom cache: {e}")
@@ -0,0 +1,61 @@
+"""
+Transient-failure retries for the JIRA and Fathom HTTP sessions.
+
+Mounts a urllib3 Retry policy on a requests.Session so connection errors,
+rate limits (429) and 5xx responses on GET requests are retried with
+exponential backoff, honoring Retry-After. Permanent errors (400, 401, 403,
+404) are returned immediately and handled by the client as before.
+
+Usage:
+    from utils.http_retry import mount_retries
+
+    session = requests.Session()
+    mount_retries(session)
+"""
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def mount_retries(
+    session: requests.Session,
+    total: int = 3,
+    backoff_factor: float = 1.0
+) -> None:
+    """Retry transient failures on every request made through session.
+
+    After the last attempt the final response is returned rather than
+    raised, so the client's own status-code handling still applies.
+
+    Args:
+        session: Session to configure
+        total: Maximum retries per request
+        backoff_factor: Base delay in seconds (doubles each retry)
+    """
+    retry_kwargs = dict(
+        total=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({'GET'}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+    try:
+        # Random jitter keeps concurrent jobs from retrying in lockstep
+        retry = Retry(backoff_jitter=backoff_factor, **retry_kwargs)
+    except TypeError:
+        # urllib3 < 2.0 has no jitter option
+        retry = Retry(**retry_kwargs)
+
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    logger.debug(f"Mounted HTTP retries (total={total}, backoff={backoff_factor}s)")
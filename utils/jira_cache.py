@@ -0,0 +1,135 @@
+"""
+On-disk cache for JIRA sprint issue listings.
+
+Iterating on report formatting re-runs the same sprint many times, and each
+run re-downloads every page of the sprint's issues. This module stores the
+issue list as JSON under the user cache directory together with the issue
+count and newest 'updated' timestamp, so a single cheap probe request can
+confirm the cached copy is still current.
+
+Usage:
+    from utils.jira_cache import make_key, get_cached, put_cached
+
+    key = make_key('https://company.atlassian.net', '123', board_id=42)
+    entry = get_cached(key)
+    if entry is None or entry['fingerprint'] != current_fingerprint:
+        issues = jira_client.get_sprint_issues('123')
+        put_cached(key, issues, current_fingerprint)
+"""
+import json
+import time
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_DIR = Path.home() / '.cache' / 'sprint-report' / 'jira'
+DEFAULT_TTL_SECONDS = 3600
+
+
+def make_key(base_url: str, sprint_id: str, board_id: Optional[int] = None) -> str:
+    """Build a cache key for a sprint's issue listing.
+
+    The cache directory is shared by every JIRA site the user talks to, so
+    the site URL is part of the key (sprint IDs are only unique per site).
+
+    Args:
+        base_url: JIRA instance URL
+        sprint_id: Sprint ID
+        board_id: Board ID, if known
+
+    Returns:
+        Hex digest identifying the listing
+
+    Examples:
+        >>> make_key('https://a.atlassian.net', '123', 42) == make_key('https://a.atlassian.net/', 123, 42)
+        True
+        >>> make_key('https://a.atlassian.net', '123') == make_key('https://b.atlassian.net', '123')
+        False
+    """
+    raw = f"{base_url.rstrip('/').lower()}|{sprint_id}|{board_id or ''}"
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def latest_update(issues: List[Dict[str, Any]]) -> Optional[str]:
+    """Return the newest 'updated' timestamp among issues, if any.
+
+    Args:
+        issues: Issue dictionaries from the JIRA REST API
+
+    Returns:
+        ISO timestamp string, or None if no issue carries one
+    """
+    stamps = [
+        issue.get('fields', {}).get('updated')
+        for issue in issues
+    ]
+    stamps = [stamp for stamp in stamps if stamp]
+    return max(stamps) if stamps else None
+
+
+def get_cached(
+    key: str,
+    ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    cache_dir: Optional[Path] = None
+) -> Optional[Dict[str, Any]]:
+    """Return the cached entry for key, or None if missing or expired.
+
+    Args:
+        key: Cache key from make_key()
+        ttl_seconds: Maximum entry age in seconds
+        cache_dir: Cache directory (default: CACHE_DIR)
+
+    Returns:
+        Dict with 'issues' and 'fingerprint', or None on a cache miss
+    """
+    path = (cache_dir or CACHE_DIR) / f"{key}.json"
+
+    try:
+        entry = json.loads(path.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable JIRA cache entry {path}: {e}")
+        return None
+
+    if time.time() - entry.get('cached_at', 0) > ttl_seconds:
+        logger.debug(f"JIRA cache entry expired: {path}")
+        return None
+
+    if not isinstance(entry.get('issues'), list):
+        return None
+
+    return entry
+
+
+def put_cached(
+    key: str,
+    issues: List[Dict[str, Any]],
+    fingerprint: Any,
+    cache_dir: Optional[Path] = None
+) -> None:
+    """Store issues under key (failures are logged, never raised).
+
+    Args:
+        key: Cache key from make_key()
+        issues: Issue dictionaries from JiraClient.get_sprint_issues()
+        fingerprint: JSON-serializable value identifying this version of the
+            listing (e.g. [issue count, newest 'updated'])
+        cache_dir: Cache directory (default: CACHE_DIR)
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    entry = {
+        'cached_at': time.time(),
+        'fingerprint': fingerprint,
+        'issues': issues
+    }
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / f"{key}.json").write_text(json.dumps(entry), encoding='utf-8')
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write JIRA cache: {e}")
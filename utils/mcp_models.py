@@ -14,7 +14,7 @@ Usage:
     # Validate JIRA data
     sprint = SprintData.model_validate(sprint_data)
 """
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError, field_validator
 from typing import List, Optional, Any, Dict
 
 
@@ -136,15 +136,16 @@ class IssueData(BaseModel):
     Attributes:
         key: Issue key (e.g., "PROJ-123")
         summary: Issue title/summary
-        status: Issue status object or string
-        assignee: Assignee object (optional, may be null/unassigned)
-        issue_type: Issue type object or string
+        status: Status name (normalized from status object or string)
+        assignee: Assignee display name (None if unassigned)
+        issue_type: Issue type name (normalized from issue type object)
         story_points: Story points (optional, validated separately)
 
     Validation Rules:
         - key must match JIRA key pattern (PROJECT-NUMBER)
         - summary cannot be empty
-        - status/issue_type can be dict or string (flexible for MCP formats)
+        - status/assignee/issue_type accept the nested MCP objects and are
+          flattened to plain names during validation (a null name stays None)
 
     Note:
         story_points validation is handled separately by validate_story_points()
@@ -152,7 +153,28 @@ class IssueData(BaseModel):
     """
     key: str = Field(pattern=r"^[A-Z]+-\d+$")
     summary: str = Field(min_length=1)
-    status: Any  # Can be dict with 'name' or string (flexible)
-    assignee: Optional[Any] = None  # Can be dict with 'display_name' or null
-    issue_type: Any  # Can be dict with 'name' or string (flexible)
+    status: Optional[str]  # Input: dict with 'name' or string (flexible)
+    assignee: Optional[str] = None  # Input: dict with 'display_name' or null
+    issue_type: Optional[str]  # Input: dict with 'name' (anything else means 'Task')
     story_points: Optional[Any] = None  # Validated separately
+
+    @field_validator('status', mode='before')
+    @classmethod
+    def _status_name(cls, value: Any) -> Optional[str]:
+        if isinstance(value, dict):
+            return value.get('name', 'Unknown')
+        return None if value is None else str(value)
+
+    @field_validator('assignee', mode='before')
+    @classmethod
+    def _assignee_name(cls, value: Any) -> Optional[str]:
+        if isinstance(value, dict) and value:
+            return value.get('display_name')
+        return None
+
+    @field_validator('issue_type', mode='before')
+    @classmethod
+    def _issue_type_name(cls, value: Any) -> Optional[str]:
+        if isinstance(value, dict):
+            return value.get('name', 'Task')
+        return 'Task'
@@ -15,15 +15,24 @@ Usage:
 """
 import json
 import logging
-from typing import Any, Dict
-from pydantic import ValidationError
+from typing import Any, Dict, List, Optional
+from pydantic import TypeAdapter, ValidationError
 
 from utils.exceptions import JiraMCPError
 from utils.mcp_models import MCPResponse, SprintData, IssueData
 
+# orjson is optional (faster decode of large tool payloads)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 
+# Built once at import: validates a whole issue list in a single native call
+_ISSUE_LIST_ADAPTER = TypeAdapter(List[IssueData])
+
 
 def validate_mcp_response(response: Dict[str, Any]) -> Any:
     """Validate MCP JSON-RPC 2.0 response and extract data.
@@ -83,8 +92,8 @@ def validate_mcp_response(response: Dict[str, Any]) -> Any:
     # Parse JSON from text content
     text_content = mcp_response.result.content[0].text
     try:
-        data = json.loads(text_content)
-    except json.JSONDecodeError as e:
+        data = _json_loads(text_content)
+    except ValueError as e:
         # Log first 200 chars of invalid JSON for debugging
         logger.error(f"Invalid JSON in MCP response: {text_content[:200]}")
         raise JiraMCPError(f"Invalid JSON in MCP response text: {e}")
@@ -173,11 +182,74 @@ def validate_issue_data(issue_data: Dict[str, Any], strict: bool = False) -> boo
     except ValidationError as e:
         if strict:
             raise
-        else:
-            # Log warning with field-level details
-            error_details = "; ".join([
-                f"{err['loc'][0]}: {err['msg']}" for err in e.errors()
-            ])
-            logger.warning(f"Invalid issue data: {error_details}")
-            logger.debug(f"Issue data: {issue_data}")
-            return False
+        _log_invalid_issue(e, issue_data)
+        return False
+
+
+def parse_issue_data(issue_data: Dict[str, Any]) -> Optional[IssueData]:
+    """Validate issue data and return the normalized IssueData model.
+
+    Single-pass alternative to validate_issue_data() followed by manual
+    field extraction: nested status/assignee/issue_type objects are
+    flattened to names during validation.
+
+    Args:
+        issue_data: Raw issue data from MCP
+
+    Returns:
+        IssueData model, or None if invalid (a warning is logged)
+
+    Examples:
+        >>> issue = parse_issue_data({
+        ...     "key": "PROJ-123",
+        ...     "summary": "Fix login bug",
+        ...     "status": {"name": "In Progress"},
+        ...     "assignee": {"display_name": "John Doe"},
+        ...     "issue_type": {"name": "Bug"}
+        ... })
+        >>> issue.status, issue.assignee, issue.issue_type
+        ('In Progress', 'John Doe', 'Bug')
+    """
+    try:
+        return IssueData.model_validate(issue_data)
+    except ValidationError as e:
+        _log_invalid_issue(e, issue_data)
+        return None
+
+
+def parse_issue_list(issues: List[Dict[str, Any]]) -> List[IssueData]:
+    """Validate a list of issues, skipping (and logging) invalid ones.
+
+    The whole list is validated in one call; only if some issue is invalid
+    does it fall back to per-issue parse_issue_data().
+
+    Args:
+        issues: Raw issue dictionaries from MCP
+
+    Returns:
+        IssueData models for the valid issues, in input order
+
+    Examples:
+        >>> [issue.key for issue in parse_issue_list([
+        ...     {"key": "PROJ-1", "summary": "A", "status": "Done", "issue_type": {"name": "Bug"}},
+        ...     {"key": "bad"}
+        ... ])]
+        ['PROJ-1']
+    """
+    if not isinstance(issues, list):
+        logger.warning(f"Expected a list of issues, got {type(issues).__name__}")
+        return []
+
+    try:
+        return _ISSUE_LIST_ADAPTER.validate_python(issues)
+    except ValidationError:
+        return [data for data in map(parse_issue_data, issues) if data is not None]
+
+
+def _log_invalid_issue(error: ValidationError, issue_data: Dict[str, Any]) -> None:
+    """Log warning with field-level details for an invalid issue."""
+    error_details = "; ".join([
+        f"{err['loc'][0]}: {err['msg']}" for err in error.errors()
+    ])
+    logger.warning(f"Invalid issue data: {error_details}")
+    logger.debug(f"Issue data: {issue_data}")